@@ -58,10 +58,19 @@ def cmd_listings(args):
         return 0 if not results['invalid'] else 1
 
     logger.info("Syncing all listings to Amazon...")
-    results = manager.sync_listings()
+    results = manager.sync_listings(
+        force=args.force, parallel=args.parallel, bulk=args.bulk, patch=args.patch
+    )
 
-    print(f"\nSuccessful: {len(results['successful'])}")
+    print(f"\nPushed: {len(results['successful']) + len(results['failed'])}")
+    print(f"Skipped (unchanged): {len(results['skipped'])}")
+    print(f"Successful: {len(results['successful'])}")
     print(f"Failed: {len(results['failed'])}")
+    if results['latency_ms']:
+        print("Latency: " + ", ".join(f"{k} {v:.0f}ms" for k, v in results['latency_ms'].items()))
+
+    for item in results['skipped']:
+        print(f"  - {item['sku']}: {item['reason'].replace('_', ' ')}")
 
     return 0 if not results['failed'] else 1
 
@@ -98,8 +107,13 @@ def cmd_campaigns(args):
         return 0
 
     # Deploy
-    print("\nDeploying campaigns...")
-    results = manager.deploy_all_campaigns()
+    if args.reconcile:
+        print("\nReconciling campaigns...")
+        results = manager.reconcile_campaigns(archive_negatives=args.archive_negatives)
+        print(f"Created: {results['created']}, updated: {results['updated']}")
+    else:
+        print("\nDeploying campaigns...")
+        results = manager.deploy_all_campaigns(max_workers=args.workers, bulk=args.bulk)
 
     print(f"\nSuccessful: {len(results['successful'])}")
     print(f"Failed: {len(results['failed'])}")
@@ -108,8 +122,16 @@ def cmd_campaigns(args):
         print("\nCreated campaigns:")
         for success in results['successful']:
             print(f"  - {success['name']} (ID: {success['campaign_id']})")
+            for error in success.get('errors', []):
+                print(f"      Error: {error}")
 
-    return 0 if not results['failed'] else 1
+    if results['failed']:
+        print("\nFailed campaigns:")
+        for fail in results['failed']:
+            print(f"  - {fail['name']}: {fail['error']}")
+
+    partial = any(success.get('errors') for success in results['successful'])
+    return 0 if not results['failed'] and not partial else 1
 
 
 def cmd_optimize(args):
@@ -117,7 +139,16 @@ def cmd_optimize(args):
     from src.automation.bid_optimizer import BidOptimizer
 
     logger = setup_logger("optimize")
-    optimizer = BidOptimizer()
+    if args.refresh_reports:
+        from src.api.advertising_client import AdvertisingClient
+        optimizer = BidOptimizer(
+            AdvertisingClient(use_report_cache=False, use_report_store=False)
+        )
+    elif args.report_store:
+        from src.api.advertising_client import AdvertisingClient
+        optimizer = BidOptimizer(AdvertisingClient(use_report_store=True))
+    else:
+        optimizer = BidOptimizer()
 
     print(f"Running bid optimization...")
     print(f"  Lookback days: {args.lookback_days}")
@@ -159,6 +190,7 @@ def cmd_reviews(args):
     results = requester.run_review_requests(
         max_requests=args.max_requests,
         dry_run=args.dry_run,
+        max_workers=args.workers,
     )
 
     print("\n" + "=" * 50)
@@ -329,11 +361,28 @@ Examples:
     listings_parser = subparsers.add_parser('listings', help='Sync product listings')
     listings_parser.add_argument('--validate', '--validate-only', dest='validate_only',
                                  action='store_true', help='Only validate, do not sync')
+    listings_parser.add_argument('--force', action='store_true',
+                                 help='Push every listing, even if unchanged since the last sync')
+    listings_parser.add_argument('--parallel', action='store_true',
+                                 help='Submit listing updates concurrently within the Listings API rate limit')
+    listings_parser.add_argument('--bulk', action='store_true',
+                                 help='Send all changed listings in one JSON_LISTINGS_FEED')
+    listings_parser.add_argument('--patch', action='store_true',
+                                 help='Patch only attributes that differ from the live listing')
 
     # Campaigns command
     campaigns_parser = subparsers.add_parser('campaigns', help='Deploy PPC campaigns')
     campaigns_parser.add_argument('--dry-run', action='store_true',
                                   help='Validate only, do not deploy')
+    campaigns_parser.add_argument('--workers', type=int, default=1,
+                                  help='Campaigns to deploy in parallel (default: 1)')
+    campaigns_parser.add_argument('--bulk', action='store_true',
+                                  help='Create entities with bulk requests, level by level')
+    campaigns_parser.add_argument('--reconcile', action='store_true',
+                                  help='Only create, update or archive what differs from config')
+    campaigns_parser.add_argument('--archive-negatives', action='store_true',
+                                  help='With --reconcile, also archive campaign negatives not in '
+                                       'config (including ones the bid optimizer added)')
 
     # Optimize command
     optimize_parser = subparsers.add_parser('optimize', help='Run bid optimization')
@@ -341,6 +390,11 @@ Examples:
                                  help='Preview changes without applying')
     optimize_parser.add_argument('--lookback-days', type=int, default=7,
                                  help='Days of data to analyze (default: 7)')
+    optimize_parser.add_argument('--refresh-reports', action='store_true',
+                                 help='Ignore cached reports and fetch fresh data')
+    optimize_parser.add_argument('--report-store', action='store_true',
+                                 help='Keep reports in a local daily store and fetch only '
+                                      'missing and recent days')
 
     # Reviews command
     reviews_parser = subparsers.add_parser('reviews', help='Request reviews')
@@ -348,6 +402,8 @@ Examples:
                                 help='Find orders but do not request reviews')
     reviews_parser.add_argument('--max-requests', type=int, default=None,
                                 help='Maximum number of requests to send')
+    reviews_parser.add_argument('--workers', type=int, default=None,
+                                help='Send requests in parallel, paced by the Solicitations rate limit')
 
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate all configurations')
@@ -8,5 +8,12 @@ This package contains modules for interacting with:
 
 from .sp_api_client import SPAPIClient
 from .advertising_client import AdvertisingClient
+from .async_advertising_client import AsyncAdvertisingClient
+from .http_transport import PooledTransport
 
-__all__ = ["SPAPIClient", "AdvertisingClient"]
+__all__ = [
+    "SPAPIClient",
+    "AdvertisingClient",
+    "AsyncAdvertisingClient",
+    "PooledTransport",
+]
@@ -10,13 +10,108 @@ Handles authentication and requests to Amazon Advertising API for:
 """
 
 import os
-import json
 import time
+import asyncio
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-import requests
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple,
+)
 
 from ..utils.logger import LoggerMixin
+from .entity_cache import EntityCache, EntityIndex
+from .http_transport import PooledTransport, Timeout
+from .rate_limiter import AdaptiveRateLimiter, parse_retry_after
+from .report_cache import ReportCache
+from .report_scheduler import ReportScheduler
+from .report_store import DailyReportStore
+from .report_stream import iter_report_rows
+from .token_cache import TokenCache, get_token_cache
+
+if TYPE_CHECKING:
+    from .async_advertising_client import AsyncAdvertisingClient
+
+
+def _chunked(items: Sequence[Any], size: int) -> Iterator[List[Any]]:
+    """Split a sequence into lists of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+NO_RESULT_ERROR = "No result returned for item"
+
+# Item error types worth another attempt; anything else (bid out of range,
+# archived entity, ...) fails the same way every time
+TRANSIENT_ITEM_ERRORS = (
+    "THROTTL",
+    "TOO_MANY_REQUESTS",
+    "RATE_LIMIT",
+    "INTERNAL_ERROR",
+    "INTERNAL_SERVER_ERROR",
+    "SERVICE_UNAVAILABLE",
+    "TIMEOUT",
+    NO_RESULT_ERROR.upper(),
+)
+
+
+def parse_multi_status(
+    response: Dict[str, Any],
+    entity_key: str,
+    count: int,
+) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, str]]:
+    """
+    Split a v3 multi-status response into per-index successes and errors.
+
+    v3 write endpoints answer with {entity_key: {"success": [...],
+    "error": [...]}} where every entry carries the index of the item it
+    refers to in the request body.
+
+    Args:
+        response: Parsed response body
+        entity_key: Top-level key, e.g. "keywords"
+        count: Number of items sent
+
+    Returns:
+        (successes by index, error messages by index)
+    """
+    body = response.get(entity_key) if isinstance(response, dict) else None
+    if not isinstance(body, dict):
+        # No multi-status body: the request as a whole succeeded
+        return {i: {} for i in range(count)}, {}
+
+    successes = {
+        entry.get("index", i): entry
+        for i, entry in enumerate(body.get("success", []))
+    }
+    errors = {
+        entry.get("index", i): str(entry.get("errors", entry))
+        for i, entry in enumerate(body.get("error", []))
+    }
+    for index in range(count):
+        if index not in successes and index not in errors:
+            errors[index] = NO_RESULT_ERROR
+    return successes, errors
+
+
+def is_transient_error(error: Any) -> bool:
+    """
+    Decide whether a failed write is worth retrying.
+
+    Args:
+        error: Exception from a whole request, or an item error message
+            from parse_multi_status
+
+    Returns:
+        True for throttling and server-side failures; False for
+        validation and other client errors
+    """
+    if isinstance(error, BaseException):
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        # Request-level failures reach here after _send's own retries; only
+        # a 4xx other than 429 means the request itself is wrong
+        return not (isinstance(status, int) and 400 <= status < 500 and status != 429)
+
+    message = str(error).upper()
+    return any(marker in message for marker in TRANSIENT_ITEM_ERRORS)
 
 
 class AdvertisingClient(LoggerMixin):
@@ -29,6 +124,32 @@ class AdvertisingClient(LoggerMixin):
     BASE_URL = "https://advertising-api.amazon.com"
     TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 
+    # Sponsored Products v3 write endpoints accept up to 1000 entities per call
+    MAX_ENTITIES_PER_REQUEST = 1000
+
+    KEYWORD_REPORT_METRICS = [
+        "impressions", "clicks", "cost", "purchases1d",
+        "sales1d", "campaignId", "adGroupId", "targetId",
+    ]
+    SEARCH_TERM_REPORT_METRICS = [
+        "impressions", "clicks", "cost", "purchases1d",
+        "sales1d", "query", "campaignId", "adGroupId",
+    ]
+
+    # maxResults for v3 list requests
+    LIST_PAGE_SIZE = 1000
+
+    # v3 create endpoint per entity type (also the request/response body key)
+    ENTITY_ENDPOINTS = {
+        "campaigns": "/sp/campaigns",
+        "adGroups": "/sp/adGroups",
+        "productAds": "/sp/productAds",
+        "keywords": "/sp/keywords",
+        "targetingClauses": "/sp/targets",
+        "campaignNegativeKeywords": "/sp/campaignNegativeKeywords",
+        "negativeKeywords": "/sp/negativeKeywords",
+    }
+
     def __init__(
         self,
         client_id: Optional[str] = None,
@@ -36,6 +157,20 @@ class AdvertisingClient(LoggerMixin):
         refresh_token: Optional[str] = None,
         profile_id: Optional[str] = None,
         region: str = "na",
+        pool_size: int = 20,
+        timeout: Optional[Timeout] = None,
+        keep_alive: bool = True,
+        compression: bool = True,
+        transport: Optional[PooledTransport] = None,
+        max_concurrency: int = 10,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        max_retries: int = 5,
+        report_cache: Optional[ReportCache] = None,
+        use_report_cache: bool = True,
+        report_store: Optional[DailyReportStore] = None,
+        use_report_store: bool = False,
+        entity_cache: Optional[EntityCache] = None,
+        token_cache: Optional[TokenCache] = None,
     ):
         """
         Initialize the Advertising API client.
@@ -46,6 +181,26 @@ class AdvertisingClient(LoggerMixin):
             refresh_token: OAuth refresh token
             profile_id: Advertising profile ID
             region: API region (na, eu, fe)
+            pool_size: Maximum pooled keep-alive connections per host
+            timeout: Default (connect, read) timeout in seconds
+            keep_alive: Reuse connections between requests
+            compression: Request gzip/deflate compressed responses
+            transport: Pre-built transport to share between clients
+            max_concurrency: Maximum in-flight calls for run_concurrently
+            rate_limiter: Limiter to share between clients
+            max_retries: Retries for throttled (429) responses, and for
+                5xx responses to idempotent requests
+            report_cache: Cache for downloaded report rows
+            use_report_cache: Serve repeated report requests from disk
+            report_store: Daily-partitioned store for optimization reports
+                (passing one enables it)
+            use_report_store: Keep optimization reports in a daily store,
+                download only missing and recent days, and aggregate the
+                lookback window locally (opt-in; rows are then fully
+                aggregated before being yielded)
+            entity_cache: Cache for full entity listings (5 minute TTL)
+            token_cache: LWA token cache (defaults to the process-wide
+                cache, which is also persisted for later processes)
         """
         self.client_id = client_id or os.getenv("AMAZON_ADS_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("AMAZON_ADS_CLIENT_SECRET")
@@ -53,8 +208,33 @@ class AdvertisingClient(LoggerMixin):
         self.profile_id = profile_id or os.getenv("AMAZON_ADS_PROFILE_ID")
         self.region = region
 
-        self._access_token = None
-        self._token_expires_at = None
+        self.token_cache = token_cache or get_token_cache()
+
+        # One pooled session per client so every call reuses connections
+        self._transport = transport or PooledTransport(
+            pool_maxsize=pool_size,
+            timeout=timeout,
+            keep_alive=keep_alive,
+            compression=compression,
+        )
+
+        self.max_concurrency = max_concurrency
+        self._async_client: Optional["AsyncAdvertisingClient"] = None
+
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.max_retries = max_retries
+
+        if use_report_cache:
+            self.report_cache = report_cache or ReportCache()
+        else:
+            self.report_cache = None
+
+        if report_store is not None or use_report_store:
+            self.report_store = report_store or DailyReportStore(profile_id=self.profile_id)
+        else:
+            self.report_store = None
+
+        self.entity_cache = entity_cache or EntityCache()
 
         # Set base URL based on region
         if region == "eu":
@@ -69,13 +249,13 @@ class AdvertisingClient(LoggerMixin):
         Returns:
             Valid access token
         """
-        # Return cached token if still valid
-        if self._access_token and self._token_expires_at:
-            if datetime.utcnow() < self._token_expires_at - timedelta(minutes=5):
-                return self._access_token
+        # Shared with other clients and processes using the same credentials
+        key = TokenCache.make_key(self.client_id, self.refresh_token)
+        return self.token_cache.get_token(key, self._fetch_access_token)["access_token"]
 
-        # Request new token
-        response = requests.post(
+    def _fetch_access_token(self) -> Dict[str, Any]:
+        """Exchange the refresh token for a new access token."""
+        response = self._transport.post(
             self.TOKEN_URL,
             data={
                 "grant_type": "refresh_token",
@@ -85,14 +265,60 @@ class AdvertisingClient(LoggerMixin):
             },
         )
         response.raise_for_status()
-        data = response.json()
+        return response.json()
 
-        self._access_token = data["access_token"]
-        self._token_expires_at = datetime.utcnow() + timedelta(
-            seconds=data.get("expires_in", 3600)
-        )
+    def connection_stats(self) -> Dict[str, int]:
+        """Get connection pool counters (requests, opened, reused)."""
+        return self._transport.stats()
+
+    def close(self):
+        """Close pooled HTTP connections and the async worker pool."""
+        if self._async_client is not None:
+            self._async_client.close()
+        self._transport.close()
+
+    # ==================== Concurrent Execution ====================
+
+    @property
+    def async_client(self) -> "AsyncAdvertisingClient":
+        """Async view of this client sharing its token cache and transport."""
+        if self._async_client is None:
+            from .async_advertising_client import AsyncAdvertisingClient
+
+            self._async_client = AsyncAdvertisingClient(
+                client=self,
+                max_concurrency=self.max_concurrency,
+            )
+        return self._async_client
+
+    def run_concurrently(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run independent client calls concurrently from synchronous code.
+
+        Must not be called from inside a running event loop; await
+        async_client.gather() there instead. Calls made from one of the
+        async client's workers fan out on a separate pool.
+
+        Args:
+            calls: Sequence of (method name, kwargs) tuples
+            return_exceptions: Return exceptions in the result list instead
+                of raising the first one
 
-        return self._access_token
+        Returns:
+            Results in the same order as calls
+        """
+        if not calls:
+            return []
+        client = self.async_client
+        if client.in_worker():
+            client = client.nested
+        return asyncio.run(
+            client.gather(calls, return_exceptions=return_exceptions)
+        )
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests."""
@@ -125,16 +351,15 @@ class AdvertisingClient(LoggerMixin):
         Returns:
             API response data
         """
-        url = f"{self.BASE_URL}{endpoint}"
         headers = self._get_headers()
 
         if content_type:
             headers["Content-Type"] = content_type
             headers["Accept"] = content_type
 
-        response = requests.request(
-            method=method,
-            url=url,
+        response = self._send(
+            method,
+            endpoint,
             headers=headers,
             json=data,
             params=params,
@@ -146,10 +371,79 @@ class AdvertisingClient(LoggerMixin):
             )
             response.raise_for_status()
 
+        if method != "GET":
+            # Writes make cached listings of that entity type stale
+            for entity_type, path in self.ENTITY_ENDPOINTS.items():
+                if endpoint == path:
+                    self.entity_cache.invalidate(entity_type)
+
         if response.text:
             return response.json()
         return {}
 
+    @staticmethod
+    def _is_idempotent(method: str, endpoint: str) -> bool:
+        """
+        Check whether repeating a request cannot create duplicates.
+
+        Reads (GET and the v3 "/list" POSTs) and PUT/DELETE are safe to
+        repeat; other POSTs create entities or reports, and a 5xx may
+        arrive after the server already committed the write.
+        """
+        method = method.upper()
+        if method == "POST":
+            return endpoint.endswith("/list")
+        return method in ("GET", "HEAD", "PUT", "DELETE")
+
+    def _send(self, method: str, endpoint: str, **kwargs: Any):
+        """
+        Send a rate-limited request, retrying throttled and 5xx responses.
+
+        Waits on the endpoint family's token bucket before each attempt.
+        429s are always retried; 5xx responses only for idempotent
+        requests (see _is_idempotent), so creates are never duplicated.
+        Retries wait for Retry-After (when given) or an exponential
+        backoff with jitter; 429s also lower the family's rate until
+        healthy responses bring it back up.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            **kwargs: Passed through to the transport
+
+        Returns:
+            The final HTTP response (may still be an error response)
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        family = self.rate_limiter.endpoint_family(endpoint)
+        retry_server_errors = self._is_idempotent(method, endpoint)
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(family)
+            response = self._transport.request(method=method, url=url, **kwargs)
+
+            status = response.status_code
+            if status != 429 and (status < 500 or not retry_server_errors):
+                if status < 400:
+                    self.rate_limiter.on_success(family)
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if status == 429:
+                self.rate_limiter.on_throttle(family, retry_after)
+
+            if attempt == self.max_retries:
+                break
+
+            delay = self.rate_limiter.backoff_delay(attempt, retry_after)
+            self.logger.warning(
+                f"{method} {endpoint} returned {status}; "
+                f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+        return response
+
     # ==================== Profile Operations ====================
 
     def get_profiles(self) -> List[Dict[str, Any]]:
@@ -159,10 +453,7 @@ class AdvertisingClient(LoggerMixin):
             "Amazon-Advertising-API-ClientId": self.client_id,
         }
 
-        response = requests.get(
-            f"{self.BASE_URL}/v2/profiles",
-            headers=headers,
-        )
+        response = self._send("GET", "/v2/profiles", headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -193,24 +484,16 @@ class AdvertisingClient(LoggerMixin):
         Returns:
             Created campaign data
         """
-        if start_date is None:
-            start_date = datetime.utcnow().strftime("%Y%m%d")
-
         campaign_data = {
             "campaigns": [
-                {
-                    "name": name,
-                    "targetingType": targeting_type.upper(),
-                    "state": state,
-                    "dynamicBidding": {
-                        "strategy": bidding_strategy.upper()
-                    },
-                    "budget": {
-                        "budgetType": "DAILY",
-                        "budget": daily_budget,
-                    },
-                    "startDate": start_date,
-                }
+                self.campaign_item(
+                    name=name,
+                    targeting_type=targeting_type,
+                    daily_budget=daily_budget,
+                    start_date=start_date,
+                    state=state,
+                    bidding_strategy=bidding_strategy,
+                )
             ]
         }
 
@@ -221,6 +504,33 @@ class AdvertisingClient(LoggerMixin):
             data=campaign_data,
         )
 
+    @staticmethod
+    def campaign_item(
+        name: str,
+        targeting_type: str = "auto",
+        daily_budget: float = 10.0,
+        start_date: Optional[str] = None,
+        state: str = "enabled",
+        bidding_strategy: str = "legacyForSales",
+    ) -> Dict[str, Any]:
+        """Build the v3 request body entry for one campaign."""
+        if start_date is None:
+            start_date = datetime.utcnow().strftime("%Y%m%d")
+
+        return {
+            "name": name,
+            "targetingType": targeting_type.upper(),
+            "state": state,
+            "dynamicBidding": {
+                "strategy": bidding_strategy.upper()
+            },
+            "budget": {
+                "budgetType": "DAILY",
+                "budget": daily_budget,
+            },
+            "startDate": start_date,
+        }
+
     def get_campaigns(
         self,
         state_filter: Optional[str] = None,
@@ -236,22 +546,28 @@ class AdvertisingClient(LoggerMixin):
         Returns:
             List of campaigns
         """
-        params = {"maxResults": 100}
-
+        filters: Dict[str, Any] = {}
         if state_filter:
-            params["stateFilter"] = state_filter
+            filters["stateFilter"] = {"include": [state_filter]}
+        if name_filter:
+            filters["nameFilter"] = {"queryTermMatchType": "BROAD_MATCH", "include": [name_filter]}
 
-        response = self._make_request(
-            "POST",
-            "/sp/campaigns/list",
-            data={
-                "maxResults": 100,
-                "stateFilter": {"include": [state_filter]} if state_filter else None,
-                "nameFilter": {"queryTermMatchType": "BROAD_MATCH", "include": [name_filter]} if name_filter else None,
-            },
-        )
+        return self.list_entities("campaigns", filters)
 
-        return response.get("campaigns", [])
+    def find_campaign(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a campaign by exact name.
+
+        Served from the entity cache, so checking many names costs a
+        single paged sweep of all campaigns.
+
+        Args:
+            name: Campaign name
+
+        Returns:
+            Campaign data, or None if no campaign has that name
+        """
+        return self.get_entity_index("campaigns").find(name)
 
     def update_campaign(
         self,
@@ -306,12 +622,7 @@ class AdvertisingClient(LoggerMixin):
         """
         ad_group_data = {
             "adGroups": [
-                {
-                    "campaignId": campaign_id,
-                    "name": name,
-                    "defaultBid": default_bid,
-                    "state": state,
-                }
+                self.ad_group_item(campaign_id, name, default_bid, state)
             ]
         }
 
@@ -322,18 +633,28 @@ class AdvertisingClient(LoggerMixin):
             data=ad_group_data,
         )
 
+    @staticmethod
+    def ad_group_item(
+        campaign_id: str,
+        name: str,
+        default_bid: float = 0.75,
+        state: str = "enabled",
+    ) -> Dict[str, Any]:
+        """Build the v3 request body entry for one ad group."""
+        return {
+            "campaignId": campaign_id,
+            "name": name,
+            "defaultBid": default_bid,
+            "state": state,
+        }
+
     def get_ad_groups(self, campaign_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get ad groups, optionally filtered by campaign."""
-        filter_data = {"maxResults": 100}
+        filters: Dict[str, Any] = {}
         if campaign_id:
-            filter_data["campaignIdFilter"] = {"include": [campaign_id]}
+            filters["campaignIdFilter"] = {"include": [campaign_id]}
 
-        response = self._make_request(
-            "POST",
-            "/sp/adGroups/list",
-            data=filter_data,
-        )
-        return response.get("adGroups", [])
+        return self.list_entities("adGroups", filters)
 
     # ==================== Product Ad Operations ====================
 
@@ -360,13 +681,7 @@ class AdvertisingClient(LoggerMixin):
         """
         ad_data = {
             "productAds": [
-                {
-                    "campaignId": campaign_id,
-                    "adGroupId": ad_group_id,
-                    "sku": sku,
-                    "asin": asin,
-                    "state": state,
-                }
+                self.product_ad_item(campaign_id, ad_group_id, sku, asin, state)
             ]
         }
 
@@ -377,6 +692,23 @@ class AdvertisingClient(LoggerMixin):
             data=ad_data,
         )
 
+    @staticmethod
+    def product_ad_item(
+        campaign_id: str,
+        ad_group_id: str,
+        sku: str,
+        asin: str,
+        state: str = "enabled",
+    ) -> Dict[str, Any]:
+        """Build the v3 request body entry for one product ad."""
+        return {
+            "campaignId": campaign_id,
+            "adGroupId": ad_group_id,
+            "sku": sku,
+            "asin": asin,
+            "state": state,
+        }
+
     # ==================== Keyword Operations ====================
 
     def create_keywords(
@@ -398,14 +730,7 @@ class AdvertisingClient(LoggerMixin):
         """
         keyword_data = {
             "keywords": [
-                {
-                    "campaignId": campaign_id,
-                    "adGroupId": ad_group_id,
-                    "keywordText": kw["text"],
-                    "matchType": kw["match_type"].upper(),
-                    "bid": kw.get("bid", 0.75),
-                    "state": "enabled",
-                }
+                self.keyword_item(campaign_id, ad_group_id, kw)
                 for kw in keywords
             ]
         }
@@ -417,25 +742,36 @@ class AdvertisingClient(LoggerMixin):
             data=keyword_data,
         )
 
+    @staticmethod
+    def keyword_item(
+        campaign_id: str,
+        ad_group_id: str,
+        keyword: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build the v3 request body entry for one keyword config."""
+        return {
+            "campaignId": campaign_id,
+            "adGroupId": ad_group_id,
+            "keywordText": keyword["text"],
+            "matchType": keyword["match_type"].upper(),
+            "bid": keyword.get("bid", 0.75),
+            "state": "enabled",
+        }
+
     def get_keywords(
         self,
         campaign_id: Optional[str] = None,
         ad_group_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Get keywords with optional filters."""
-        filter_data = {"maxResults": 1000}
+        filters: Dict[str, Any] = {}
 
         if campaign_id:
-            filter_data["campaignIdFilter"] = {"include": [campaign_id]}
+            filters["campaignIdFilter"] = {"include": [campaign_id]}
         if ad_group_id:
-            filter_data["adGroupIdFilter"] = {"include": [ad_group_id]}
+            filters["adGroupIdFilter"] = {"include": [ad_group_id]}
 
-        response = self._make_request(
-            "POST",
-            "/sp/keywords/list",
-            data=filter_data,
-        )
-        return response.get("keywords", [])
+        return self.list_entities("keywords", filters)
 
     def update_keyword(
         self,
@@ -470,16 +806,85 @@ class AdvertisingClient(LoggerMixin):
     def batch_update_keywords(
         self,
         updates: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        max_retries: int = 2,
     ) -> Dict[str, Any]:
         """
         Batch update multiple keywords.
 
+        Updates are split into API-sized chunks that are sent concurrently
+        under the rate limiter. Multi-status responses are merged into a
+        per-keyword outcome, and only items that failed transiently
+        (throttling, server errors) are retried; validation errors such as
+        an out-of-range bid fail immediately.
+
         Args:
             updates: List of update dicts with keywordId, bid, state
+            chunk_size: Keywords per request (defaults to the API limit)
+            max_retries: Extra rounds for transiently failed items
 
         Returns:
-            Batch update response
+            Dict with "results" (keywordId -> status/error), "successful"
+            keyword IDs, "failed" items with errors, and "requests" sent
         """
+        chunk_size = chunk_size or self.MAX_ENTITIES_PER_REQUEST
+        outcomes: Dict[str, Dict[str, Any]] = {}
+        pending = list(updates)
+        requests_sent = 0
+
+        for attempt in range(max_retries + 1):
+            if not pending:
+                break
+            if attempt:
+                self.logger.info(f"Retrying {len(pending)} failed keyword updates")
+
+            chunks = list(_chunked(pending, chunk_size))
+            responses = self.run_concurrently(
+                [("_put_keywords", {"updates": chunk}) for chunk in chunks],
+                return_exceptions=True,
+            )
+            requests_sent += len(chunks)
+
+            pending = []
+            for chunk, response in zip(chunks, responses):
+                if isinstance(response, Exception):
+                    errors = {i: str(response) for i in range(len(chunk))}
+                    retryable = {i: is_transient_error(response) for i in errors}
+                else:
+                    _, errors = parse_multi_status(response, "keywords", len(chunk))
+                    retryable = {i: is_transient_error(message) for i, message in errors.items()}
+
+                for index, update in enumerate(chunk):
+                    keyword_id = str(update["keywordId"])
+                    if index in errors:
+                        outcomes[keyword_id] = {"status": "failed", "error": errors[index]}
+                        if retryable[index]:
+                            pending.append(update)
+                    else:
+                        outcomes[keyword_id] = {"status": "success"}
+
+        failed = [
+            {"keyword_id": keyword_id, "error": outcome["error"]}
+            for keyword_id, outcome in outcomes.items()
+            if outcome["status"] == "failed"
+        ]
+        self.logger.info(
+            f"Keyword batch update: {len(outcomes) - len(failed)} successful, "
+            f"{len(failed)} failed ({requests_sent} requests)"
+        )
+
+        return {
+            "results": outcomes,
+            "successful": [
+                keyword_id for keyword_id, outcome in outcomes.items()
+                if outcome["status"] == "success"
+            ],
+            "failed": failed,
+            "requests": requests_sent,
+        }
+
+    def _put_keywords(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Send one keyword update request."""
         return self._make_request(
             "PUT",
             "/sp/keywords",
@@ -507,36 +912,196 @@ class AdvertisingClient(LoggerMixin):
         Returns:
             Created negative keywords data
         """
-        if level == "campaign":
-            endpoint = "/sp/campaignNegativeKeywords"
-            neg_data = {
-                "campaignNegativeKeywords": [
-                    {
-                        "campaignId": campaign_id,
-                        "keywordText": kw["text"],
-                        "matchType": kw["match_type"].replace("negative_", "").upper(),
-                        "state": "enabled",
-                    }
-                    for kw in keywords
-                ]
-            }
-        else:
-            endpoint = "/sp/negativeKeywords"
-            neg_data = {
-                "negativeKeywords": [
-                    {
-                        "campaignId": campaign_id,
-                        "adGroupId": ad_group_id,
-                        "keywordText": kw["text"],
-                        "matchType": kw["match_type"].replace("negative_", "").upper(),
-                        "state": "enabled",
-                    }
-                    for kw in keywords
-                ]
-            }
+        entity_key = "campaignNegativeKeywords" if level == "campaign" else "negativeKeywords"
+        items = [
+            self.negative_keyword_item(
+                campaign_id,
+                ad_group_id if level != "campaign" else None,
+                kw,
+            )
+            for kw in keywords
+        ]
 
         self.logger.info(f"Creating {len(keywords)} negative keywords at {level} level")
-        return self._make_request("POST", endpoint, data=neg_data)
+        return self.create_entities(entity_key, items)
+
+    @staticmethod
+    def negative_keyword_item(
+        campaign_id: str,
+        ad_group_id: Optional[str],
+        keyword: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Build the v3 request body entry for one negative keyword.
+
+        Campaign-level negatives (no ad group) go under
+        "campaignNegativeKeywords", ad group negatives under
+        "negativeKeywords".
+        """
+        item = {"campaignId": campaign_id}
+        if ad_group_id:
+            item["adGroupId"] = ad_group_id
+        item.update({
+            "keywordText": keyword["text"],
+            "matchType": keyword["match_type"].replace("negative_", "").upper(),
+            "state": "enabled",
+        })
+        return item
+
+    def create_entities(
+        self,
+        entity_type: str,
+        items: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Create many entities of one type in as few requests as possible.
+
+        Args:
+            entity_type: Key from ENTITY_ENDPOINTS, e.g. "adGroups"
+            items: Request body entries (see the *_item builders)
+
+        Returns:
+            Multi-status response {entity_type: {"success": [...],
+            "error": [...]}} whose indexes refer to `items`
+        """
+        return self._write_in_chunks(
+            "POST", self.ENTITY_ENDPOINTS[entity_type], entity_type, items
+        )
+
+    def update_entities(
+        self,
+        entity_type: str,
+        items: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Update (or archive, with state "archived") many entities of one type.
+
+        Args:
+            entity_type: Key from ENTITY_ENDPOINTS, e.g. "keywords"
+            items: Partial entities carrying their ID field
+
+        Returns:
+            Multi-status response whose indexes refer to `items`
+        """
+        return self._write_in_chunks(
+            "PUT", self.ENTITY_ENDPOINTS[entity_type], entity_type, items
+        )
+
+    def iter_entities(
+        self,
+        entity_type: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all entities of one type, fetching pages on demand.
+
+        Follows nextToken until the listing is exhausted; the next page
+        is only requested once the current one has been consumed.
+
+        Args:
+            entity_type: Key from ENTITY_ENDPOINTS, e.g. "adGroups"
+            filters: v3 list filters, e.g. {"stateFilter": {...}}
+            page_size: maxResults per page (defaults to LIST_PAGE_SIZE)
+
+        Yields:
+            Entities in listing order
+        """
+        body: Dict[str, Any] = {
+            "maxResults": page_size or self.LIST_PAGE_SIZE,
+            **(filters or {}),
+        }
+
+        while True:
+            response = self._make_request(
+                "POST",
+                f"{self.ENTITY_ENDPOINTS[entity_type]}/list",
+                data=body,
+            )
+            yield from response.get(entity_type, [])
+            next_token = response.get("nextToken")
+            if not next_token:
+                return
+            body = {**body, "nextToken": next_token}
+
+    def list_entities(
+        self,
+        entity_type: str,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """List all entities of one type across every page."""
+        return list(self.iter_entities(entity_type, filters, page_size))
+
+    def get_entity_index(
+        self,
+        entity_type: str,
+        refresh: bool = False,
+    ) -> EntityIndex:
+        """
+        Get every entity of a type indexed by ID (and name, if it has one).
+
+        The first call sweeps all pages; later calls reuse the cached
+        index until it expires or the client writes to that entity type.
+
+        Args:
+            entity_type: Key from ENTITY_ENDPOINTS, e.g. "campaigns"
+            refresh: Ignore any cached listing
+
+        Returns:
+            EntityIndex with by_id / by_name lookups
+        """
+        index = None if refresh else self.entity_cache.get(entity_type)
+        if index is None:
+            index = self.entity_cache.put(entity_type, self.iter_entities(entity_type))
+            self.logger.debug(f"Indexed {len(index)} {entity_type}")
+        return index
+
+    def _write_in_chunks(
+        self,
+        method: str,
+        endpoint: str,
+        entity_key: str,
+        items: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Create or update entities in API-sized chunks.
+
+        A chunk whose request fails outright is recorded as one error per
+        item in that chunk, so the results of other chunks are kept.
+
+        Args:
+            method: POST to create, PUT to update
+            endpoint: v3 entity endpoint
+            entity_key: Request/response body key, e.g. "negativeKeywords"
+            items: Entities to write
+
+        Returns:
+            Merged multi-status response whose indexes refer to `items`
+        """
+        merged: Dict[str, List[Dict[str, Any]]] = {"success": [], "error": []}
+        size = self.MAX_ENTITIES_PER_REQUEST
+
+        for offset in range(0, len(items), size):
+            chunk = items[offset:offset + size]
+            try:
+                response = self._make_request(method, endpoint, data={entity_key: chunk})
+            except Exception as e:
+                self.logger.error(
+                    f"{method} {endpoint} failed for items {offset}-{offset + len(chunk) - 1}: {e}"
+                )
+                merged["error"].extend(
+                    {"index": offset + index, "errors": str(e)} for index in range(len(chunk))
+                )
+                continue
+            successes, errors = parse_multi_status(response, entity_key, len(chunk))
+
+            for index, entry in sorted(successes.items()):
+                merged["success"].append({**entry, "index": offset + index})
+            for index, message in sorted(errors.items()):
+                merged["error"].append({"index": offset + index, "errors": message})
+
+        return {entity_key: merged}
 
     # ==================== Targeting Operations (Auto Campaigns) ====================
 
@@ -559,14 +1124,7 @@ class AdvertisingClient(LoggerMixin):
         """
         targeting_data = {
             "targetingClauses": [
-                {
-                    "campaignId": campaign_id,
-                    "adGroupId": ad_group_id,
-                    "expression": [{"type": tg["type"]}],
-                    "expressionType": "auto",
-                    "bid": tg.get("bid", 0.75),
-                    "state": "enabled",
-                }
+                self.auto_target_item(campaign_id, ad_group_id, tg)
                 for tg in targeting_groups
             ]
         }
@@ -577,6 +1135,22 @@ class AdvertisingClient(LoggerMixin):
             data=targeting_data,
         )
 
+    @staticmethod
+    def auto_target_item(
+        campaign_id: str,
+        ad_group_id: str,
+        targeting_group: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build the v3 request body entry for one auto targeting group."""
+        return {
+            "campaignId": campaign_id,
+            "adGroupId": ad_group_id,
+            "expression": [{"type": targeting_group["type"]}],
+            "expressionType": "auto",
+            "bid": targeting_group.get("bid", 0.75),
+            "state": "enabled",
+        }
+
     # ==================== Reporting Operations ====================
 
     def request_report(
@@ -619,8 +1193,9 @@ class AdvertisingClient(LoggerMixin):
         headers["Content-Type"] = "application/json"
         headers["Accept"] = "application/json"
 
-        response = requests.post(
-            f"{self.BASE_URL}/v2/sp/{report_type}/report",
+        response = self._send(
+            "POST",
+            f"/v2/sp/{report_type}/report",
             headers=headers,
             json=report_data,
         )
@@ -633,62 +1208,216 @@ class AdvertisingClient(LoggerMixin):
         headers["Content-Type"] = "application/json"
         headers["Accept"] = "application/json"
 
-        response = requests.get(
-            f"{self.BASE_URL}/v2/reports/{report_id}",
-            headers=headers,
-        )
+        response = self._send("GET", f"/v2/reports/{report_id}", headers=headers)
         response.raise_for_status()
         return response.json()
 
     def download_report(self, report_url: str) -> List[Dict[str, Any]]:
         """Download and parse a completed report."""
-        import gzip
-        import io
+        return list(self.iter_report_rows(report_url))
 
-        response = requests.get(report_url)
-        response.raise_for_status()
+    def iter_report_rows(
+        self,
+        report_url: str,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a completed report, yielding rows as they are downloaded.
 
-        # Reports are gzipped JSON
-        with gzip.GzipFile(fileobj=io.BytesIO(response.content)) as f:
-            return json.loads(f.read().decode("utf-8"))
+        The gzipped body is decompressed and parsed chunk by chunk, so
+        memory stays bounded regardless of report size. The download
+        starts on the first next() call.
 
-    def get_keyword_performance(
+        Args:
+            report_url: Report location from get_report_status
+            chunk_size: Bytes read from the socket at a time
+
+        Yields:
+            Report rows
+        """
+        response = self._transport.get(report_url, stream=True)
+        try:
+            response.raise_for_status()
+            yield from iter_report_rows(response.iter_content(chunk_size=chunk_size))
+        finally:
+            response.close()
+
+    def iter_reports(
+        self,
+        reports: Dict[str, Dict[str, Any]],
+        stream: bool = False,
+        use_cache: bool = True,
+    ) -> Iterator[Tuple[str, Iterable[Dict[str, Any]]]]:
+        """
+        Request several reports at once and yield each as soon as it is ready.
+
+        Args:
+            reports: Report name -> request_report keyword arguments
+            stream: Yield lazy row iterators instead of fully loaded lists;
+                each iterator must be consumed before advancing
+            use_cache: Read and write the report cache, if configured
+
+        Yields:
+            (name, rows) tuples in completion order; cached reports
+            come first and are never re-requested
+        """
+        scheduler = ReportScheduler(self)
+        cached = {}
+        keys = {}
+        for name, spec in reports.items():
+            if use_cache and self.report_cache is not None:
+                keys[name] = ReportCache.make_key(self.profile_id, **spec)
+                rows = self.report_cache.get(keys[name])
+                if rows is not None:
+                    cached[name] = rows
+                    continue
+            scheduler.add(name, **spec)
+        return self._iter_cached_reports(cached, keys, scheduler, stream)
+
+    def _iter_cached_reports(
+        self,
+        cached: Dict[str, Iterator[Dict[str, Any]]],
+        keys: Dict[str, str],
+        scheduler: ReportScheduler,
+        stream: bool,
+    ) -> Iterator[Tuple[str, Iterable[Dict[str, Any]]]]:
+        """Yield cache hits, then fetched reports written through the cache."""
+        for name, rows in cached.items():
+            yield name, rows if stream else list(rows)
+
+        for name, rows in scheduler.iter_ready(stream=stream):
+            if name in keys:
+                rows = self.report_cache.write_through(keys[name], rows)
+                if not stream:
+                    rows = list(rows)
+            yield name, rows
+
+    def _report_window(self, lookback_days: int) -> Tuple[str, str]:
+        """Get (start_date, end_date) for a lookback ending yesterday."""
+        end_date = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+        start_date = (datetime.utcnow() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+        return start_date, end_date
+
+    def _optimization_report_specs(
+        self,
+        lookback_days: int,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Build request specs for the keyword and search term reports."""
+        start_date, end_date = self._report_window(lookback_days)
+        return {
+            "keywords": {
+                "report_type": "spTargeting",
+                "metrics": self.KEYWORD_REPORT_METRICS,
+                "start_date": start_date,
+                "end_date": end_date,
+            },
+            "search_terms": {
+                "report_type": "spSearchTerm",
+                "metrics": self.SEARCH_TERM_REPORT_METRICS,
+                "start_date": start_date,
+                "end_date": end_date,
+            },
+        }
+
+    def iter_optimization_reports(
         self,
         lookback_days: int = 7,
-    ) -> List[Dict[str, Any]]:
+        stream: bool = False,
+    ) -> Iterator[Tuple[str, Iterable[Dict[str, Any]]]]:
         """
-        Get keyword performance metrics.
+        Fetch the keyword and search term reports concurrently.
 
         Args:
             lookback_days: Number of days to look back
+            stream: Yield lazy row iterators instead of lists
+
+        Yields:
+            ("keywords" | "search_terms", rows) in completion order, or
+            aggregated from the daily store when one is configured
+        """
+        specs = self._optimization_report_specs(lookback_days)
+        if self.report_store is not None:
+            return (
+                (name, iter(rows) if stream else rows)
+                for name, rows in self._stored_reports(specs, lookback_days).items()
+            )
+        return self.iter_reports(specs, stream=stream)
+
+    def _stored_reports(
+        self,
+        specs: Dict[str, Dict[str, Any]],
+        lookback_days: int,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Bring the daily store up to date and aggregate the window.
+
+        Days missing from the store, plus the store's trailing
+        restatement window, are requested as one single-day report per
+        report type and day, all submitted together. Days older than the
+        window and the store's retention are then pruned.
+
+        Args:
+            specs: Report name -> request_report keyword arguments
+            lookback_days: Number of days to look back
 
         Returns:
-            List of keyword performance data
+            Report name -> rows aggregated over the window
         """
-        end_date = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
-        start_date = (datetime.utcnow() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+        days = DailyReportStore.window_days(lookback_days)
+
+        daily_specs = {}
+        targets = {}
+        for name, spec in specs.items():
+            report_type, metrics = spec["report_type"], spec.get("metrics")
+            for day in self.report_store.days_to_fetch(report_type, days, metrics):
+                key = f"{name}/{day}"
+                daily_specs[key] = {**spec, "start_date": day, "end_date": day}
+                targets[key] = (report_type, day, metrics)
+
+        if daily_specs:
+            self.logger.info(
+                f"Downloading {len(daily_specs)} missing or recent report days "
+                f"({len(days)}-day window)"
+            )
+        # The store is the persistent copy, so skip the report cache
+        for key, rows in self.iter_reports(daily_specs, stream=True, use_cache=False):
+            report_type, day, metrics = targets[key]
+            self.report_store.write_day(report_type, day, rows, metrics=metrics)
 
-        # Request targeting report
-        report_id = self.request_report(
-            report_type="spTargeting",
-            metrics=[
-                "impressions", "clicks", "cost", "purchases1d",
-                "sales1d", "campaignId", "adGroupId", "targetId",
-            ],
-            start_date=start_date,
-            end_date=end_date,
+        keep_days = DailyReportStore.window_days(
+            max(lookback_days, self.report_store.retention_days)
         )
+        for spec in specs.values():
+            removed = self.report_store.prune(
+                spec["report_type"], keep_days, metrics=spec.get("metrics"),
+            )
+            if removed:
+                self.logger.info(f"Pruned {removed} old {spec['report_type']} report days")
+
+        return {
+            name: self.report_store.aggregate(
+                spec["report_type"], days, metrics=spec.get("metrics"),
+            )
+            for name, spec in specs.items()
+        }
+
+    def get_keyword_performance(
+        self,
+        lookback_days: int = 7,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get keyword performance metrics.
 
-        # Poll for completion
-        for _ in range(30):
-            status = self.get_report_status(report_id)
-            if status["status"] == "SUCCESS":
-                return self.download_report(status["location"])
-            elif status["status"] == "FAILURE":
-                raise Exception(f"Report failed: {status}")
-            time.sleep(10)
+        Args:
+            lookback_days: Number of days to look back
 
-        raise Exception("Report timed out")
+        Returns:
+            List of keyword performance data
+        """
+        spec = self._optimization_report_specs(lookback_days)["keywords"]
+        if self.report_store is not None:
+            return self._stored_reports({"keywords": spec}, lookback_days)["keywords"]
+        return dict(self.iter_reports({"keywords": spec}))["keywords"]
 
     def get_search_term_report(
         self,
@@ -703,26 +1432,7 @@ class AdvertisingClient(LoggerMixin):
         Returns:
             List of search term data
         """
-        end_date = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
-        start_date = (datetime.utcnow() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
-
-        report_id = self.request_report(
-            report_type="spSearchTerm",
-            metrics=[
-                "impressions", "clicks", "cost", "purchases1d",
-                "sales1d", "query", "campaignId", "adGroupId",
-            ],
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        # Poll for completion
-        for _ in range(30):
-            status = self.get_report_status(report_id)
-            if status["status"] == "SUCCESS":
-                return self.download_report(status["location"])
-            elif status["status"] == "FAILURE":
-                raise Exception(f"Report failed: {status}")
-            time.sleep(10)
-
-        raise Exception("Report timed out")
+        spec = self._optimization_report_specs(lookback_days)["search_terms"]
+        if self.report_store is not None:
+            return self._stored_reports({"search_terms": spec}, lookback_days)["search_terms"]
+        return dict(self.iter_reports({"search_terms": spec}))["search_terms"]
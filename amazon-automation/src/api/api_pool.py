@@ -0,0 +1,70 @@
+"""
+API Instance Pool Module
+
+Reuses SP-API API objects (ListingsItems, Orders, Solicitations, ...)
+instead of building one per call. Each instance is checked out by one
+thread at a time, since the library keeps per-request state on it, and
+new instances are only built when every existing one is busy.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+
+class APIInstancePool:
+    """Lazily created, thread-safe pool of API instances per API class."""
+
+    def __init__(self, factory: Callable[[type], Any]):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Builds a new instance of the given API class
+        """
+        self._factory = factory
+        self._idle: Dict[type, List[Any]] = {}
+        self._created: Dict[str, int] = {}
+        self._checkouts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def checkout(self, api_class: type) -> Iterator[Any]:
+        """
+        Borrow an instance of an API class for the duration of a block.
+
+        Args:
+            api_class: SP-API class, e.g. Orders
+
+        Yields:
+            An instance no other thread is using
+        """
+        name = api_class.__name__
+        with self._lock:
+            idle = self._idle.setdefault(api_class, [])
+            instance = idle.pop() if idle else None
+            if instance is not None:
+                self._checkouts[name] = self._checkouts.get(name, 0) + 1
+
+        if instance is None:
+            instance = self._factory(api_class)
+            with self._lock:
+                self._created[name] = self._created.get(name, 0) + 1
+                self._checkouts[name] = self._checkouts.get(name, 0) + 1
+
+        try:
+            yield instance
+        finally:
+            with self._lock:
+                self._idle[api_class].append(instance)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get instances "created" and checkouts "reused" per API class."""
+        with self._lock:
+            return {
+                name: {
+                    "created": self._created.get(name, 0),
+                    "reused": checkouts - self._created.get(name, 0),
+                }
+                for name, checkouts in self._checkouts.items()
+            }
@@ -0,0 +1,263 @@
+"""
+Async Amazon Advertising API Client
+
+Coroutine wrapper around AdvertisingClient for fanning out many
+independent API calls with bounded concurrency. Calls run on a thread
+pool over the wrapped client's pooled transport, so the async and sync
+clients share one token cache and one set of keep-alive connections.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..utils.logger import LoggerMixin
+from .advertising_client import AdvertisingClient
+
+
+# A deferred client call: (method name, keyword arguments)
+Call = Tuple[str, Dict[str, Any]]
+
+
+class AsyncAdvertisingClient(LoggerMixin):
+    """
+    Asyncio client for Amazon Advertising API operations.
+
+    Exposes the campaign, ad group, keyword, negative keyword, targeting
+    and reporting methods of AdvertisingClient as coroutines. At most
+    max_concurrency calls are in flight at once.
+    """
+
+    def __init__(
+        self,
+        client: Optional[AdvertisingClient] = None,
+        max_concurrency: int = 10,
+        **client_kwargs: Any,
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            client: Sync client to wrap (shares its token cache and transport)
+            max_concurrency: Maximum number of concurrent in-flight calls
+            **client_kwargs: Used to build an AdvertisingClient if none is given
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client or AdvertisingClient(**client_kwargs)
+        self.max_concurrency = max_concurrency
+
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="ads-api",
+            initializer=self._mark_worker,
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._nested: Optional["AsyncAdvertisingClient"] = None
+        self._nested_lock = threading.Lock()
+
+    def _mark_worker(self):
+        """Flag a worker thread as belonging to this client's pool."""
+        self._local.worker = True
+
+    def in_worker(self) -> bool:
+        """Check whether the current thread is one of this client's workers."""
+        return getattr(self._local, "worker", False)
+
+    @property
+    def nested(self) -> "AsyncAdvertisingClient":
+        """
+        Client with its own worker pool for fan-out started from a worker.
+
+        A sync method run on a worker that fans out again (e.g.
+        batch_update_keywords) would otherwise wait on jobs queued behind
+        itself and deadlock once every worker is busy.
+        """
+        with self._nested_lock:
+            if self._nested is None:
+                self._nested = AsyncAdvertisingClient(
+                    client=self.client,
+                    max_concurrency=self.max_concurrency,
+                )
+            return self._nested
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a sync client method on the worker pool under the semaphore."""
+        func = functools.partial(getattr(self.client, method_name), *args, **kwargs)
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func)
+
+    async def gather(
+        self,
+        calls: Sequence[Call],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run many client calls concurrently.
+
+        Args:
+            calls: Sequence of (method name, kwargs) tuples
+            return_exceptions: Return exceptions in the result list instead
+                of raising the first one
+
+        Returns:
+            Results in the same order as calls
+        """
+        return await asyncio.gather(
+            *(self._call(name, **kwargs) for name, kwargs in calls),
+            return_exceptions=return_exceptions,
+        )
+
+    def close(self):
+        """Shut down the worker pool."""
+        self._executor.shutdown(wait=True)
+        if self._nested is not None:
+            self._nested.close()
+
+    # ==================== Profile Operations ====================
+
+    async def get_profiles(self) -> List[Dict[str, Any]]:
+        """Get all advertising profiles."""
+        return await self._call("get_profiles")
+
+    # ==================== Campaign Operations ====================
+
+    async def create_campaign(self, name: str, **kwargs: Any) -> Dict[str, Any]:
+        """Create a new Sponsored Products campaign."""
+        return await self._call("create_campaign", name, **kwargs)
+
+    async def get_campaigns(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Get all campaigns with optional filters."""
+        return await self._call("get_campaigns", **kwargs)
+
+    async def update_campaign(self, campaign_id: str, **kwargs: Any) -> Dict[str, Any]:
+        """Update a campaign."""
+        return await self._call("update_campaign", campaign_id, **kwargs)
+
+    # ==================== Ad Group Operations ====================
+
+    async def create_ad_group(
+        self,
+        campaign_id: str,
+        name: str,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create an ad group within a campaign."""
+        return await self._call("create_ad_group", campaign_id, name, **kwargs)
+
+    async def get_ad_groups(
+        self,
+        campaign_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get ad groups, optionally filtered by campaign."""
+        return await self._call("get_ad_groups", campaign_id)
+
+    # ==================== Product Ad Operations ====================
+
+    async def create_product_ad(
+        self,
+        campaign_id: str,
+        ad_group_id: str,
+        sku: str,
+        asin: str,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a product ad within an ad group."""
+        return await self._call(
+            "create_product_ad", campaign_id, ad_group_id, sku, asin, **kwargs
+        )
+
+    # ==================== Keyword Operations ====================
+
+    async def create_keywords(
+        self,
+        campaign_id: str,
+        ad_group_id: str,
+        keywords: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Create keywords for an ad group."""
+        return await self._call("create_keywords", campaign_id, ad_group_id, keywords)
+
+    async def get_keywords(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Get keywords with optional filters."""
+        return await self._call("get_keywords", **kwargs)
+
+    async def update_keyword(self, keyword_id: str, **kwargs: Any) -> Dict[str, Any]:
+        """Update a keyword bid or state."""
+        return await self._call("update_keyword", keyword_id, **kwargs)
+
+    async def batch_update_keywords(
+        self,
+        updates: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Batch update multiple keywords."""
+        return await self._call("batch_update_keywords", updates)
+
+    # ==================== Negative Keyword Operations ====================
+
+    async def create_negative_keywords(
+        self,
+        campaign_id: str,
+        ad_group_id: Optional[str],
+        keywords: List[Dict[str, Any]],
+        level: str = "campaign",
+    ) -> Dict[str, Any]:
+        """Create negative keywords."""
+        return await self._call(
+            "create_negative_keywords", campaign_id, ad_group_id, keywords, level=level
+        )
+
+    # ==================== Targeting Operations (Auto Campaigns) ====================
+
+    async def create_auto_targeting(
+        self,
+        campaign_id: str,
+        ad_group_id: str,
+        targeting_groups: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Create auto targeting groups for an auto campaign."""
+        return await self._call(
+            "create_auto_targeting", campaign_id, ad_group_id, targeting_groups
+        )
+
+    # ==================== Reporting Operations ====================
+
+    async def request_report(self, **kwargs: Any) -> str:
+        """Request a performance report."""
+        return await self._call("request_report", **kwargs)
+
+    async def get_report_status(self, report_id: str) -> Dict[str, Any]:
+        """Check status of a report request."""
+        return await self._call("get_report_status", report_id)
+
+    async def download_report(self, report_url: str) -> List[Dict[str, Any]]:
+        """Download and parse a completed report."""
+        return await self._call("download_report", report_url)
+
+    async def get_keyword_performance(
+        self,
+        lookback_days: int = 7,
+    ) -> List[Dict[str, Any]]:
+        """Get keyword performance metrics."""
+        return await self._call("get_keyword_performance", lookback_days=lookback_days)
+
+    async def get_search_term_report(
+        self,
+        lookback_days: int = 7,
+    ) -> List[Dict[str, Any]]:
+        """Get search term report for negative keyword analysis."""
+        return await self._call("get_search_term_report", lookback_days=lookback_days)
@@ -0,0 +1,130 @@
+"""
+Entity Cache Module
+
+Short-lived in-process cache of Advertising API entity listings with ID
+and name indexes, so repeated lookups (e.g. "does this campaign exist?")
+cost one paged sweep instead of one list call each.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class EntityIndex:
+    """One entity type's listing indexed by ID and by name."""
+
+    def __init__(
+        self,
+        entities: Iterable[Dict[str, Any]],
+        id_field: str,
+        name_field: Optional[str] = None,
+    ):
+        """
+        Build the indexes.
+
+        Args:
+            entities: Entities from a full listing
+            id_field: ID key, e.g. "campaignId"
+            name_field: Name key, e.g. "name" (None if not unique-ish)
+        """
+        self.entities: List[Dict[str, Any]] = list(entities)
+        self.by_id: Dict[str, Dict[str, Any]] = {
+            str(entity[id_field]): entity
+            for entity in self.entities
+            if entity.get(id_field) is not None
+        }
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        if name_field:
+            for entity in self.entities:
+                # First entity wins when names repeat
+                self.by_name.setdefault(entity.get(name_field), entity)
+
+    def get(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Look up an entity by ID."""
+        return self.by_id.get(str(entity_id))
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up an entity by exact name."""
+        return self.by_name.get(name)
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+
+class EntityCache:
+    """
+    Thread-safe TTL cache of EntityIndex objects per entity type.
+
+    Entries expire after ttl seconds and are dropped whenever the client
+    writes to that entity type.
+    """
+
+    # (ID field, name field) per entity type
+    FIELDS = {
+        "campaigns": ("campaignId", "name"),
+        "adGroups": ("adGroupId", "name"),
+        "productAds": ("adId", None),
+        "keywords": ("keywordId", None),
+        "targetingClauses": ("targetId", None),
+        "campaignNegativeKeywords": ("keywordId", None),
+        "negativeKeywords": ("keywordId", None),
+    }
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a listing stays valid
+            clock: Monotonic clock function
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[str, Tuple[float, EntityIndex]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, entity_type: str) -> Optional[EntityIndex]:
+        """Get a fresh index for an entity type, or None."""
+        with self._lock:
+            entry = self._entries.get(entity_type)
+            if entry is None:
+                return None
+            expires_at, index = entry
+            if self._clock() >= expires_at:
+                del self._entries[entity_type]
+                return None
+            return index
+
+    def put(
+        self,
+        entity_type: str,
+        entities: Iterable[Dict[str, Any]],
+    ) -> EntityIndex:
+        """
+        Index and store a full listing.
+
+        Args:
+            entity_type: Entity type, e.g. "campaigns"
+            entities: All entities of that type
+
+        Returns:
+            The new index
+        """
+        id_field, name_field = self.FIELDS[entity_type]
+        index = EntityIndex(entities, id_field, name_field)
+        with self._lock:
+            self._entries[entity_type] = (self._clock() + self.ttl, index)
+        return index
+
+    def invalidate(self, entity_type: Optional[str] = None):
+        """Drop one entity type, or everything when None."""
+        with self._lock:
+            if entity_type is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(entity_type, None)
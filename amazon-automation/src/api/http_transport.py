@@ -0,0 +1,175 @@
+"""
+HTTP Transport Module
+
+Connection-pooled, keep-alive HTTP transport shared by the API clients.
+Each transport owns one requests.Session so TCP/TLS connections are
+reused across calls instead of being re-established per request.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ..utils.logger import LoggerMixin
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class _Counter:
+    """Thread-safe integer counter."""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def increment(self, amount: int = 1):
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        with self._lock:
+            return self._value
+
+
+def _counting_pool_class(base, counter: _Counter):
+    """Build a urllib3 pool class that counts every socket it connects."""
+
+    class CountingConnection(base.ConnectionCls):
+        def connect(self):
+            counter.increment()
+            return super().connect()
+
+    class CountingPool(base):
+        ConnectionCls = CountingConnection
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report new connections."""
+
+    def __init__(self, counter: _Counter, **kwargs):
+        self._counter = counter
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._counter),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._counter),
+        }
+
+
+class PooledTransport(LoggerMixin):
+    """
+    Keep-alive HTTP transport with connection pooling.
+
+    Wraps a requests.Session mounted with a pooled adapter, applies
+    default timeouts and response compression, and tracks how many
+    connections were opened versus reused.
+    """
+
+    DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 60.0)
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        timeout: Optional[Timeout] = None,
+        keep_alive: bool = True,
+        compression: bool = True,
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum connections kept alive per host
+            timeout: Default (connect, read) timeout in seconds
+            keep_alive: Keep connections open between requests
+            compression: Ask servers for gzip/deflate compressed responses
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self.keep_alive = keep_alive
+        self.compression = compression
+
+        self._connections = _Counter()
+        self._requests = _Counter()
+
+        self.session = requests.Session()
+        adapter = _CountingAdapter(
+            self._connections,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.session.headers["Accept-Encoding"] = (
+            "gzip, deflate" if compression else "identity"
+        )
+        self.session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            The HTTP response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        self._requests.increment()
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request."""
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get connection usage counters.
+
+        Returns:
+            Dict with requests sent, connections opened and connections reused
+        """
+        requests_sent = self._requests.value
+        opened = self._connections.value
+        return {
+            "requests": requests_sent,
+            "connections_opened": opened,
+            "connections_reused": max(requests_sent - opened, 0),
+        }
+
+    def close(self):
+        """Close all pooled connections."""
+        stats = self.stats()
+        self.logger.debug(
+            f"Closing transport: {stats['requests']} requests, "
+            f"{stats['connections_opened']} connections opened, "
+            f"{stats['connections_reused']} reused"
+        )
+        self.session.close()
+
+    def __enter__(self) -> "PooledTransport":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
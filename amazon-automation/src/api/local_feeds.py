@@ -0,0 +1,154 @@
+"""
+Local Feeds Endpoint Module
+
+In-process stand-in for the SP-API Feeds API, so the JSON_LISTINGS_FEED
+bulk path can run offline (tests, dry runs). It exposes the same methods
+SPAPIClient calls on the library's Feeds client and answers with a
+JSON_LISTINGS_FEED processing report built from basic message checks.
+
+Only the Feeds API is replaced: SPAPIClient's listing put/patch/get calls
+still go to the live Listings Items API. Results from this endpoint say
+nothing about what Amazon holds, so callers must not record them as pushed.
+"""
+
+import itertools
+import json
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sp_api.base import ApiResponse
+
+
+class LocalFeedsEndpoint:
+    """
+    Fake Feeds API that accepts JSON listings feeds and processes them locally.
+
+    Feeds report IN_QUEUE/IN_PROGRESS for `polls_until_done` status polls,
+    then DONE with a processing report. Messages for `reject_skus` get an
+    ERROR issue, as Amazon would for invalid content.
+    """
+
+    OPERATION_TYPES = ("UPDATE", "PARTIAL_UPDATE", "PATCH", "DELETE")
+
+    # Marks results as not coming from Amazon (see SPAPIClient.uses_local_feeds)
+    local = True
+
+    def __init__(
+        self,
+        polls_until_done: int = 1,
+        reject_skus: Iterable[str] = (),
+    ):
+        """
+        Initialize the endpoint.
+
+        Args:
+            polls_until_done: get_feed calls before a feed is DONE
+            reject_skus: SKUs whose messages are rejected
+        """
+        self.polls_until_done = polls_until_done
+        self.reject_skus = set(reject_skus)
+        self.feeds: Dict[str, Dict[str, Any]] = {}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit_feed(
+        self,
+        feed_type: str,
+        file,
+        content_type: str = "application/json",
+        **kwargs: Any,
+    ) -> Tuple[ApiResponse, ApiResponse]:
+        """Store an uploaded feed document and create a feed for it."""
+        raw = file.read()
+        document = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+
+        with self._lock:
+            number = next(self._ids)
+            document_id = f"local-doc-{number}"
+            feed_id = f"local-feed-{number}"
+            self.documents[document_id] = document
+            self.feeds[feed_id] = {
+                "feedId": feed_id,
+                "feedType": feed_type,
+                "marketplaceIds": kwargs.get("marketplaceIds", []),
+                "inputFeedDocumentId": document_id,
+                "processingStatus": "IN_QUEUE",
+                "polls": 0,
+            }
+
+        return (
+            ApiResponse(payload={"feedDocumentId": document_id}),
+            ApiResponse(payload={"feedId": feed_id}),
+        )
+
+    def get_feed(self, feedId: str, **kwargs: Any) -> ApiResponse:
+        """Report feed status, finishing processing after enough polls."""
+        with self._lock:
+            feed = self.feeds[feedId]
+            feed["polls"] += 1
+            if feed["processingStatus"] != "DONE":
+                if feed["polls"] >= self.polls_until_done:
+                    report_id = f"{feed['inputFeedDocumentId']}-report"
+                    self.documents[report_id] = self._process(
+                        self.documents[feed["inputFeedDocumentId"]]
+                    )
+                    feed["processingStatus"] = "DONE"
+                    feed["resultFeedDocumentId"] = report_id
+                else:
+                    feed["processingStatus"] = "IN_PROGRESS"
+
+            payload = {k: v for k, v in feed.items() if k != "polls"}
+        return ApiResponse(payload=payload)
+
+    def get_feed_result_document(self, feedDocumentId: str, **kwargs: Any) -> str:
+        """Download a processing report."""
+        with self._lock:
+            return json.dumps(self.documents[feedDocumentId])
+
+    def _process(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a processing report for a JSON listings feed document."""
+        messages = document.get("messages", [])
+        issues: List[Dict[str, Any]] = []
+
+        for message in messages:
+            error = self._check(message)
+            if error:
+                issues.append({
+                    "messageId": message.get("messageId"),
+                    "code": "4000001",
+                    "severity": "ERROR",
+                    "message": error,
+                })
+
+        invalid = len({issue["messageId"] for issue in issues})
+        return {
+            "header": {
+                "sellerId": document.get("header", {}).get("sellerId"),
+                "version": "2.0",
+                "feedId": None,
+            },
+            "issues": issues,
+            "summary": {
+                "errors": len(issues),
+                "warnings": 0,
+                "messagesProcessed": len(messages),
+                "messagesAccepted": len(messages) - invalid,
+                "messagesInvalid": invalid,
+            },
+        }
+
+    def _check(self, message: Dict[str, Any]) -> Optional[str]:
+        """Return why a message would be rejected, or None."""
+        if not message.get("sku"):
+            return "Message is missing a SKU"
+        if message.get("operationType") not in self.OPERATION_TYPES:
+            return f"Unsupported operationType: {message.get('operationType')}"
+        if message["operationType"] == "UPDATE":
+            if not message.get("productType"):
+                return "UPDATE requires a productType"
+            if not isinstance(message.get("attributes"), dict):
+                return "UPDATE requires attributes"
+        if message["sku"] in self.reject_skus:
+            return f"Listing content for {message['sku']} was rejected"
+        return None
@@ -0,0 +1,166 @@
+"""
+Order Store Module
+
+Local copy of recent SP-API orders plus the LastUpdatedAfter watermark of
+the last sync, so each run only fetches orders that changed since the
+previous one while still seeing every order in the eligibility window.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..utils.logger import LoggerMixin
+
+
+def parse_amazon_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an SP-API ISO 8601 timestamp to a naive UTC datetime.
+
+    Args:
+        value: Timestamp such as "2024-01-05T08:00:00Z"
+
+    Returns:
+        Naive UTC datetime, or None if missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class OrderStore(LoggerMixin):
+    """
+    JSON file of orders keyed by AmazonOrderId, with a sync watermark.
+
+    The file lives at <store_dir>/<marketplace_id>.json and holds
+    {"watermark", "since", "orders": {order_id: order}}, where "since" is
+    the earliest purchase date the store is complete from.
+    """
+
+    def __init__(
+        self,
+        store_dir: Optional[str] = None,
+        marketplace_id: Optional[str] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            store_dir: Directory for store files. Defaults to ORDER_STORE_DIR
+                or .cache/orders in the project directory.
+            marketplace_id: Marketplace the orders belong to
+        """
+        if store_dir is None:
+            store_dir = os.getenv("ORDER_STORE_DIR") or str(
+                Path(__file__).parent.parent.parent / ".cache" / "orders"
+            )
+        self.path = Path(store_dir) / f"{marketplace_id or 'default'}.json"
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Store contents, loaded from disk on first access."""
+        if self._data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except FileNotFoundError:
+                self._data = self._empty()
+            except ValueError as e:
+                self.logger.warning(f"Discarding unreadable order store {self.path}: {e}")
+                self._data = self._empty()
+        return self._data
+
+    @staticmethod
+    def _empty() -> Dict[str, Any]:
+        return {"watermark": None, "since": None, "orders": {}}
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """LastUpdatedAfter to use for the next sync, or None before the first."""
+        return parse_amazon_datetime(self.data.get("watermark"))
+
+    @property
+    def since(self) -> Optional[datetime]:
+        """Earliest purchase date covered by a full sync, or None."""
+        return parse_amazon_datetime(self.data.get("since"))
+
+    def orders(self) -> List[Dict[str, Any]]:
+        """Get all stored orders."""
+        return list(self.data["orders"].values())
+
+    def upsert(self, orders: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert new orders and replace changed ones.
+
+        Args:
+            orders: Orders from the Orders API
+
+        Returns:
+            Number of orders written
+        """
+        stored = self.data["orders"]
+        count = 0
+        for order in orders:
+            order_id = order.get("AmazonOrderId")
+            if order_id:
+                stored[order_id] = order
+                count += 1
+        return count
+
+    def prune(self, purchased_before: datetime) -> int:
+        """
+        Drop orders purchased before a cutoff.
+
+        Args:
+            purchased_before: Naive UTC cutoff
+
+        Returns:
+            Number of orders removed
+        """
+        stored = self.data["orders"]
+        stale = [
+            order_id
+            for order_id, order in stored.items()
+            if (parse_amazon_datetime(order.get("PurchaseDate")) or purchased_before) < purchased_before
+        ]
+        for order_id in stale:
+            del stored[order_id]
+        return len(stale)
+
+    def save(
+        self,
+        watermark: Optional[datetime] = None,
+        since: Optional[datetime] = None,
+    ):
+        """
+        Atomically write the store, optionally advancing the watermark.
+
+        Args:
+            watermark: Naive UTC LastUpdatedAfter for the next sync
+            since: Naive UTC purchase date a full sync started from
+        """
+        if watermark is not None:
+            self.data["watermark"] = watermark.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if since is not None:
+            self.data["since"] = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
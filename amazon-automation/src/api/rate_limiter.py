@@ -0,0 +1,259 @@
+"""
+Rate Limiter Module
+
+Token-bucket rate limiting for Amazon API clients:
+- TokenBucket paces callers to a rate with a burst allowance
+- AdaptiveRateLimiter keeps one bucket per endpoint family, backs off on
+  throttling (honouring Retry-After) and recovers toward the ceiling
+  while responses are healthy
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from ..utils.logger import LoggerMixin
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `burst`.
+    Callers reserve tokens and sleep outside the lock until their
+    reservation is due, so concurrent callers are spaced evenly.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (starts full)
+            clock: Monotonic clock function
+            sleep: Sleep function
+        """
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate and burst must be positive")
+
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens earned since the last refill."""
+        if now > self._last:
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = max(self._last - now, 0.0)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, keeping tokens already earned."""
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = max(float(rate), 1e-6)
+
+    def pause_for(self, seconds: float):
+        """Stop handing out tokens for the given number of seconds."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._last = max(self._last, now + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value in delta-seconds or HTTP-date form
+
+    Returns:
+        Seconds to wait, or None if missing or unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class AdaptiveRateLimiter(LoggerMixin):
+    """
+    Per-endpoint-family rate limiter with additive-increase /
+    multiplicative-decrease adjustment.
+
+    Each family starts at its configured ceiling. A throttled response
+    cuts that family's rate and pauses it for Retry-After (if given);
+    every healthy response nudges the rate back toward the ceiling.
+    """
+
+    # (requests per second, burst) per endpoint family
+    DEFAULT_LIMITS: Dict[str, Tuple[float, float]] = {
+        "campaigns": (10.0, 20.0),
+        "keywords": (10.0, 20.0),
+        "reports": (2.0, 5.0),
+        "profiles": (2.0, 5.0),
+    }
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        min_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        increase_fraction: float = 0.1,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: Override (rate, burst) per family
+            min_rate: Lowest rate a family can be cut to
+            decrease_factor: Rate multiplier applied on throttling
+            increase_fraction: Fraction of the ceiling regained per success
+            backoff_base: First retry delay in seconds without Retry-After
+            backoff_cap: Maximum retry delay in seconds
+            clock: Monotonic clock function
+            sleep: Sleep function
+        """
+        self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase_fraction = increase_fraction
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._clock = clock
+        self._sleep = sleep
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_family(endpoint: str) -> str:
+        """
+        Map an API endpoint path to its rate-limit family.
+
+        Args:
+            endpoint: Endpoint path, e.g. /sp/keywords
+
+        Returns:
+            One of campaigns, keywords, reports, profiles
+        """
+        path = endpoint.lower()
+        if path.startswith("/v2/profiles"):
+            return "profiles"
+        if "report" in path:
+            return "reports"
+        if "keywords" in path or "targets" in path:
+            return "keywords"
+        return "campaigns"
+
+    def _bucket(self, family: str) -> TokenBucket:
+        """Get or create the bucket for a family."""
+        with self._lock:
+            bucket = self._buckets.get(family)
+            if bucket is None:
+                rate, burst = self.limits.get(family, self.limits["campaigns"])
+                bucket = TokenBucket(rate, burst, clock=self._clock, sleep=self._sleep)
+                self._buckets[family] = bucket
+            return bucket
+
+    def acquire(self, family: str) -> float:
+        """Wait for permission to send one request in a family."""
+        return self._bucket(family).acquire()
+
+    def current_rate(self, family: str) -> float:
+        """Get the current requests-per-second for a family."""
+        return self._bucket(family).rate
+
+    def on_success(self, family: str):
+        """Raise a family's rate back toward its ceiling."""
+        bucket = self._bucket(family)
+        ceiling = self.limits.get(family, self.limits["campaigns"])[0]
+        if bucket.rate < ceiling:
+            bucket.set_rate(min(ceiling, bucket.rate + ceiling * self.increase_fraction))
+
+    def on_throttle(self, family: str, retry_after: Optional[float] = None):
+        """
+        Slow a family down after a throttled response.
+
+        Args:
+            family: Endpoint family
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        bucket = self._bucket(family)
+        new_rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+        bucket.set_rate(new_rate)
+        if retry_after:
+            bucket.pause_for(retry_after)
+        self.logger.warning(
+            f"Throttled on {family}: rate now {new_rate:.2f} req/s"
+            + (f", pausing {retry_after:.1f}s" if retry_after else "")
+        )
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute how long to wait before retrying.
+
+        Args:
+            attempt: Zero-based retry attempt number
+            retry_after: Server-provided delay, used as-is when present
+
+        Returns:
+            Delay in seconds (exponential with jitter when no Retry-After)
+        """
+        if retry_after is not None:
+            return min(retry_after, self.backoff_cap)
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
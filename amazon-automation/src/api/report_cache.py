@@ -0,0 +1,199 @@
+"""
+Report Cache Module
+
+Persistent on-disk cache for Advertising API report rows so repeated
+runs over the same report (e.g. a dry run followed by a live run) skip
+report generation entirely. Entries are gzipped JSON Lines files keyed
+by profile, report type, date range and metric set, with a TTL and a
+total size budget enforced by least-recently-used eviction.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..utils.logger import LoggerMixin
+
+
+class ReportCache(LoggerMixin):
+    """
+    Disk cache of downloaded report rows.
+
+    Entries expire ttl_seconds after being written. When the cache grows
+    past max_bytes the least recently read entries are removed first.
+    """
+
+    SUFFIX = ".jsonl.gz"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: float = 6 * 3600,
+        max_bytes: int = 500 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files. Defaults to REPORT_CACHE_DIR
+                or .cache/reports in the project directory.
+            ttl_seconds: Seconds an entry stays valid after being written
+            max_bytes: Total size budget for all entries
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv("REPORT_CACHE_DIR") or str(
+                Path(__file__).parent.parent.parent / ".cache" / "reports"
+            )
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(
+        profile_id: Optional[str],
+        report_type: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        metrics: Optional[List[str]] = None,
+    ) -> str:
+        """
+        Build the cache key for a report request.
+
+        Metric order does not matter.
+
+        Returns:
+            Hex digest identifying the report
+        """
+        identity = {
+            "profile_id": profile_id,
+            "report_type": report_type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "metrics": sorted(metrics) if metrics else None,
+        }
+        return hashlib.sha256(
+            json.dumps(identity, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def _is_fresh(self, path: Path) -> bool:
+        return time.time() - path.stat().st_mtime < self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Iterator[Dict[str, Any]]]:
+        """
+        Look up a report.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Iterator over the cached rows, or None on a miss or expiry
+        """
+        path = self._path(key)
+        try:
+            if not self._is_fresh(path):
+                path.unlink()
+                return None
+            # Record the read in atime (mtime keeps the write time for TTL)
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        except FileNotFoundError:
+            return None
+
+        self.logger.info(f"Report cache hit: {key[:12]}")
+        return self._read(path)
+
+    @staticmethod
+    def _read(path: Path) -> Iterator[Dict[str, Any]]:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def write_through(
+        self,
+        key: str,
+        rows: Iterable[Dict[str, Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield rows while writing them to the cache.
+
+        The entry is only committed once the rows are fully consumed; if
+        iteration stops early or fails, nothing is cached.
+
+        Args:
+            key: Key from make_key
+            rows: Rows to pass through and store
+
+        Yields:
+            The same rows
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        committed = False
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                for row in rows:
+                    f.write(json.dumps(row, separators=(",", ":")).encode("utf-8"))
+                    f.write(b"\n")
+                    yield row
+            os.replace(tmp_name, self._path(key))
+            committed = True
+        finally:
+            if not committed:
+                Path(tmp_name).unlink(missing_ok=True)
+
+        self.evict()
+
+    def put(self, key: str, rows: Iterable[Dict[str, Any]]):
+        """Store rows under a key."""
+        for _ in self.write_through(key, rows):
+            pass
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently used entries until the
+        cache fits in max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        removed = 0
+        entries = []
+        now = time.time()
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime >= self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_atime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            self.logger.debug(f"Evicted {removed} cached reports")
+        return removed
+
+    def clear(self):
+        """Remove every cached report."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+                path.unlink(missing_ok=True)
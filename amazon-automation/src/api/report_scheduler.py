@@ -0,0 +1,162 @@
+"""
+Report Scheduler Module
+
+Submits several Advertising API reports up front and polls them with a
+single shared poller, so report generation runs in parallel on Amazon's
+side instead of one report waiting for another.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.logger import LoggerMixin
+
+
+class ReportScheduler(LoggerMixin):
+    """
+    Requests and polls multiple reports together.
+
+    All reports are requested at once; pending reports are then polled
+    concurrently with per-report exponential backoff (short first, then
+    capped) and each dataset is yielded as soon as it is ready.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        initial_delay: float = 2.0,
+        backoff_factor: float = 1.5,
+        max_delay: float = 30.0,
+        timeout: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            client: AdvertisingClient used to request, poll and download
+            initial_delay: Seconds before the first status check
+            backoff_factor: Multiplier applied to the delay after each check
+            max_delay: Longest delay between checks of one report
+            timeout: Seconds to wait for all reports before giving up
+            clock: Monotonic clock function
+            sleep: Sleep function
+        """
+        self.client = client
+        self.initial_delay = initial_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._clock = clock
+        self._sleep = sleep
+
+        self._specs: Dict[str, Dict[str, Any]] = {}
+
+    def add(
+        self,
+        name: str,
+        report_type: str,
+        metrics: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> "ReportScheduler":
+        """
+        Queue a report to be requested.
+
+        Args:
+            name: Key the dataset is returned under
+            report_type: Report type (spCampaigns, spTargeting, spSearchTerm)
+            metrics: List of metrics to include
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            The scheduler, for chaining
+        """
+        self._specs[name] = {
+            "report_type": report_type,
+            "metrics": metrics,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        return self
+
+    def iter_ready(
+        self,
+        stream: bool = False,
+    ) -> Iterator[Tuple[str, Iterable[Dict[str, Any]]]]:
+        """
+        Request all queued reports and yield each one once downloaded.
+
+        Args:
+            stream: Yield a lazy row iterator (client.iter_report_rows)
+                instead of a downloaded list; consume it before advancing
+
+        Yields:
+            (name, rows) tuples in completion order
+
+        Raises:
+            Exception: If a report fails or the timeout is reached
+        """
+        if not self._specs:
+            return
+
+        names = list(self._specs)
+        self.logger.info(f"Requesting {len(names)} reports: {', '.join(names)}")
+        report_ids = self.client.run_concurrently(
+            [("request_report", self._specs[name]) for name in names]
+        )
+
+        now = self._clock()
+        deadline = now + self.timeout
+        pending = {
+            name: {
+                "report_id": report_id,
+                "delay": self.initial_delay,
+                "next_poll": now + self.initial_delay,
+            }
+            for name, report_id in zip(names, report_ids)
+        }
+
+        while pending:
+            now = self._clock()
+            if now >= deadline:
+                raise Exception(f"Report timed out: {', '.join(sorted(pending))}")
+
+            next_poll = min(state["next_poll"] for state in pending.values())
+            if next_poll > now:
+                self._sleep(min(next_poll, deadline) - now)
+                continue
+
+            due = [name for name, state in pending.items() if state["next_poll"] <= now]
+            statuses = self.client.run_concurrently(
+                [
+                    ("get_report_status", {"report_id": pending[name]["report_id"]})
+                    for name in due
+                ]
+            )
+
+            for name, status in zip(due, statuses):
+                if status["status"] == "SUCCESS":
+                    del pending[name]
+                    self.logger.info(f"Report ready: {name}")
+                    if stream:
+                        yield name, self.client.iter_report_rows(status["location"])
+                    else:
+                        yield name, self.client.download_report(status["location"])
+                elif status["status"] == "FAILURE":
+                    raise Exception(f"Report failed: {status}")
+                else:
+                    state = pending[name]
+                    state["delay"] = min(state["delay"] * self.backoff_factor, self.max_delay)
+                    state["next_poll"] = self._clock() + state["delay"]
+
+    def run(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Request all queued reports and wait for every dataset.
+
+        Returns:
+            Dict mapping report name to its rows
+        """
+        return dict(self.iter_ready())
@@ -0,0 +1,334 @@
+"""
+Report Store Module
+
+Daily-partitioned local store for Advertising API report data. Each
+report type keeps one compressed, column-oriented file per day, so a
+lookback window only needs the days that are not on disk yet (plus the
+last few, which Amazon still restates); the window itself is aggregated
+locally.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..utils.logger import LoggerMixin
+
+
+class DailyReportStore(LoggerMixin):
+    """
+    Stores report rows partitioned by report type, metric set and day.
+
+    Files live at
+    <store_dir>/<profile>/<report_type>/<schema>/<YYYY-MM-DD>.json.gz, where
+    <schema> identifies the requested metrics, and hold
+    {"columns": [...], "values": [[column values], ...]}.
+    """
+
+    SUFFIX = ".json.gz"
+
+    # Additive metrics summed across days; other fields keep the latest value
+    SUM_FIELDS = frozenset([
+        "impressions", "clicks", "cost",
+        "purchases1d", "purchases7d", "purchases14d", "purchases30d",
+        "sales1d", "sales7d", "sales14d", "sales30d",
+        "unitsSoldClicks1d", "unitsSoldClicks7d", "unitsSoldClicks14d",
+        "conversions", "sales",
+    ])
+
+    # Fields identifying one entity across days, per report type
+    GROUP_FIELDS: Dict[str, Tuple[str, ...]] = {
+        "spCampaigns": ("campaignId",),
+        "spTargeting": ("campaignId", "adGroupId", "targetId", "keywordId"),
+        "spSearchTerm": ("campaignId", "adGroupId", "query"),
+    }
+
+    def __init__(
+        self,
+        store_dir: Optional[str] = None,
+        profile_id: Optional[str] = None,
+        restate_days: int = 3,
+        retention_days: int = 30,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            store_dir: Root directory. Defaults to REPORT_STORE_DIR or
+                .cache/report_store in the project directory.
+            profile_id: Advertising profile the data belongs to
+            restate_days: Most recent days to download again on every run,
+                since Amazon keeps restating their attributed metrics
+            retention_days: Days kept on disk even when the current lookback
+                is shorter, so alternating windows don't re-download
+        """
+        if store_dir is None:
+            store_dir = os.getenv("REPORT_STORE_DIR") or str(
+                Path(__file__).parent.parent.parent / ".cache" / "report_store"
+            )
+        self.store_dir = Path(store_dir)
+        self.profile_id = profile_id
+        self.restate_days = restate_days
+        self.retention_days = retention_days
+
+    @staticmethod
+    def window_days(lookback_days: int, today: Optional[date] = None) -> List[str]:
+        """
+        List the days in a lookback window ending yesterday.
+
+        Args:
+            lookback_days: Number of days to look back
+            today: Reference date (defaults to the current UTC date)
+
+        Returns:
+            Dates as YYYY-MM-DD, oldest first
+        """
+        today = today or datetime.utcnow().date()
+        return [
+            (today - timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range(lookback_days, 0, -1)
+        ]
+
+    @staticmethod
+    def schema_id(metrics: Optional[Sequence[str]] = None) -> str:
+        """
+        Identify a metric set, so partitions of different specs never mix.
+
+        Args:
+            metrics: Requested report columns (order does not matter)
+
+        Returns:
+            Short hex digest
+        """
+        encoded = json.dumps(sorted(metrics or [])).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:12]
+
+    def _type_dir(self, report_type: str) -> Path:
+        return self.store_dir / str(self.profile_id or "default") / report_type
+
+    def _dir(self, report_type: str, metrics: Optional[Sequence[str]] = None) -> Path:
+        return self._type_dir(report_type) / self.schema_id(metrics)
+
+    def _path(self, report_type: str, day: str, metrics: Optional[Sequence[str]] = None) -> Path:
+        return self._dir(report_type, metrics) / f"{day}{self.SUFFIX}"
+
+    def has_day(
+        self,
+        report_type: str,
+        day: str,
+        metrics: Optional[Sequence[str]] = None,
+    ) -> bool:
+        """Check whether a day is already stored."""
+        return self._path(report_type, day, metrics).exists()
+
+    def missing_days(
+        self,
+        report_type: str,
+        days: Iterable[str],
+        metrics: Optional[Sequence[str]] = None,
+    ) -> List[str]:
+        """
+        Get the days with no stored partition.
+
+        Args:
+            report_type: Report type (spTargeting, spSearchTerm, ...)
+            days: Dates as YYYY-MM-DD
+            metrics: Requested report columns
+
+        Returns:
+            Days with no stored partition
+        """
+        return [day for day in days if not self.has_day(report_type, day, metrics)]
+
+    def days_to_fetch(
+        self,
+        report_type: str,
+        days: Iterable[str],
+        metrics: Optional[Sequence[str]] = None,
+        today: Optional[date] = None,
+    ) -> List[str]:
+        """
+        Get the days that need to be downloaded: missing ones, plus the
+        last restate_days days, whose attribution may still change.
+
+        Args:
+            report_type: Report type
+            days: Dates as YYYY-MM-DD
+            metrics: Requested report columns
+            today: Reference date (defaults to the current UTC date)
+
+        Returns:
+            Days to download, in the given order
+        """
+        today = today or datetime.utcnow().date()
+        settled_before = (today - timedelta(days=self.restate_days)).strftime("%Y-%m-%d")
+        return [
+            day for day in days
+            if day >= settled_before or not self.has_day(report_type, day, metrics)
+        ]
+
+    def write_day(
+        self,
+        report_type: str,
+        day: str,
+        rows: Iterable[Dict[str, Any]],
+        metrics: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Store one day of report rows, replacing any existing partition.
+
+        Args:
+            report_type: Report type
+            day: Date as YYYY-MM-DD
+            rows: Report rows for that day
+            metrics: Requested report columns
+
+        Returns:
+            Number of rows stored
+        """
+        columns: Dict[str, List[Any]] = {}
+        count = 0
+        for row in rows:
+            for name in row:
+                if name not in columns:
+                    # Back-fill columns first seen part way through
+                    columns[name] = [None] * count
+            for name, values in columns.items():
+                values.append(row.get(name))
+            count += 1
+
+        path = self._path(report_type, day, metrics)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {"columns": list(columns), "values": list(columns.values())},
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self.logger.debug(f"Stored {count} {report_type} rows for {day}")
+        return count
+
+    def read_day(
+        self,
+        report_type: str,
+        day: str,
+        metrics: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Read one stored day back as rows.
+
+        Args:
+            report_type: Report type
+            day: Date as YYYY-MM-DD
+            metrics: Requested report columns
+
+        Yields:
+            Report rows
+        """
+        with gzip.open(self._path(report_type, day, metrics), "rb") as f:
+            table = json.loads(f.read())
+
+        columns = table["columns"]
+        for values in zip(*table["values"]):
+            yield {
+                name: value
+                for name, value in zip(columns, values)
+                if value is not None
+            }
+
+    def aggregate(
+        self,
+        report_type: str,
+        days: Sequence[str],
+        group_by: Optional[Sequence[str]] = None,
+        metrics: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Combine stored days into one row per entity.
+
+        Additive metrics (SUM_FIELDS) are summed; other fields take the
+        value from the most recent day that has one. Missing days are
+        skipped.
+
+        Args:
+            report_type: Report type
+            days: Dates as YYYY-MM-DD
+            group_by: Fields identifying an entity (defaults per report type)
+            metrics: Requested report columns
+
+        Returns:
+            Aggregated rows
+        """
+        group_by = tuple(group_by or self.GROUP_FIELDS.get(report_type, ("campaignId", "adGroupId")))
+        totals: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+        for day in sorted(days):
+            if not self.has_day(report_type, day, metrics):
+                continue
+            for row in self.read_day(report_type, day, metrics):
+                key = tuple(row.get(field) for field in group_by)
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = dict(row)
+                    continue
+                for name, value in row.items():
+                    if name in self.SUM_FIELDS and isinstance(value, (int, float)):
+                        total[name] = total.get(name, 0) + value
+                    else:
+                        total[name] = value
+
+        return list(totals.values())
+
+    def prune(
+        self,
+        report_type: str,
+        keep_days: Iterable[str],
+        metrics: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Delete stored days outside a set of days, along with partitions of
+        other metric sets for the report type, which are never read again.
+
+        Args:
+            report_type: Report type
+            keep_days: Dates to keep
+            metrics: Requested report columns
+
+        Returns:
+            Number of partitions removed
+        """
+        keep = set(keep_days)
+        type_dir = self._type_dir(report_type)
+        if not type_dir.exists():
+            return 0
+
+        current = self._dir(report_type, metrics)
+        removed = 0
+        for entry in type_dir.iterdir():
+            if entry == current:
+                for path in entry.glob(f"*{self.SUFFIX}"):
+                    if path.name[: -len(self.SUFFIX)] not in keep:
+                        path.unlink(missing_ok=True)
+                        removed += 1
+            elif entry.is_dir():
+                removed += len(list(entry.glob(f"*{self.SUFFIX}")))
+                shutil.rmtree(entry, ignore_errors=True)
+            elif entry.name.endswith(self.SUFFIX):
+                # Partition from before metric sets were keyed
+                entry.unlink(missing_ok=True)
+                removed += 1
+        return removed
@@ -0,0 +1,148 @@
+"""
+Report Stream Module
+
+Helpers for reading large Advertising API reports with bounded memory:
+gzip bodies are decompressed chunk by chunk and the top-level JSON array
+is parsed incrementally, yielding one row at a time.
+"""
+
+import codecs
+import json
+import zlib
+from typing import Any, Iterable, Iterator
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def iter_decompressed(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Decompress a gzip byte stream on the fly.
+
+    Bodies that are not gzip (e.g. already decoded via Content-Encoding)
+    are passed through unchanged.
+
+    Args:
+        chunks: Raw body chunks
+
+    Yields:
+        Decompressed byte chunks
+    """
+    decompressor = None
+    passthrough = False
+    head = b""
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if decompressor is None and not passthrough:
+            # Need the first two bytes to recognise the gzip magic number
+            head += chunk
+            if len(head) < len(GZIP_MAGIC):
+                continue
+            chunk, head = head, b""
+            if chunk.startswith(GZIP_MAGIC):
+                # wbits=16+MAX_WBITS expects a gzip header and trailer
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            else:
+                passthrough = True
+
+        if passthrough:
+            yield chunk
+        else:
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+
+    if head:
+        yield head
+    if decompressor is not None:
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+
+def iter_text(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """Decode a byte stream to text without splitting multi-byte characters."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """
+    Incrementally parse a top-level JSON array.
+
+    Only the current element (plus one text chunk) is held in memory.
+
+    Args:
+        chunks: Text chunks making up a JSON array document
+
+    Yields:
+        Array elements in order
+
+    Raises:
+        ValueError: If the document is not an array or is truncated
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    started = False
+    finished = False
+
+    for chunk in chunks:
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+        while not finished:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Report body is not a JSON array")
+                started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == "]":
+                finished = True
+                pos += 1
+                break
+            if buffer[pos] == ",":
+                pos += 1
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element continues in the next chunk
+                break
+            if end == len(buffer) and not isinstance(item, (dict, list)):
+                # A bare scalar may be cut off mid-token; wait for more data
+                break
+
+            yield item
+            pos = end
+
+    if not finished:
+        raise ValueError("Report body ended before the JSON array was closed")
+
+
+def iter_report_rows(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Stream rows out of a (possibly gzipped) JSON array report body.
+
+    Args:
+        chunks: Raw body chunks
+
+    Yields:
+        Report rows
+    """
+    return iter_json_array(iter_text(iter_decompressed(chunks)))
@@ -2,26 +2,102 @@
 Amazon Selling Partner API (SP-API) Client
 
 Handles authentication and requests to Amazon SP-API for:
-- Listing management (Listings Items API)
+- Listing management (Listings Items API, JSON_LISTINGS_FEED bulk feeds)
 - Order retrieval
 - Review solicitation (Solicitations API)
 """
 
 import os
+import io
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from sp_api.api import (
+    Feeds,
     ListingsItems,
     Orders,
     Solicitations,
     CatalogItems,
 )
+from sp_api.auth import AccessTokenClient, AccessTokenResponse
 from sp_api.base import Marketplaces, SellingApiException
+from sp_api.base.exceptions import SellingApiRequestThrottledException
 
 from ..utils.logger import LoggerMixin
+from .api_pool import APIInstancePool
+from .local_feeds import LocalFeedsEndpoint
+from .order_store import OrderStore, parse_amazon_datetime
+from .rate_limiter import AdaptiveRateLimiter, parse_retry_after
+from .token_cache import TokenCache, get_token_cache
+
+
+class CachedAccessTokenClient(AccessTokenClient):
+    """
+    AccessTokenClient backed by the shared TokenCache, so LWA tokens are
+    reused across API instances, clients and processes.
+    """
+
+    def get_auth(self) -> AccessTokenResponse:
+        """Get a cached access token, refreshing it only when needed."""
+        key = TokenCache.make_key(self.cred.client_id, self.cred.refresh_token)
+        entry = get_token_cache().get_token(
+            key,
+            lambda: self._request(self.scheme + self.host + self.path, self.data, self.headers),
+        )
+        return AccessTokenResponse(
+            access_token=entry["access_token"],
+            token_type=entry.get("token_type"),
+            expires_in=int(entry["expires_at"] - time.time()),
+        )
+
+
+def send_review_requests(
+    request: Callable[[str], Dict[str, Any]],
+    order_ids: List[str],
+    delay_ms: int = 1000,
+    max_workers: int = 1,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Send review requests, yielding each order's result as it completes.
+
+    An unexpected exception for one order becomes that order's failed
+    result, so callers can tally every request already sent.
+
+    Args:
+        request: Sends one review request and returns its result
+        order_ids: Order IDs to request reviews for
+        delay_ms: Delay between requests in milliseconds (sequential
+            mode only)
+        max_workers: Requests in flight at once
+
+    Yields:
+        (order_id, result) in completion order (order_ids order when
+        sequential)
+    """
+    def send(order_id: str) -> Dict[str, Any]:
+        try:
+            return request(order_id)
+        except Exception as e:
+            return {"status": "failed", "order_id": order_id, "error": str(e)}
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(send, order_id): order_id for order_id in order_ids
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        return
+
+    for order_id in order_ids:
+        yield order_id, send(order_id)
+
+        # Rate limiting
+        time.sleep(delay_ms / 1000)
 
 
 class SPAPIClient(LoggerMixin):
@@ -31,6 +107,21 @@ class SPAPIClient(LoggerMixin):
     Handles listing updates, order retrieval, and review solicitations.
     """
 
+    # Published (requests per second, burst) per SP-API operation family
+    RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+        "solicitations": (1.0, 5.0),
+        "solicitation_actions": (1.0, 5.0),
+        "orders": (0.0167, 20.0),
+        "listings": (5.0, 10.0),
+        "listings_patch": (5.0, 5.0),
+        "feed_submissions": (0.0083, 15.0),
+        "feed_status": (2.0, 15.0),
+        "feed_documents": (0.0222, 10.0),
+    }
+
+    # Product type used for listing content updates
+    LISTING_PRODUCT_TYPE = "DRINKING_CUP"
+
     def __init__(
         self,
         refresh_token: Optional[str] = None,
@@ -40,6 +131,11 @@ class SPAPIClient(LoggerMixin):
         aws_secret_key: Optional[str] = None,
         role_arn: Optional[str] = None,
         marketplace: Marketplaces = Marketplaces.US,
+        order_store: Optional[OrderStore] = None,
+        use_order_store: bool = True,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        max_retries: int = 5,
+        feeds_api: Optional[Any] = None,
     ):
         """
         Initialize the SP-API client.
@@ -54,6 +150,17 @@ class SPAPIClient(LoggerMixin):
             aws_secret_key: AWS secret key
             role_arn: AWS IAM role ARN for SP-API access
             marketplace: Amazon marketplace (default: US)
+            order_store: Local order store for incremental order syncs
+            use_order_store: Sync orders incrementally instead of
+                refetching the whole window on every run
+            rate_limiter: Limiter to share between clients (defaults to
+                the published SP-API rates in RATE_LIMITS)
+            max_retries: Retries for throttled (429) responses
+            feeds_api: Stand-in for the Feeds API (defaults to a
+                LocalFeedsEndpoint when SP_API_LOCAL_FEEDS is "true",
+                otherwise the real Feeds API). Only the feed path is
+                replaced; listing put/patch/get calls still go to the
+                live Listings Items API.
         """
         self.credentials = {
             "refresh_token": refresh_token or os.getenv("SP_API_REFRESH_TOKEN"),
@@ -66,6 +173,23 @@ class SPAPIClient(LoggerMixin):
         self.marketplace = marketplace
         self.seller_id = os.getenv("AMAZON_SELLER_ID")
 
+        # API objects are built on first use and reused afterwards
+        self._api_pool = APIInstancePool(self._get_api_instance)
+
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(limits=self.RATE_LIMITS)
+        self.max_retries = max_retries
+
+        if feeds_api is None and os.getenv("SP_API_LOCAL_FEEDS", "false").lower() == "true":
+            feeds_api = LocalFeedsEndpoint()
+        self.feeds_api = feeds_api
+
+        if use_order_store:
+            self.order_store = order_store or OrderStore(
+                marketplace_id=marketplace.marketplace_id
+            )
+        else:
+            self.order_store = None
+
         self._validate_credentials()
 
     def _validate_credentials(self):
@@ -92,8 +216,60 @@ class SPAPIClient(LoggerMixin):
         return api_class(
             credentials=self.credentials,
             marketplace=self.marketplace,
+            auth_token_client_class=CachedAccessTokenClient,
         )
 
+    def _api(self, api_class):
+        """
+        Borrow a pooled API instance for the duration of a with-block.
+
+        Args:
+            api_class: The SP-API class, e.g. ListingsItems
+
+        Returns:
+            Context manager yielding an instance no other thread is using
+        """
+        return self._api_pool.checkout(api_class)
+
+    def api_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get API instances "created" and "reused" per API class."""
+        return self._api_pool.stats()
+
+    def _throttled_call(self, family: str, call: Callable[[], Any]) -> Any:
+        """
+        Run an SP-API call paced by its family's token bucket.
+
+        Throttled (429) calls lower the family's rate and are retried
+        after Retry-After (when given) or an exponential backoff with
+        jitter; other errors are raised immediately.
+
+        Args:
+            family: Rate limit family from RATE_LIMITS
+            call: Performs the request
+
+        Returns:
+            The call's result
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(family)
+            try:
+                result = call()
+            except SellingApiRequestThrottledException as e:
+                retry_after = parse_retry_after((e.headers or {}).get("Retry-After"))
+                self.rate_limiter.on_throttle(family, retry_after)
+                if attempt == self.max_retries:
+                    raise
+
+                delay = self.rate_limiter.backoff_delay(attempt, retry_after)
+                self.logger.warning(
+                    f"{family} request throttled; "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            else:
+                self.rate_limiter.on_success(family)
+                return result
+
     # ==================== Listing Operations ====================
 
     def update_listing(
@@ -117,28 +293,30 @@ class SPAPIClient(LoggerMixin):
         Returns:
             API response containing status and any issues
         """
-        listings_api = self._get_api_instance(ListingsItems)
-
-        try:
-            self.logger.info(f"Updating listing for SKU: {sku}")
-
-            response = listings_api.put_listings_item(
-                sellerId=self.seller_id,
-                sku=sku,
-                marketplaceIds=[self.marketplace.marketplace_id],
-                body={
-                    "productType": product_type,
-                    "requirements": requirements,
-                    "attributes": attributes,
-                },
-            )
+        with self._api(ListingsItems) as listings_api:
+            try:
+                self.logger.info(f"Updating listing for SKU: {sku}")
+
+                response = self._throttled_call(
+                    "listings",
+                    lambda: listings_api.put_listings_item(
+                        sellerId=self.seller_id,
+                        sku=sku,
+                        marketplaceIds=[self.marketplace.marketplace_id],
+                        body={
+                            "productType": product_type,
+                            "requirements": requirements,
+                            "attributes": attributes,
+                        },
+                    ),
+                )
 
-            self.logger.info(f"Listing update response for {sku}: {response.payload}")
-            return response.payload
+                self.logger.info(f"Listing update response for {sku}: {response.payload}")
+                return response.payload
 
-        except SellingApiException as e:
-            self.logger.error(f"SP-API error updating listing {sku}: {e}")
-            raise
+            except SellingApiException as e:
+                self.logger.error(f"SP-API error updating listing {sku}: {e}")
+                raise
 
     def update_listing_attributes(
         self,
@@ -163,8 +341,41 @@ class SPAPIClient(LoggerMixin):
         Returns:
             API response
         """
-        # Format attributes for SP-API Listings Items format
-        attributes = {
+        return self.update_listing(
+            sku=sku,
+            product_type=self.LISTING_PRODUCT_TYPE,
+            attributes=self.build_listing_attributes(
+                title=title,
+                bullet_points=bullet_points,
+                description=description,
+                search_terms=search_terms,
+                brand=brand,
+            ),
+            mode="VALIDATION_PREVIEW",
+        )
+
+    def build_listing_attributes(
+        self,
+        title: str,
+        bullet_points: List[str],
+        description: str,
+        search_terms: str,
+        brand: str = "Shelzy's Designs",
+    ) -> Dict[str, Any]:
+        """
+        Render listing content in the SP-API Listings Items attribute format.
+
+        Args:
+            title: Optimized product title
+            bullet_points: List of bullet point strings
+            description: Product description
+            search_terms: Backend search terms (space-separated)
+            brand: Brand name
+
+        Returns:
+            Attributes payload for put_listings_item
+        """
+        return {
             "item_name": [{"value": title, "marketplace_id": self.marketplace.marketplace_id}],
             "brand": [{"value": brand, "marketplace_id": self.marketplace.marketplace_id}],
             "bullet_point": [
@@ -179,12 +390,76 @@ class SPAPIClient(LoggerMixin):
             ],
         }
 
-        return self.update_listing(
-            sku=sku,
-            product_type="DRINKING_CUP",
-            attributes=attributes,
-            mode="VALIDATION_PREVIEW",
-        )
+    def build_listing_patches(
+        self,
+        current: Dict[str, Any],
+        desired: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Diff live listing attributes against desired ones.
+
+        Only the keys we send (e.g. "value", "marketplace_id") are compared,
+        so fields Amazon adds on read such as "language_tag" do not count as
+        changes. Attributes we do not manage are left untouched.
+
+        Args:
+            current: Attributes from get_listing
+            desired: Attributes from build_listing_attributes
+
+        Returns:
+            JSON Patch "replace" operations for the changed attributes
+        """
+        patches = []
+        for name, values in desired.items():
+            live = current.get(name) or []
+            comparable = [
+                {key: entry.get(key) for key in wanted}
+                for entry, wanted in zip(live, values)
+            ]
+            if len(live) != len(values) or comparable != values:
+                patches.append({"op": "replace", "path": f"/attributes/{name}", "value": values})
+        return patches
+
+    def patch_listing(
+        self,
+        sku: str,
+        patches: List[Dict[str, Any]],
+        product_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Partially update a listing using the Listings Items API.
+
+        Args:
+            sku: Seller SKU
+            patches: JSON Patch operations (see build_listing_patches)
+            product_type: Amazon product type (default: LISTING_PRODUCT_TYPE)
+
+        Returns:
+            API response containing status and any issues
+        """
+        with self._api(ListingsItems) as listings_api:
+            try:
+                self.logger.info(f"Patching {len(patches)} attributes for SKU: {sku}")
+
+                response = self._throttled_call(
+                    "listings_patch",
+                    lambda: listings_api.patch_listings_item(
+                        sellerId=self.seller_id,
+                        sku=sku,
+                        marketplaceIds=[self.marketplace.marketplace_id],
+                        body={
+                            "productType": product_type or self.LISTING_PRODUCT_TYPE,
+                            "patches": patches,
+                        },
+                    ),
+                )
+
+                self.logger.info(f"Listing patch response for {sku}: {response.payload}")
+                return response.payload
+
+            except SellingApiException as e:
+                self.logger.error(f"SP-API error patching listing {sku}: {e}")
+                raise
 
     def get_listing(self, sku: str) -> Dict[str, Any]:
         """
@@ -194,21 +469,203 @@ class SPAPIClient(LoggerMixin):
             sku: Seller SKU
 
         Returns:
-            Listing data
+            Listing data with "summaries" and "attributes"
         """
-        listings_api = self._get_api_instance(ListingsItems)
+        with self._api(ListingsItems) as listings_api:
+            try:
+                response = self._throttled_call(
+                    "listings",
+                    lambda: listings_api.get_listings_item(
+                        sellerId=self.seller_id,
+                        sku=sku,
+                        marketplaceIds=[self.marketplace.marketplace_id],
+                        includedData=["summaries", "attributes"],
+                    ),
+                )
+                return response.payload
 
-        try:
-            response = listings_api.get_listings_item(
-                sellerId=self.seller_id,
-                sku=sku,
-                marketplaceIds=[self.marketplace.marketplace_id],
+            except SellingApiException as e:
+                self.logger.error(f"Error getting listing {sku}: {e}")
+                raise
+
+    # ==================== Feed Operations ====================
+
+    # Feed processing states after which no further status change happens
+    FEED_FINAL_STATUSES = ("DONE", "CANCELLED", "FATAL")
+
+    def _feeds(self):
+        """Borrow the Feeds API (or the configured stand-in) for a with-block."""
+        if self.feeds_api is not None:
+            return nullcontext(self.feeds_api)
+        return self._api(Feeds)
+
+    @property
+    def uses_local_feeds(self) -> bool:
+        """Whether feeds are processed locally instead of by Amazon."""
+        return bool(getattr(self.feeds_api, "local", False))
+
+    def submit_listings_feed(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        Upload a JSON_LISTINGS_FEED document and create the feed.
+
+        Args:
+            messages: Feed messages, each with "messageId", "sku" and
+                "operationType"
+
+        Returns:
+            Feed ID
+        """
+        document = {
+            "header": {
+                "sellerId": self.seller_id,
+                "version": "2.0",
+                "issueLocale": "en_US",
+            },
+            "messages": messages,
+        }
+        body = json.dumps(document).encode("utf-8")
+
+        with self._feeds() as feeds_api:
+            try:
+                self.logger.info(
+                    f"Submitting JSON_LISTINGS_FEED with {len(messages)} messages "
+                    f"({len(body)} bytes)"
+                )
+                _, feed = self._throttled_call(
+                    "feed_submissions",
+                    lambda: feeds_api.submit_feed(
+                        "JSON_LISTINGS_FEED",
+                        io.BytesIO(body),
+                        content_type="application/json",
+                        marketplaceIds=[self.marketplace.marketplace_id],
+                    ),
+                )
+            except SellingApiException as e:
+                self.logger.error(f"SP-API error submitting listings feed: {e}")
+                raise
+
+        feed_id = feed.payload["feedId"]
+        self.logger.info(f"Created feed {feed_id}")
+        return feed_id
+
+    def wait_for_feed(
+        self,
+        feed_id: str,
+        poll_interval: float = 30.0,
+        timeout: float = 1800.0,
+    ) -> Dict[str, Any]:
+        """
+        Poll a feed until Amazon has finished processing it.
+
+        Args:
+            feed_id: Feed ID from submit_listings_feed
+            poll_interval: Seconds between status checks
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            Final feed payload (with "processingStatus")
+        """
+        deadline = time.monotonic() + timeout
+        with self._feeds() as feeds_api:
+            while True:
+                feed = self._throttled_call(
+                    "feed_status", lambda: feeds_api.get_feed(feed_id)
+                ).payload
+                status = feed.get("processingStatus")
+                if status in self.FEED_FINAL_STATUSES:
+                    self.logger.info(f"Feed {feed_id} finished: {status}")
+                    return feed
+
+                if time.monotonic() + poll_interval > deadline:
+                    raise TimeoutError(
+                        f"Feed {feed_id} still {status} after {timeout:.0f}s"
+                    )
+                self.logger.debug(f"Feed {feed_id} is {status}; checking again in {poll_interval}s")
+                time.sleep(poll_interval)
+
+    def get_feed_result(self, feed: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Download and parse a finished feed's processing report.
+
+        Args:
+            feed: Feed payload from wait_for_feed
+
+        Returns:
+            Processing report with "summary" and "issues"
+        """
+        document_id = feed.get("resultFeedDocumentId")
+        if not document_id:
+            return {"summary": {}, "issues": []}
+
+        with self._feeds() as feeds_api:
+            content = self._throttled_call(
+                "feed_documents",
+                lambda: feeds_api.get_feed_result_document(document_id),
             )
-            return response.payload
+        return json.loads(content)
 
-        except SellingApiException as e:
-            self.logger.error(f"Error getting listing {sku}: {e}")
-            raise
+    def bulk_update_listings(
+        self,
+        listings: Dict[str, Dict[str, Any]],
+        product_type: Optional[str] = None,
+        poll_interval: float = 30.0,
+        timeout: float = 1800.0,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Update many listings with one JSON_LISTINGS_FEED.
+
+        All listings go into a single feed document, uploaded once; the
+        processing report is then mapped back to SKUs. A listing fails if
+        any ERROR issue was reported for its message.
+
+        Args:
+            listings: Attributes per SKU (see build_listing_attributes)
+            product_type: Amazon product type (default: LISTING_PRODUCT_TYPE)
+            poll_interval: Seconds between feed status checks
+            timeout: Seconds to wait for processing
+
+        Returns:
+            Dict of SKU to {"status": "success"|"failed", "issues": [...]}
+        """
+        if not listings:
+            return {}
+
+        product_type = product_type or self.LISTING_PRODUCT_TYPE
+        skus = list(listings)
+        messages = [
+            {
+                "messageId": message_id,
+                "sku": sku,
+                "operationType": "UPDATE",
+                "productType": product_type,
+                "requirements": "LISTING",
+                "attributes": listings[sku],
+            }
+            for message_id, sku in enumerate(skus, start=1)
+        ]
+
+        feed_id = self.submit_listings_feed(messages)
+        feed = self.wait_for_feed(feed_id, poll_interval=poll_interval, timeout=timeout)
+        if feed.get("processingStatus") != "DONE":
+            error = f"Feed {feed_id} ended {feed.get('processingStatus')}"
+            return {
+                sku: {"status": "failed", "issues": [{"severity": "ERROR", "message": error}]}
+                for sku in skus
+            }
+
+        report = self.get_feed_result(feed)
+        issues_by_message: Dict[Any, List[Dict[str, Any]]] = {}
+        for issue in report.get("issues", []):
+            issues_by_message.setdefault(issue.get("messageId"), []).append(issue)
+
+        results = {}
+        for message_id, sku in enumerate(skus, start=1):
+            issues = issues_by_message.get(message_id, [])
+            failed = any(issue.get("severity") == "ERROR" for issue in issues)
+            results[sku] = {"status": "failed" if failed else "success", "issues": issues}
+
+        self.logger.info(f"Feed {feed_id} summary: {report.get('summary', {})}")
+        return results
 
     # ==================== Order Operations ====================
 
@@ -225,27 +682,111 @@ class SPAPIClient(LoggerMixin):
             order_statuses: Filter by order status (e.g., Shipped, Delivered)
 
         Returns:
-            List of order dictionaries
+            List of order dictionaries across all pages
         """
-        orders_api = self._get_api_instance(Orders)
-
         if created_after is None:
             created_after = datetime.utcnow() - timedelta(days=30)
 
         if order_statuses is None:
             order_statuses = ["Shipped"]
 
-        try:
-            response = orders_api.get_orders(
-                MarketplaceIds=[self.marketplace.marketplace_id],
-                CreatedAfter=created_after.isoformat(),
-                OrderStatuses=order_statuses,
-            )
-            return response.payload.get("Orders", [])
+        return list(self.iter_orders(
+            created_after=created_after,
+            order_statuses=order_statuses,
+        ))
+
+    def iter_orders(
+        self,
+        created_after: Optional[datetime] = None,
+        last_updated_after: Optional[datetime] = None,
+        order_statuses: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream orders page by page, following NextToken.
 
-        except SellingApiException as e:
-            self.logger.error(f"Error getting orders: {e}")
-            raise
+        Exactly one of created_after and last_updated_after must be given;
+        the Orders API does not accept both.
+
+        Args:
+            created_after: Only return orders created after this date
+            last_updated_after: Only return orders changed after this date
+            order_statuses: Filter by order status (all statuses if None)
+
+        Yields:
+            Order dictionaries
+        """
+        params: Dict[str, Any] = {"MarketplaceIds": [self.marketplace.marketplace_id]}
+        if last_updated_after is not None:
+            params["LastUpdatedAfter"] = last_updated_after.isoformat()
+        else:
+            params["CreatedAfter"] = created_after.isoformat()
+        if order_statuses:
+            params["OrderStatuses"] = order_statuses
+
+        while True:
+            with self._api(Orders) as orders_api:
+                try:
+                    payload = self._throttled_call(
+                        "orders", lambda: orders_api.get_orders(**params)
+                    ).payload
+                except SellingApiException as e:
+                    self.logger.error(f"Error getting orders: {e}")
+                    raise
+
+            yield from payload.get("Orders", [])
+
+            next_token = payload.get("NextToken")
+            if not next_token:
+                return
+            params = {
+                "MarketplaceIds": [self.marketplace.marketplace_id],
+                "NextToken": next_token,
+            }
+
+    def sync_orders(self, lookback_days: int = 30) -> int:
+        """
+        Bring the local order store up to date.
+
+        The first run (or a run after the store fell behind the lookback
+        window) loads every order created in the window; later runs only
+        fetch orders changed since the previous sync's watermark.
+
+        Args:
+            lookback_days: Days of orders the store must cover
+
+        Returns:
+            Number of orders fetched
+        """
+        store = self.order_store
+        now = datetime.utcnow()
+        window_start = now - timedelta(days=lookback_days)
+
+        # Overlap a few minutes with the previous sync; upserts are idempotent
+        next_watermark = now - timedelta(minutes=5)
+
+        full_sync = (
+            store.watermark is None
+            or store.since is None
+            or store.since > window_start
+            or store.watermark < window_start
+        )
+        if full_sync:
+            self.logger.info(f"Full order sync for the last {lookback_days} days")
+            fetched = store.upsert(self.iter_orders(created_after=window_start))
+        else:
+            self.logger.info(f"Syncing orders updated since {store.watermark.isoformat()}")
+            fetched = store.upsert(self.iter_orders(last_updated_after=store.watermark))
+
+        # Pruning drops everything before window_start, so the store is only
+        # complete from there on; a later, longer lookback must refetch
+        pruned = store.prune(purchased_before=window_start)
+        store.save(
+            watermark=next_watermark,
+            since=window_start if full_sync else max(store.since, window_start),
+        )
+
+        self.logger.info(f"Order sync fetched {fetched} orders, pruned {pruned}")
+        return fetched
 
     def get_delivered_orders(
         self,
@@ -267,25 +808,26 @@ class SPAPIClient(LoggerMixin):
         end_date = datetime.utcnow() - timedelta(days=min_days_ago)
         start_date = datetime.utcnow() - timedelta(days=max_days_ago)
 
-        orders = self.get_orders(
-            created_after=start_date,
-            order_statuses=["Shipped"],
-        )
+        if self.order_store is not None:
+            self.sync_orders(lookback_days=max_days_ago)
+            orders = [
+                order for order in self.order_store.orders()
+                if order.get("OrderStatus") == "Shipped"
+                and (parse_amazon_datetime(order.get("PurchaseDate")) or start_date) >= start_date
+            ]
+        else:
+            orders = self.get_orders(
+                created_after=start_date,
+                order_statuses=["Shipped"],
+            )
 
         # Filter to orders that have been delivered
         eligible_orders = []
         for order in orders:
             # Check if order has been delivered and is within the window
-            latest_delivery = order.get("LatestDeliveryDate")
-            if latest_delivery:
-                try:
-                    delivery_date = datetime.fromisoformat(
-                        latest_delivery.replace("Z", "+00:00")
-                    )
-                    if start_date <= delivery_date <= end_date:
-                        eligible_orders.append(order)
-                except (ValueError, TypeError):
-                    continue
+            delivery_date = parse_amazon_datetime(order.get("LatestDeliveryDate"))
+            if delivery_date and start_date <= delivery_date <= end_date:
+                eligible_orders.append(order)
 
         self.logger.info(
             f"Found {len(eligible_orders)} orders eligible for review requests"
@@ -294,6 +836,59 @@ class SPAPIClient(LoggerMixin):
 
     # ==================== Review Solicitation ====================
 
+    # Solicitation action offered for orders that can be asked for a review
+    REVIEW_SOLICITATION_ACTION = "productReviewAndSellerFeedback"
+
+    def get_solicitation_actions(self, order_id: str) -> List[str]:
+        """
+        List the solicitation actions currently available for an order.
+
+        Args:
+            order_id: Amazon order ID
+
+        Returns:
+            Action names, e.g. ["productReviewAndSellerFeedback"]
+        """
+        with self._api(Solicitations) as solicitations_api:
+            response = self._throttled_call(
+                "solicitation_actions",
+                lambda: solicitations_api.get_solicitation_actions_for_order(
+                    order_id,
+                    marketplaceIds=[self.marketplace.marketplace_id],
+                ),
+            )
+
+        links = (response.payload or {}).get("_links", {})
+        return [action.get("name") for action in links.get("actions", [])]
+
+    def check_review_eligibility(
+        self,
+        order_ids: List[str],
+        max_workers: int = 1,
+    ) -> Dict[str, Optional[bool]]:
+        """
+        Check which orders can currently be sent a review request.
+
+        Lookups run concurrently, paced by the getSolicitationActionsForOrder
+        rate limit.
+
+        Args:
+            order_ids: Amazon order IDs
+            max_workers: Lookups in flight at once
+
+        Returns:
+            Order ID -> eligible, or None if the lookup failed
+        """
+        def check(order_id: str) -> Optional[bool]:
+            try:
+                return self.REVIEW_SOLICITATION_ACTION in self.get_solicitation_actions(order_id)
+            except SellingApiException as e:
+                self.logger.warning(f"Could not check review eligibility for {order_id}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return dict(zip(order_ids, executor.map(check, order_ids)))
+
     def request_review(self, order_id: str) -> Dict[str, Any]:
         """
         Send a review request for an order via Solicitations API.
@@ -304,46 +899,52 @@ class SPAPIClient(LoggerMixin):
         Returns:
             API response
         """
-        solicitations_api = self._get_api_instance(Solicitations)
-
-        try:
-            self.logger.info(f"Requesting review for order: {order_id}")
-
-            response = solicitations_api.create_product_review_and_seller_feedback_solicitation(
-                amazonOrderId=order_id,
-                marketplaceIds=[self.marketplace.marketplace_id],
-            )
+        with self._api(Solicitations) as solicitations_api:
+            try:
+                self.logger.info(f"Requesting review for order: {order_id}")
+
+                self._throttled_call(
+                    "solicitations",
+                    lambda: solicitations_api.create_product_review_and_seller_feedback_solicitation(
+                        amazonOrderId=order_id,
+                        marketplaceIds=[self.marketplace.marketplace_id],
+                    ),
+                )
 
-            self.logger.info(f"Review request sent for order {order_id}")
-            return {"status": "success", "order_id": order_id}
+                self.logger.info(f"Review request sent for order {order_id}")
+                return {"status": "success", "order_id": order_id}
 
-        except SellingApiException as e:
-            error_code = getattr(e, "code", "UNKNOWN")
-            self.logger.warning(
-                f"Could not request review for {order_id}: {error_code} - {e}"
-            )
-            return {"status": "failed", "order_id": order_id, "error": str(e)}
+            except SellingApiException as e:
+                error_code = getattr(e, "code", "UNKNOWN")
+                self.logger.warning(
+                    f"Could not request review for {order_id}: {error_code} - {e}"
+                )
+                return {"status": "failed", "order_id": order_id, "error": str(e)}
 
     def batch_request_reviews(
         self,
         order_ids: List[str],
         delay_ms: int = 1000,
+        max_workers: int = 1,
     ) -> Dict[str, Any]:
         """
         Send review requests for multiple orders with rate limiting.
 
         Args:
             order_ids: List of order IDs
-            delay_ms: Delay between requests in milliseconds
+            delay_ms: Delay between requests in milliseconds (sequential
+                mode only)
+            max_workers: Requests in flight at once; above 1 the
+                Solicitations token bucket alone paces the requests
 
         Returns:
             Summary of results
         """
         results = {"successful": [], "failed": [], "total": len(order_ids)}
 
-        for order_id in order_ids:
-            result = self.request_review(order_id)
-
+        for order_id, result in send_review_requests(
+            self.request_review, order_ids, delay_ms, max_workers
+        ):
             if result["status"] == "success":
                 results["successful"].append(order_id)
             else:
@@ -351,11 +952,9 @@ class SPAPIClient(LoggerMixin):
                     {"order_id": order_id, "error": result.get("error")}
                 )
 
-            # Rate limiting
-            time.sleep(delay_ms / 1000)
-
         self.logger.info(
             f"Review requests complete: {len(results['successful'])} successful, "
             f"{len(results['failed'])} failed"
         )
+        self.logger.info(f"SP-API instances: {self.api_stats()}")
         return results
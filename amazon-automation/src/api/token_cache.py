@@ -0,0 +1,217 @@
+"""
+Token Cache Module
+
+Shares Login with Amazon (LWA) access tokens between clients and between
+processes. Tokens live in memory and in one small file per refresh token,
+guarded by a file lock so concurrent jobs refresh only once, and are
+refreshed in the background shortly before they expire.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking falls back to in-process only
+    fcntl = None
+
+from ..utils.logger import LoggerMixin
+
+# Calls the LWA token endpoint; returns {"access_token", "expires_in", ...}
+TokenFetcher = Callable[[], Dict[str, Any]]
+
+
+class TokenCache(LoggerMixin):
+    """
+    Memory + disk cache of LWA access tokens keyed by client and refresh token.
+
+    Entries are {"access_token", "token_type", "expires_at"} with
+    expires_at in epoch seconds. Refresh tokens are only stored hashed.
+    """
+
+    # Never wait less than this between background refreshes
+    MIN_REFRESH_DELAY = 30.0
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        refresh_margin: float = 300.0,
+        background_refresh: Optional[bool] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the token cache.
+
+        Args:
+            cache_dir: Directory for token files (defaults to TOKEN_CACHE_DIR
+                or .cache/tokens in the project directory)
+            refresh_margin: Seconds before expiry a token stops being used
+            background_refresh: Refresh tokens on a timer before they expire
+                (defaults to TOKEN_BACKGROUND_REFRESH, on unless "false")
+            clock: Wall clock function (shared across processes)
+        """
+        self.cache_dir = cache_dir or os.getenv("TOKEN_CACHE_DIR") or str(
+            Path(__file__).parent.parent.parent / ".cache" / "tokens"
+        )
+        self.refresh_margin = refresh_margin
+        if background_refresh is None:
+            background_refresh = os.getenv("TOKEN_BACKGROUND_REFRESH", "true").lower() != "false"
+        self.background_refresh = background_refresh
+        self._clock = clock
+
+        self._tokens: Dict[str, Dict[str, Any]] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+
+    @staticmethod
+    def make_key(client_id: Optional[str], refresh_token: Optional[str]) -> str:
+        """Build the cache key for an LWA client and refresh token."""
+        identity = json.dumps([client_id or "", refresh_token or ""])
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def get_token(self, key: str, fetch: TokenFetcher) -> Dict[str, Any]:
+        """
+        Get a usable token, fetching one only if no process has a fresh one.
+
+        Args:
+            key: Cache key from make_key
+            fetch: Calls the LWA token endpoint
+
+        Returns:
+            Token entry with "access_token" and "expires_at"
+        """
+        entry = self._tokens.get(key)
+        if self._is_fresh(entry):
+            return entry
+
+        with self._key_lock(key):
+            entry = self._tokens.get(key)
+            if self._is_fresh(entry):
+                return entry
+            entry = self._load_or_fetch(key, fetch, self.refresh_margin)
+
+        self._schedule_refresh(key, fetch, entry)
+        return entry
+
+    def close(self):
+        """Cancel pending background refreshes."""
+        with self._lock:
+            timers, self._timers = list(self._timers.values()), {}
+        for timer in timers:
+            timer.cancel()
+
+    # ==================== Internals ====================
+
+    def _is_fresh(self, entry: Optional[Dict[str, Any]], margin: Optional[float] = None) -> bool:
+        """Check that a token stays valid for at least margin more seconds."""
+        if not entry or not entry.get("access_token"):
+            return False
+        margin = self.refresh_margin if margin is None else margin
+        return self._clock() < entry.get("expires_at", 0) - margin
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _load_or_fetch(self, key: str, fetch: TokenFetcher, margin: float) -> Dict[str, Any]:
+        """Use another process's token if fresh enough, otherwise fetch one."""
+        with self._file_lock(key):
+            entry = self._read(key)
+            if not self._is_fresh(entry, margin):
+                data = fetch()
+                entry = {
+                    "access_token": data["access_token"],
+                    "token_type": data.get("token_type", "bearer"),
+                    "expires_at": self._clock() + float(data.get("expires_in", 3600)),
+                }
+                self._write(key, entry)
+                self.fetches += 1
+                self.logger.debug("Fetched new LWA access token")
+        self._tokens[key] = entry
+        return entry
+
+    def _schedule_refresh(self, key: str, fetch: TokenFetcher, entry: Dict[str, Any]):
+        """Refresh a token in the background one margin before it goes stale."""
+        if not self.background_refresh:
+            return
+
+        delay = entry["expires_at"] - 2 * self.refresh_margin - self._clock()
+        timer = threading.Timer(
+            max(delay, self.MIN_REFRESH_DELAY),
+            self._refresh_in_background,
+            args=(key, fetch),
+        )
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.get(key)
+            self._timers[key] = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def _refresh_in_background(self, key: str, fetch: TokenFetcher):
+        try:
+            with self._key_lock(key):
+                entry = self._load_or_fetch(key, fetch, 2 * self.refresh_margin)
+        except Exception as e:
+            # The next get_token call refreshes on demand instead
+            self.logger.warning(f"Background token refresh failed: {e}")
+            return
+        self._schedule_refresh(key, fetch, entry)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    @contextmanager
+    def _file_lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive lock on a key across processes."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._path(key) + ".lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, entry: Dict[str, Any]):
+        """Atomically replace the token file (created owner-only)."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+_shared_cache: Optional[TokenCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    """Get the process-wide token cache shared by all API clients."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = TokenCache()
+        return _shared_cache
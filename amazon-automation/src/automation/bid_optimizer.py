@@ -9,7 +9,13 @@ Automatically adjusts keyword bids based on performance rules:
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from ..api.advertising_client import AdvertisingClient
 from ..utils.config_loader import ConfigLoader
@@ -24,6 +30,9 @@ class BidOptimizer(LoggerMixin):
     management according to defined rules.
     """
 
+    # Keyword rows analyzed per vectorized pass
+    BATCH_SIZE = 50000
+
     def __init__(
         self,
         advertising_client: Optional[AdvertisingClient] = None,
@@ -161,6 +170,79 @@ class BidOptimizer(LoggerMixin):
 
         return result
 
+    def analyze_keywords_batch(
+        self,
+        keyword_rows: Sequence[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many keywords at once, returning only those needing action.
+
+        With NumPy installed, the metrics are loaded into column arrays and
+        the pause/increase/decrease rules are evaluated as vectorized
+        masks; result records (and their reason strings) are only built
+        for matching rows, by analyze_keyword_performance, so the output
+        is identical to running the scalar analysis on every row and
+        dropping action "none". Without NumPy the scalar path is used.
+
+        Args:
+            keyword_rows: Keyword performance rows from the report
+
+        Returns:
+            Analysis results for rows whose action is not "none", in row order
+        """
+        if np is None:
+            analyses = map(self.analyze_keyword_performance, keyword_rows)
+            return [analysis for analysis in analyses if analysis["action"] != "none"]
+
+        count = len(keyword_rows)
+        if count == 0:
+            return []
+
+        def column(values):
+            return np.fromiter(values, dtype=np.float64, count=count)
+
+        clicks = column(kw.get("clicks", 0) or 0 for kw in keyword_rows)
+        cost = column(kw.get("cost", 0) or 0 for kw in keyword_rows)
+        sales = column(
+            kw.get("sales1d", 0) or kw.get("sales", 0) or 0 for kw in keyword_rows
+        )
+        conversions = column(
+            kw.get("purchases1d", 0) or kw.get("conversions", 0) or 0
+            for kw in keyword_rows
+        )
+        bids = column(kw.get("bid", 0) or 0 for kw in keyword_rows)
+
+        # Same ACoS definition as calculate_acos
+        with np.errstate(divide="ignore", invalid="ignore"):
+            acos = np.where(
+                sales > 0,
+                cost / sales * 100,
+                np.where(cost > 0, np.inf, 0.0),
+            )
+
+        pause = (
+            (acos > self.pause_acos_threshold)
+            & (cost >= self.pause_spend_min)
+            & (conversions == self.pause_conversions_max)
+        )
+        increase = (
+            (acos < self.increase_acos_threshold)
+            & (conversions >= self.increase_conversions_min)
+            & (np.minimum(bids * (1 + self.increase_percent / 100), self.max_bid) > bids)
+        )
+        decrease = (
+            (acos > self.decrease_acos_threshold)
+            & (clicks >= self.decrease_clicks_min)
+            & (np.maximum(bids * (1 - self.decrease_percent / 100), self.min_bid) < bids)
+        )
+
+        # Rule priority is resolved by the scalar analysis of each match
+        analyses = (
+            self.analyze_keyword_performance(keyword_rows[i])
+            for i in np.flatnonzero(pause | increase | decrease)
+        )
+        return [analysis for analysis in analyses if analysis["action"] != "none"]
+
     def analyze_search_term(
         self,
         search_term_data: Dict[str, Any],
@@ -235,71 +317,20 @@ class BidOptimizer(LoggerMixin):
         }
 
         try:
-            # Get keyword performance data
-            self.logger.info("Fetching keyword performance data...")
-            keyword_data = self.ads_client.get_keyword_performance(
-                lookback_days=lookback_days
-            )
-            self.logger.info(f"Retrieved performance data for {len(keyword_data)} keywords")
-
-            # Analyze and process keywords
-            bid_updates = []
-
-            for kw in keyword_data:
-                analysis = self.analyze_keyword_performance(kw)
-
-                if analysis["action"] == "increase_bid":
-                    results["bid_increases"].append(analysis)
-                    if not dry_run:
-                        bid_updates.append({
-                            "keywordId": analysis["keyword_id"],
-                            "bid": analysis["new_bid"],
-                        })
-
-                elif analysis["action"] == "decrease_bid":
-                    results["bid_decreases"].append(analysis)
-                    if not dry_run:
-                        bid_updates.append({
-                            "keywordId": analysis["keyword_id"],
-                            "bid": analysis["new_bid"],
-                        })
-
-                elif analysis["action"] == "pause":
-                    results["paused_keywords"].append(analysis)
-                    if not dry_run:
-                        self.ads_client.update_keyword(
-                            keyword_id=analysis["keyword_id"],
-                            state="paused",
-                        )
-
-            # Apply bid updates in batch
-            if bid_updates and not dry_run:
-                self.logger.info(f"Applying {len(bid_updates)} bid updates...")
-                self.ads_client.batch_update_keywords(bid_updates)
-
-            # Get search term data for negative keyword analysis
-            self.logger.info("Fetching search term report...")
-            search_term_data = self.ads_client.get_search_term_report(
-                lookback_days=lookback_days
-            )
-            self.logger.info(f"Retrieved {len(search_term_data)} search terms")
-
-            # Analyze search terms
-            for st in search_term_data:
-                analysis = self.analyze_search_term(st)
-
-                if analysis["add_as_negative"]:
-                    results["new_negatives"].append(analysis)
-                    if not dry_run and analysis["campaign_id"]:
-                        self.ads_client.create_negative_keywords(
-                            campaign_id=analysis["campaign_id"],
-                            ad_group_id=analysis["ad_group_id"],
-                            keywords=[{
-                                "text": analysis["search_term"],
-                                "match_type": "negative_exact",
-                            }],
-                            level="adGroup" if analysis["ad_group_id"] else "campaign",
-                        )
+            # Both reports are requested up front and handled in the
+            # order they finish generating; rows are analyzed as they
+            # stream in rather than after a full download
+            self.logger.info("Fetching keyword and search term reports...")
+            for name, rows in self.ads_client.iter_optimization_reports(
+                lookback_days=lookback_days,
+                stream=True,
+            ):
+                if name == "keywords":
+                    count = self._process_keywords(rows, results, dry_run)
+                    self.logger.info(f"Analyzed performance data for {count} keywords")
+                else:
+                    count = self._process_search_terms(rows, results, dry_run)
+                    self.logger.info(f"Analyzed {count} search terms")
 
         except Exception as e:
             self.logger.error(f"Optimization error: {e}")
@@ -310,6 +341,166 @@ class BidOptimizer(LoggerMixin):
 
         return results
 
+    def _process_keywords(
+        self,
+        keyword_data: Iterable[Dict[str, Any]],
+        results: Dict[str, Any],
+        dry_run: bool,
+    ) -> int:
+        """
+        Analyze keyword rows and apply bid changes and pauses.
+
+        Returns:
+            Number of rows analyzed
+        """
+        # Bid changes and pauses share one chunked batch update
+        keyword_updates = []
+        count = 0
+
+        rows = iter(keyword_data)
+        while True:
+            batch = list(islice(rows, self.BATCH_SIZE))
+            if not batch:
+                break
+            count += len(batch)
+            self._collect_keyword_actions(
+                self.analyze_keywords_batch(batch), results, keyword_updates, dry_run
+            )
+
+        # Apply bid updates and pauses in batch
+        if keyword_updates and not dry_run:
+            self.logger.info(f"Applying {len(keyword_updates)} keyword updates...")
+            update_result = self.ads_client.batch_update_keywords(keyword_updates)
+            for failure in update_result.get("failed", []):
+                results["errors"].append(
+                    f"Keyword {failure['keyword_id']} update failed: {failure['error']}"
+                )
+
+        return count
+
+    def _collect_keyword_actions(
+        self,
+        analyses: Iterable[Dict[str, Any]],
+        results: Dict[str, Any],
+        keyword_updates: List[Dict[str, Any]],
+        dry_run: bool,
+    ):
+        """Record keyword analyses in results and queue their updates."""
+        for analysis in analyses:
+            if analysis["action"] == "increase_bid":
+                results["bid_increases"].append(analysis)
+                if not dry_run:
+                    keyword_updates.append({
+                        "keywordId": analysis["keyword_id"],
+                        "bid": analysis["new_bid"],
+                    })
+
+            elif analysis["action"] == "decrease_bid":
+                results["bid_decreases"].append(analysis)
+                if not dry_run:
+                    keyword_updates.append({
+                        "keywordId": analysis["keyword_id"],
+                        "bid": analysis["new_bid"],
+                    })
+
+            elif analysis["action"] == "pause":
+                results["paused_keywords"].append(analysis)
+                if not dry_run:
+                    keyword_updates.append({
+                        "keywordId": analysis["keyword_id"],
+                        "state": "paused",
+                    })
+
+    def _process_search_terms(
+        self,
+        search_term_data: Iterable[Dict[str, Any]],
+        results: Dict[str, Any],
+        dry_run: bool,
+    ) -> int:
+        """
+        Analyze search terms and create negatives for wasted spend.
+
+        Returns:
+            Number of rows analyzed
+        """
+        count = 0
+        for st in search_term_data:
+            count += 1
+            analysis = self.analyze_search_term(st)
+
+            if analysis["add_as_negative"]:
+                results["new_negatives"].append(analysis)
+
+        # Create negatives in bulk, one request per campaign/ad group
+        if results["new_negatives"] and not dry_run:
+            results["errors"].extend(
+                self._apply_negatives(results["new_negatives"])
+            )
+
+        return count
+
+    def _apply_negatives(self, negatives: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create negative keywords grouped by (campaign, ad group, level).
+
+        Args:
+            negatives: Search term analyses flagged add_as_negative
+
+        Returns:
+            Error messages for groups or terms that failed
+        """
+        groups: Dict[Tuple[str, Optional[str], str], Dict[str, Dict[str, str]]] = {}
+        for analysis in negatives:
+            if not analysis["campaign_id"]:
+                continue
+            level = "adGroup" if analysis["ad_group_id"] else "campaign"
+            key = (analysis["campaign_id"], analysis["ad_group_id"], level)
+            # Dict keyed by term drops duplicates within a group
+            groups.setdefault(key, {})[analysis["search_term"]] = {
+                "text": analysis["search_term"],
+                "match_type": "negative_exact",
+            }
+
+        if not groups:
+            return []
+
+        keys = list(groups)
+        self.logger.info(
+            f"Creating {sum(len(groups[k]) for k in keys)} negatives "
+            f"in {len(keys)} groups..."
+        )
+        responses = self.ads_client.run_concurrently(
+            [
+                ("create_negative_keywords", {
+                    "campaign_id": campaign_id,
+                    "ad_group_id": ad_group_id,
+                    "keywords": list(groups[(campaign_id, ad_group_id, level)].values()),
+                    "level": level,
+                })
+                for campaign_id, ad_group_id, level in keys
+            ],
+            return_exceptions=True,
+        )
+
+        errors = []
+        for key, response in zip(keys, responses):
+            campaign_id, ad_group_id, level = key
+            if isinstance(response, Exception):
+                errors.append(
+                    f"Negatives for campaign {campaign_id} "
+                    f"ad group {ad_group_id} failed: {response}"
+                )
+                continue
+
+            entity_key = "campaignNegativeKeywords" if level == "campaign" else "negativeKeywords"
+            terms = list(groups[key])
+            for entry in response.get(entity_key, {}).get("error", []):
+                errors.append(
+                    f"Negative '{terms[entry['index']]}' failed: {entry['errors']}"
+                )
+
+        return errors
+
     def _log_summary(self, results: Dict[str, Any]):
         """Log a summary of optimization results."""
         self.logger.info("=" * 50)
@@ -376,7 +567,10 @@ def run_daily_optimization():
     import os
     import json
 
-    optimizer = BidOptimizer()
+    if os.getenv("USE_REPORT_STORE", "false").lower() == "true":
+        optimizer = BidOptimizer(AdvertisingClient(use_report_store=True))
+    else:
+        optimizer = BidOptimizer()
 
     # Check for dry run mode
     dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
@@ -4,10 +4,12 @@ Campaign Manager Module
 Handles PPC campaign creation and management via Amazon Advertising API.
 """
 
-import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..api.advertising_client import AdvertisingClient
+from .campaign_planner import CampaignPlanner
+from .campaign_reconciler import CampaignReconciler
 from ..utils.config_loader import ConfigLoader
 from ..utils.logger import LoggerMixin
 
@@ -79,7 +81,6 @@ class CampaignManager(LoggerMixin):
         for ag_config in campaign_config.get("ad_groups", []):
             ag_result = self._create_ad_group(campaign_id, ag_config, campaign_config)
             ad_groups_created.append(ag_result)
-            time.sleep(0.5)  # Rate limiting
 
         # Add negative keywords at campaign level
         neg_keywords = self.config.get_negative_keywords()
@@ -138,7 +139,6 @@ class CampaignManager(LoggerMixin):
         self._ad_group_ids[name] = ad_group_id
 
         # Add products to ad group
-        products_config = self.config.load_products()
         product_asins = campaign_config.get("products", [])
 
         for asin in product_asins:
@@ -150,7 +150,6 @@ class CampaignManager(LoggerMixin):
                     sku=product["sku"],
                     asin=asin,
                 )
-                time.sleep(0.2)
 
         # Handle auto vs manual targeting
         targeting_type = campaign_config.get("targeting_type", "auto")
@@ -195,39 +194,65 @@ class CampaignManager(LoggerMixin):
             level="campaign",
         )
 
-    def deploy_all_campaigns(self) -> Dict[str, Any]:
+    def deploy_all_campaigns(
+        self,
+        max_workers: int = 1,
+        bulk: bool = False,
+    ) -> Dict[str, Any]:
         """
         Deploy all campaigns from configuration.
 
+        Campaigns are independent, so with max_workers > 1 they are built
+        in parallel. Each campaign still creates its ad groups, product
+        ads and keywords only after its own parent exists, and all
+        workers share the client's rate limiter.
+
+        With bulk=True the whole configuration is created level by level
+        (campaigns, then ad groups, then their children) with one bulk
+        request per entity type and chunk; see CampaignPlanner.
+
+        Args:
+            max_workers: Number of campaigns deployed at the same time
+            bulk: Create entities with bulk requests per level
+
         Returns:
-            Deployment summary
+            Deployment summary (campaigns listed in config order)
         """
         campaigns_config = self.config.load_campaigns()
         campaigns = campaigns_config.get("campaigns", [])
 
+        if bulk:
+            results = CampaignPlanner(self.ads_client, self.config).deploy(campaigns)
+            for record in results["successful"]:
+                self._campaign_ids[record["name"]] = record["campaign_id"]
+                for ad_group in record["ad_groups"]:
+                    self._ad_group_ids[ad_group["name"]] = ad_group["ad_group_id"]
+            return results
+
         results = {
             "total": len(campaigns),
             "successful": [],
             "failed": [],
         }
 
-        for campaign_config in campaigns:
-            try:
-                result = self.create_campaign_from_config(campaign_config)
+        if max_workers > 1 and len(campaigns) > 1:
+            self.logger.info(
+                f"Deploying {len(campaigns)} campaigns with {max_workers} workers"
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(self._deploy_campaign, campaigns))
+        else:
+            outcomes = [self._deploy_campaign(c) for c in campaigns]
+
+        for campaign_config, (result, error) in zip(campaigns, outcomes):
+            if error is None:
                 results["successful"].append(result)
-                self.logger.info(f"Successfully created campaign: {campaign_config['name']}")
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to create campaign {campaign_config['name']}: {e}"
-                )
+            else:
                 results["failed"].append({
                     "name": campaign_config["name"],
-                    "error": str(e),
+                    "error": error,
                 })
 
-            # Rate limiting between campaigns
-            time.sleep(1)
-
         self.logger.info(
             f"Campaign deployment complete: {len(results['successful'])} successful, "
             f"{len(results['failed'])} failed"
@@ -235,6 +260,46 @@ class CampaignManager(LoggerMixin):
 
         return results
 
+    def reconcile_campaigns(self, archive_negatives: bool = False) -> Dict[str, Any]:
+        """
+        Apply only the changes needed to make the account match config.
+
+        The live state is read once and diffed against campaigns.json;
+        see CampaignReconciler for what is created, updated and archived.
+
+        Args:
+            archive_negatives: Also archive campaign negatives that are not
+                in the config (this removes optimizer-harvested negatives)
+
+        Returns:
+            Deployment summary, including "created", "updated" and write
+            "requests" counts (all zero when nothing changed)
+        """
+        campaigns = self.config.load_campaigns().get("campaigns", [])
+        results = CampaignReconciler(
+            self.ads_client, self.config, archive_negatives=archive_negatives,
+        ).reconcile(campaigns)
+        for record in results["successful"]:
+            self._campaign_ids[record["name"]] = record["campaign_id"]
+            for ad_group in record["ad_groups"]:
+                self._ad_group_ids[ad_group["name"]] = ad_group["ad_group_id"]
+        return results
+
+    def _deploy_campaign(
+        self,
+        campaign_config: Dict[str, Any],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Create one campaign, returning (result, error message)."""
+        try:
+            result = self.create_campaign_from_config(campaign_config)
+            self.logger.info(f"Successfully created campaign: {campaign_config['name']}")
+            return result, None
+        except Exception as e:
+            self.logger.error(
+                f"Failed to create campaign {campaign_config['name']}: {e}"
+            )
+            return None, str(e)
+
     def get_existing_campaigns(
         self,
         name_filter: Optional[str] = "Shelzys",
@@ -279,11 +344,8 @@ class CampaignManager(LoggerMixin):
         Returns:
             Campaign ID if exists, None otherwise
         """
-        campaigns = self.get_existing_campaigns(name_filter=name)
-        for campaign in campaigns:
-            if campaign.get("name") == name:
-                return campaign.get("campaignId")
-        return None
+        campaign = self.ads_client.find_campaign(name)
+        return campaign.get("campaignId") if campaign else None
 
     def validate_campaign_config(
         self,
@@ -334,6 +396,7 @@ class CampaignManager(LoggerMixin):
 
 def run_campaign_deployment():
     """Entry point for campaign deployment."""
+    import os
     import sys
 
     manager = CampaignManager()
@@ -360,16 +423,25 @@ def run_campaign_deployment():
         print("\nFix validation errors before deploying.")
         sys.exit(1)
 
-    # Check for existing campaigns
-    print("\nChecking for existing campaigns...")
-    for campaign_config in campaigns_config.get("campaigns", []):
-        existing_id = manager.check_campaign_exists(campaign_config["name"])
-        if existing_id:
-            print(f"  Campaign '{campaign_config['name']}' already exists (ID: {existing_id})")
-
-    # Deploy campaigns
-    print("\nDeploying campaigns...")
-    results = manager.deploy_all_campaigns()
+    if os.getenv("DEPLOY_RECONCILE", "false").lower() == "true":
+        # Existing campaigns are detected and reused by the reconciler
+        print("\nReconciling campaigns...")
+        results = manager.reconcile_campaigns()
+        print(f"  Created: {results['created']}, updated: {results['updated']}")
+    else:
+        # Check for existing campaigns
+        print("\nChecking for existing campaigns...")
+        for campaign_config in campaigns_config.get("campaigns", []):
+            existing_id = manager.check_campaign_exists(campaign_config["name"])
+            if existing_id:
+                print(f"  Campaign '{campaign_config['name']}' already exists (ID: {existing_id})")
+
+        # Deploy campaigns
+        print("\nDeploying campaigns...")
+        results = manager.deploy_all_campaigns(
+            max_workers=int(os.getenv("DEPLOY_WORKERS", "1")),
+            bulk=os.getenv("DEPLOY_BULK", "false").lower() == "true",
+        )
 
     print(f"\nDeployment Complete")
     print(f"  Successful: {len(results['successful'])}")
@@ -379,6 +451,8 @@ def run_campaign_deployment():
         print("\nCreated campaigns:")
         for success in results["successful"]:
             print(f"  - {success['name']} (ID: {success['campaign_id']})")
+            for error in success.get("errors", []):
+                print(f"      Error: {error}")
 
     if results["failed"]:
         print("\nFailed campaigns:")
@@ -0,0 +1,306 @@
+"""
+Campaign Planner Module
+
+Creates a whole campaign configuration with bulk requests, one level of
+the entity hierarchy at a time:
+1. All campaigns
+2. All ad groups of the campaigns that were created
+3. All product ads, keywords, auto targets and campaign negatives
+
+Returned IDs are mapped back to their config entries by request index,
+so the number of requests grows with levels and chunks rather than with
+the number of entities. Given a snapshot of the live account, entities
+that already exist are reused instead of created.
+"""
+
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..api.advertising_client import AdvertisingClient, parse_multi_status
+from ..utils.config_loader import ConfigLoader
+from ..utils.logger import LoggerMixin
+
+if TYPE_CHECKING:
+    from .campaign_reconciler import LiveState
+
+# (index of the owning campaign, label for error messages, request item)
+PlannedItem = Tuple[int, str, Dict[str, Any]]
+
+
+class CampaignPlanner(LoggerMixin):
+    """
+    Deploys campaigns level by level with bulk create requests.
+
+    Failures are reported per entity; children of a failed campaign or
+    ad group are skipped.
+    """
+
+    def __init__(
+        self,
+        advertising_client: AdvertisingClient,
+        config_loader: ConfigLoader,
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            advertising_client: Advertising API client instance
+            config_loader: Configuration loader instance
+        """
+        self.ads_client = advertising_client
+        self.config = config_loader
+
+        # Counters for the current deploy() run
+        self._requests = 0
+        self._written: Dict[str, int] = {"create_entities": 0, "update_entities": 0}
+
+    def deploy(
+        self,
+        campaigns: List[Dict[str, Any]],
+        live: Optional["LiveState"] = None,
+        updates: Optional[Dict[str, List[PlannedItem]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create every campaign in the configuration and its children.
+
+        Args:
+            campaigns: Campaign configs from campaigns.json
+            live: Snapshot of the account; entities found in it are not
+                created again and their IDs are used for children
+            updates: Update/archive items per entity type, sent before
+                any creates (owner indexes refer to `campaigns`)
+
+        Returns:
+            Deployment summary in the deploy_all_campaigns format, plus
+            per-campaign "errors" for child entities that failed, the
+            number of entities "created" and "updated", and the number
+            of write "requests" sent
+        """
+        records = [
+            {
+                "name": config["name"],
+                "campaign_id": live.campaign_id(config["name"]) if live else None,
+                "ad_groups": [],
+                "errors": [],
+            }
+            for config in campaigns
+        ]
+        self._requests = 0
+        self._written = {"create_entities": 0, "update_entities": 0}
+
+        if updates:
+            self._write_level(updates, records, "update_entities")
+
+        # Level 1: campaigns not in the account yet
+        planned = [
+            (i, f"Campaign {config['name']}", self.ads_client.campaign_item(
+                name=config["name"],
+                targeting_type=config.get("targeting_type", "auto"),
+                daily_budget=config.get("daily_budget", 10.0),
+                state=config.get("state", "enabled"),
+                bidding_strategy=config.get("bidding_strategy", "legacyForSales"),
+            ))
+            for i, config in enumerate(campaigns)
+            if not records[i]["campaign_id"]
+        ]
+        created = self._write_level({"campaigns": planned}, records)
+        for position, entry in created["campaigns"].items():
+            records[planned[position][0]]["campaign_id"] = entry.get("campaignId")
+
+        # Level 2: ad groups of campaigns that exist now
+        ad_groups: List[Tuple[int, Dict[str, Any]]] = [
+            (i, ag_config)
+            for i, config in enumerate(campaigns)
+            if records[i]["campaign_id"]
+            for ag_config in config.get("ad_groups", [])
+        ]
+        ad_group_ids: Dict[int, str] = {}
+        pending: List[int] = []
+        for position, (i, ag_config) in enumerate(ad_groups):
+            existing = (
+                live.ad_group_id(records[i]["campaign_id"], ag_config["name"])
+                if live else None
+            )
+            if existing:
+                ad_group_ids[position] = existing
+            else:
+                pending.append(position)
+
+        planned = []
+        for position in pending:
+            i, ag_config = ad_groups[position]
+            planned.append((i, f"Ad group {ag_config['name']}", self.ads_client.ad_group_item(
+                campaign_id=records[i]["campaign_id"],
+                name=ag_config["name"],
+                default_bid=ag_config.get("default_bid", 0.75),
+            )))
+        created = self._write_level({"adGroups": planned}, records)
+        for index, entry in created["adGroups"].items():
+            ad_group_ids[pending[index]] = entry.get("adGroupId")
+
+        for position in sorted(ad_group_ids):
+            i, ag_config = ad_groups[position]
+            records[i]["ad_groups"].append({
+                "name": ag_config["name"],
+                "ad_group_id": ad_group_ids[position],
+                "products": campaigns[i].get("products", []),
+            })
+
+        # Level 3: everything that hangs off an ad group or campaign
+        self._write_level(
+            self._plan_children(campaigns, records, ad_groups, ad_group_ids, live),
+            records,
+        )
+
+        results = {
+            "total": len(campaigns),
+            "successful": [],
+            "failed": [],
+            "created": self._written["create_entities"],
+            "updated": self._written["update_entities"],
+            "requests": self._requests,
+        }
+        for record in records:
+            if record["campaign_id"]:
+                record["status"] = "partial" if record["errors"] else "success"
+                results["successful"].append(record)
+            else:
+                results["failed"].append({
+                    "name": record["name"],
+                    "error": record["errors"][0] if record["errors"] else "Campaign not created",
+                })
+
+        self.logger.info(
+            f"Bulk deployment complete: {len(results['successful'])} successful, "
+            f"{len(results['failed'])} failed ({self._requests} requests)"
+        )
+        return results
+
+    def _plan_children(
+        self,
+        campaigns: List[Dict[str, Any]],
+        records: List[Dict[str, Any]],
+        ad_groups: List[Tuple[int, Dict[str, Any]]],
+        ad_group_ids: Dict[int, str],
+        live: Optional["LiveState"] = None,
+    ) -> Dict[str, List[PlannedItem]]:
+        """Build the product ad, keyword, target and negative batches."""
+        client = self.ads_client
+        batches: Dict[str, List[PlannedItem]] = {
+            "productAds": [],
+            "keywords": [],
+            "targetingClauses": [],
+            "campaignNegativeKeywords": [],
+        }
+
+        for position, ad_group_id in ad_group_ids.items():
+            if not ad_group_id:
+                continue
+            i, ag_config = ad_groups[position]
+            config = campaigns[i]
+            campaign_id = records[i]["campaign_id"]
+
+            for asin in config.get("products", []):
+                product = self.config.get_product_by_asin(asin)
+                if product and not (live and live.has_product_ad(ad_group_id, asin)):
+                    batches["productAds"].append((
+                        i,
+                        f"Product ad {asin}",
+                        client.product_ad_item(campaign_id, ad_group_id, product["sku"], asin),
+                    ))
+
+            if config.get("targeting_type", "auto") == "auto":
+                for group in ag_config.get("auto_targeting_groups", []):
+                    if live and live.has_target(ad_group_id, group["type"]):
+                        continue
+                    batches["targetingClauses"].append((
+                        i,
+                        f"Auto target {group['type']}",
+                        client.auto_target_item(campaign_id, ad_group_id, group),
+                    ))
+            else:
+                for keyword in ag_config.get("keywords", []):
+                    if live and live.has_keyword(ad_group_id, keyword):
+                        continue
+                    batches["keywords"].append((
+                        i,
+                        f"Keyword '{keyword['text']}'",
+                        client.keyword_item(campaign_id, ad_group_id, keyword),
+                    ))
+
+        negatives = self.config.get_negative_keywords()
+        for i, record in enumerate(records):
+            if not record["campaign_id"]:
+                continue
+            for keyword in negatives:
+                if live and live.has_campaign_negative(record["campaign_id"], keyword):
+                    continue
+                batches["campaignNegativeKeywords"].append((
+                    i,
+                    f"Negative '{keyword['text']}'",
+                    client.negative_keyword_item(record["campaign_id"], None, keyword),
+                ))
+
+        return {entity_type: items for entity_type, items in batches.items() if items}
+
+    def _write_level(
+        self,
+        batches: Dict[str, List[PlannedItem]],
+        records: List[Dict[str, Any]],
+        operation: str = "create_entities",
+    ) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """
+        Write one level of entities, sending each entity type in bulk.
+
+        Entity types within a level are independent and sent concurrently.
+        Errors are appended to the owning campaign record.
+
+        Args:
+            batches: Entity type -> planned items
+            records: Per-campaign result records
+            operation: Client method, create_entities or update_entities
+
+        Returns:
+            Entity type -> {position in batch: success entry}
+        """
+        written: Dict[str, Dict[int, Dict[str, Any]]] = {
+            entity_type: {} for entity_type in batches
+        }
+        batches = {entity_type: items for entity_type, items in batches.items() if items}
+        if not batches:
+            return written
+
+        entity_types = list(batches)
+        verb = "Creating" if operation == "create_entities" else "Updating"
+        for entity_type in entity_types:
+            count = len(batches[entity_type])
+            self.logger.info(f"{verb} {count} {entity_type}")
+            self._requests += math.ceil(count / self.ads_client.MAX_ENTITIES_PER_REQUEST)
+
+        responses = self.ads_client.run_concurrently(
+            [
+                (operation, {
+                    "entity_type": entity_type,
+                    "items": [item for _, _, item in batches[entity_type]],
+                })
+                for entity_type in entity_types
+            ],
+            return_exceptions=True,
+        )
+
+        for entity_type, response in zip(entity_types, responses):
+            items = batches[entity_type]
+            if isinstance(response, Exception):
+                successes: Dict[int, Dict[str, Any]] = {}
+                errors = {position: str(response) for position in range(len(items))}
+            else:
+                successes, errors = parse_multi_status(response, entity_type, len(items))
+
+            for position, (owner, label, _) in enumerate(items):
+                if position in errors:
+                    records[owner]["errors"].append(f"{label}: {errors[position]}")
+                else:
+                    written[entity_type][position] = successes.get(position, {})
+                    self._written[operation] += 1
+
+        return written
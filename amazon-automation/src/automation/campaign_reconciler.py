@@ -0,0 +1,357 @@
+"""
+Campaign Reconciler Module
+
+Brings the account in line with campaigns.json using the fewest writes:
+the live state is fetched once, diffed against the configuration, and
+only the missing, changed or removed entities are created, updated or
+archived. Re-running with an unchanged config makes no write calls.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..api.advertising_client import AdvertisingClient
+from ..utils.config_loader import ConfigLoader
+from ..utils.logger import LoggerMixin
+from .campaign_planner import CampaignPlanner, PlannedItem
+
+
+def _match_type(value: str) -> str:
+    """Normalize keyword match types (exact, NEGATIVE_EXACT -> EXACT)."""
+    return value.upper().replace("NEGATIVE_", "")
+
+
+class LiveState:
+    """
+    In-memory index of the active (enabled or paused) entities in the
+    account, keyed the way campaigns.json identifies them.
+    """
+
+    ENTITY_TYPES = (
+        "campaigns",
+        "adGroups",
+        "productAds",
+        "keywords",
+        "targetingClauses",
+        "campaignNegativeKeywords",
+    )
+
+    ACTIVE_FILTER = {"stateFilter": {"include": ["ENABLED", "PAUSED"]}}
+
+    # Auto targeting names used in campaigns.json -> v3 expression types
+    AUTO_TARGET_TYPES = {
+        "close-match": "QUERY_HIGH_REL_MATCHES",
+        "loose-match": "QUERY_BROAD_REL_MATCHES",
+        "substitutes": "ASIN_SUBSTITUTE_RELATED",
+        "complements": "ASIN_ACCESSORY_RELATED",
+    }
+
+    def __init__(self, entities: Dict[str, List[Dict[str, Any]]]):
+        """
+        Build the indexes.
+
+        Args:
+            entities: Entity type -> entities returned by list_entities
+        """
+        self.campaigns = {c["name"]: c for c in entities.get("campaigns", [])}
+        self.ad_groups = self._index(
+            entities.get("adGroups", []),
+            lambda ag: (str(ag["campaignId"]), ag["name"]),
+        )
+        self.product_ads = self._index(
+            entities.get("productAds", []),
+            lambda ad: (str(ad["adGroupId"]), ad.get("asin")),
+        )
+        self.keywords = self._index(
+            entities.get("keywords", []),
+            lambda kw: (
+                str(kw["adGroupId"]),
+                kw["keywordText"].lower(),
+                _match_type(kw["matchType"]),
+            ),
+        )
+        self.targets = self._index(
+            entities.get("targetingClauses", []),
+            lambda t: (
+                str(t["adGroupId"]),
+                self.target_type((t.get("expression") or [{}])[0].get("type", "")),
+            ),
+        )
+        self.campaign_negatives = self._index(
+            entities.get("campaignNegativeKeywords", []),
+            lambda kw: (
+                str(kw["campaignId"]),
+                kw["keywordText"].lower(),
+                _match_type(kw["matchType"]),
+            ),
+        )
+
+        # Index keys start with the parent ID; group them for child lookups
+        self._children: Dict[Tuple[int, str], List[Tuple[Tuple, Dict[str, Any]]]] = {}
+        for index in (
+            self.ad_groups, self.product_ads, self.keywords,
+            self.targets, self.campaign_negatives,
+        ):
+            for key, entity in index.items():
+                self._children.setdefault((id(index), key[0]), []).append((key, entity))
+
+    @staticmethod
+    def _index(entities: Iterable[Dict[str, Any]], key) -> Dict[Tuple, Dict[str, Any]]:
+        return {key(entity): entity for entity in entities}
+
+    def under(
+        self,
+        index: Dict[Tuple, Dict[str, Any]],
+        parent_id: str,
+    ) -> List[Tuple[Tuple, Dict[str, Any]]]:
+        """
+        Get the (key, entity) pairs of one index that belong to a parent.
+
+        Args:
+            index: One of the index attributes, e.g. self.keywords
+            parent_id: Campaign ID (ad groups, negatives) or ad group ID
+
+        Returns:
+            Matching (key, entity) pairs
+        """
+        return self._children.get((id(index), str(parent_id)), [])
+
+    @classmethod
+    def fetch(cls, client: AdvertisingClient) -> "LiveState":
+        """
+        Read every active entity type once, concurrently.
+
+        Args:
+            client: Advertising API client
+
+        Returns:
+            Indexed live state
+        """
+        lists = client.run_concurrently([
+            ("list_entities", {"entity_type": entity_type, "filters": cls.ACTIVE_FILTER})
+            for entity_type in cls.ENTITY_TYPES
+        ])
+        return cls(dict(zip(cls.ENTITY_TYPES, lists)))
+
+    @classmethod
+    def target_type(cls, value: str) -> str:
+        """Normalize an auto targeting type to its v3 expression type."""
+        return cls.AUTO_TARGET_TYPES.get(value.lower(), value).upper()
+
+    def campaign_id(self, name: str) -> Optional[str]:
+        """Get the ID of an active campaign by name."""
+        campaign = self.campaigns.get(name)
+        return str(campaign["campaignId"]) if campaign else None
+
+    def ad_group_id(self, campaign_id: str, name: str) -> Optional[str]:
+        """Get the ID of an active ad group by campaign and name."""
+        ad_group = self.ad_groups.get((str(campaign_id), name))
+        return str(ad_group["adGroupId"]) if ad_group else None
+
+    def has_product_ad(self, ad_group_id: str, asin: str) -> bool:
+        """Check for an active product ad for an ASIN in an ad group."""
+        return (str(ad_group_id), asin) in self.product_ads
+
+    def has_keyword(self, ad_group_id: str, keyword: Dict[str, Any]) -> bool:
+        """Check for an active keyword matching a keyword config."""
+        return self.keyword_key(ad_group_id, keyword) in self.keywords
+
+    def has_target(self, ad_group_id: str, target_type: str) -> bool:
+        """Check for an active auto target of a type in an ad group."""
+        return (str(ad_group_id), self.target_type(target_type)) in self.targets
+
+    def has_campaign_negative(self, campaign_id: str, keyword: Dict[str, Any]) -> bool:
+        """Check for an active campaign-level negative keyword."""
+        return self.keyword_key(campaign_id, keyword) in self.campaign_negatives
+
+    @staticmethod
+    def keyword_key(parent_id: str, keyword: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Build the index key for a keyword config under a parent."""
+        return (str(parent_id), keyword["text"].lower(), _match_type(keyword["match_type"]))
+
+
+class CampaignReconciler(LoggerMixin):
+    """
+    Reconciles campaigns.json against the live account.
+
+    Campaign budgets and states and ad group default bids follow the
+    config. Keyword and target bids and states are left alone once the
+    entity exists, since the bid optimizer manages them. Entities under a
+    configured campaign that are no longer in the config are archived;
+    campaigns missing from the config are not touched.
+
+    Campaign negative keywords are only ever added: the bid optimizer
+    harvests its own campaign-level negatives, which are indistinguishable
+    from removed config entries, so archiving them is opt-in.
+    """
+
+    def __init__(
+        self,
+        advertising_client: AdvertisingClient,
+        config_loader: ConfigLoader,
+        archive_negatives: bool = False,
+    ):
+        """
+        Initialize the reconciler.
+
+        Args:
+            advertising_client: Advertising API client instance
+            config_loader: Configuration loader instance
+            archive_negatives: Archive campaign negatives not in the config,
+                including ones the bid optimizer added
+        """
+        self.ads_client = advertising_client
+        self.config = config_loader
+        self.archive_negatives = archive_negatives
+
+    def reconcile(self, campaigns: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply only the changes needed to match the configuration.
+
+        Args:
+            campaigns: Campaign configs from campaigns.json
+
+        Returns:
+            Deployment summary from CampaignPlanner.deploy ("created",
+            "updated" and write "requests" are zero when nothing changed)
+        """
+        self.logger.info("Fetching live campaign state...")
+        live = LiveState.fetch(self.ads_client)
+
+        updates = self.diff(campaigns, live)
+        self.logger.info(
+            f"Reconcile plan: {sum(len(items) for items in updates.values())} "
+            f"updates/archives, creates for anything missing"
+        )
+
+        return CampaignPlanner(self.ads_client, self.config).deploy(
+            campaigns, live=live, updates=updates,
+        )
+
+    def diff(
+        self,
+        campaigns: List[Dict[str, Any]],
+        live: LiveState,
+    ) -> Dict[str, List[PlannedItem]]:
+        """
+        Find updates and archives for entities that already exist.
+
+        Args:
+            campaigns: Campaign configs from campaigns.json
+            live: Live account state
+
+        Returns:
+            Entity type -> update items (owner index, label, partial entity)
+        """
+        updates: Dict[str, List[PlannedItem]] = {
+            "campaigns": [],
+            "adGroups": [],
+            "productAds": [],
+            "keywords": [],
+            "targetingClauses": [],
+            "campaignNegativeKeywords": [],
+        }
+        negatives = {
+            LiveState.keyword_key("", kw)[1:] for kw in self.config.get_negative_keywords()
+        }
+
+        for i, config in enumerate(campaigns):
+            campaign_id = live.campaign_id(config["name"])
+            if not campaign_id:
+                continue
+
+            change = self._campaign_change(live.campaigns[config["name"]], config)
+            if change:
+                updates["campaigns"].append(
+                    (i, f"Campaign {config['name']}", {"campaignId": campaign_id, **change})
+                )
+
+            wanted_groups = {ag["name"]: ag for ag in config.get("ad_groups", [])}
+            for (_, name), ad_group in live.under(live.ad_groups, campaign_id):
+                ad_group_id = str(ad_group["adGroupId"])
+                ag_config = wanted_groups.get(name)
+                if ag_config is None:
+                    updates["adGroups"].append(
+                        (i, f"Ad group {name}", {"adGroupId": ad_group_id, "state": "archived"})
+                    )
+                    continue
+
+                default_bid = ag_config.get("default_bid", 0.75)
+                if abs(float(ad_group.get("defaultBid", 0)) - default_bid) > 0.005:
+                    updates["adGroups"].append(
+                        (i, f"Ad group {name}", {"adGroupId": ad_group_id, "defaultBid": default_bid})
+                    )
+
+                self._archive_extras(i, config, ag_config, ad_group_id, live, updates)
+
+            if not self.archive_negatives:
+                continue
+            for (_, text, match_type), negative in live.under(live.campaign_negatives, campaign_id):
+                if (text, match_type) not in negatives:
+                    updates["campaignNegativeKeywords"].append((
+                        i,
+                        f"Negative '{negative['keywordText']}'",
+                        {"keywordId": negative["keywordId"], "state": "archived"},
+                    ))
+
+        return {entity_type: items for entity_type, items in updates.items() if items}
+
+    @staticmethod
+    def _campaign_change(
+        campaign: Dict[str, Any],
+        config: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Get the budget/state fields that differ from the config."""
+        change: Dict[str, Any] = {}
+
+        budget = config.get("daily_budget", 10.0)
+        live_budget = (campaign.get("budget") or {}).get("budget")
+        if live_budget is None or abs(float(live_budget) - budget) > 0.005:
+            change["budget"] = {"budgetType": "DAILY", "budget": budget}
+
+        state = config.get("state", "enabled")
+        if str(campaign.get("state", "")).lower() != state.lower():
+            change["state"] = state
+
+        return change
+
+    def _archive_extras(
+        self,
+        owner: int,
+        config: Dict[str, Any],
+        ag_config: Dict[str, Any],
+        ad_group_id: str,
+        live: LiveState,
+        updates: Dict[str, List[PlannedItem]],
+    ):
+        """Queue archives for ad group children no longer in the config."""
+        asins = set(config.get("products", []))
+        for (_, asin), ad in live.under(live.product_ads, ad_group_id):
+            if asin not in asins:
+                updates["productAds"].append(
+                    (owner, f"Product ad {asin}", {"adId": ad["adId"], "state": "archived"})
+                )
+
+        manual = config.get("targeting_type", "auto") != "auto"
+        keywords = {
+            LiveState.keyword_key(ad_group_id, kw)
+            for kw in (ag_config.get("keywords", []) if manual else [])
+        }
+        for key, keyword in live.under(live.keywords, ad_group_id):
+            if key not in keywords:
+                updates["keywords"].append((
+                    owner,
+                    f"Keyword '{keyword['keywordText']}'",
+                    {"keywordId": keyword["keywordId"], "state": "archived"},
+                ))
+
+        targets = {
+            (ad_group_id, LiveState.target_type(group["type"]))
+            for group in (ag_config.get("auto_targeting_groups", []) if not manual else [])
+        }
+        for key, target in live.under(live.targets, ad_group_id):
+            if key not in targets:
+                updates["targetingClauses"].append((
+                    owner,
+                    f"Auto target {key[1]}",
+                    {"targetId": target["targetId"], "state": "archived"},
+                ))
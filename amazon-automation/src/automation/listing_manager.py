@@ -4,14 +4,45 @@ Listing Manager Module
 Handles pushing optimized listing content to Amazon via SP-API.
 """
 
+import hashlib
 import json
+import math
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from sp_api.base.exceptions import SellingApiNotFoundException
+
 from ..api.sp_api_client import SPAPIClient
 from ..utils.config_loader import ConfigLoader
 from ..utils.logger import LoggerMixin
 
 
+def latency_percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarize latencies with nearest-rank percentiles.
+
+    Args:
+        samples: Latencies in milliseconds
+
+    Returns:
+        p50, p90, p95, p99 and max (empty dict when there are no samples)
+    """
+    if not samples:
+        return {}
+
+    ordered = sorted(samples)
+    summary = {
+        f"p{p}": ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+        for p in (50, 90, 95, 99)
+    }
+    summary["max"] = ordered[-1]
+    return summary
+
+
 class ListingManager(LoggerMixin):
     """
     Manages Amazon product listings.
@@ -24,6 +55,7 @@ class ListingManager(LoggerMixin):
         self,
         sp_api_client: Optional[SPAPIClient] = None,
         config_loader: Optional[ConfigLoader] = None,
+        fingerprints: Optional["ListingFingerprints"] = None,
     ):
         """
         Initialize the Listing Manager.
@@ -31,9 +63,61 @@ class ListingManager(LoggerMixin):
         Args:
             sp_api_client: SP-API client instance
             config_loader: Configuration loader instance
+            fingerprints: Store of last pushed content per SKU
         """
         self.sp_api = sp_api_client or SPAPIClient()
         self.config = config_loader or ConfigLoader()
+        self.fingerprints = fingerprints or ListingFingerprints()
+
+    def _listing_content(self, product: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the update_listing_attributes arguments for a product."""
+        listing = product.get("listing", {})
+        products_config = self.config.load_products()
+
+        return {
+            "title": listing.get("title", ""),
+            "bullet_points": listing.get("bullet_points", []),
+            "description": listing.get("description", ""),
+            "search_terms": listing.get("search_terms", ""),
+            "brand": products_config.get("brand", "Shelzy's Designs"),
+        }
+
+    def listing_fingerprint(self, product: Dict[str, Any]) -> str:
+        """
+        Hash the SP-API payload a product's listing update would send.
+
+        Args:
+            product: Product config
+
+        Returns:
+            SHA-256 hex digest of the rendered product type and attributes
+        """
+        payload = {
+            "productType": self.sp_api.LISTING_PRODUCT_TYPE,
+            "attributes": self.sp_api.build_listing_attributes(**self._listing_content(product)),
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    @staticmethod
+    def _rejection(result: Dict[str, Any]) -> Optional[str]:
+        """
+        Explain why Amazon did not accept a Listings Items submission.
+
+        Rejected content still comes back as HTTP 200, with a status such
+        as "INVALID" and an issues list.
+
+        Args:
+            result: put/patch_listings_item response payload
+
+        Returns:
+            Error message, or None if the submission was ACCEPTED
+        """
+        status = (result or {}).get("status")
+        if status == "ACCEPTED":
+            return None
+        messages = [issue.get("message", "") for issue in (result or {}).get("issues", [])]
+        return f"Listing submission {status or 'not accepted'}: " + ("; ".join(messages) or "no issues reported")
 
     def update_listing(self, sku: str) -> Dict[str, Any]:
         """
@@ -50,28 +134,35 @@ class ListingManager(LoggerMixin):
         if not product:
             raise ValueError(f"Product with SKU {sku} not found in config")
 
-        listing = product.get("listing", {})
-        products_config = self.config.load_products()
-        brand = products_config.get("brand", "Shelzy's Designs")
-
         self.logger.info(f"Updating listing for SKU: {sku} ({product['name']})")
+        started = time.perf_counter()
 
         try:
             result = self.sp_api.update_listing_attributes(
                 sku=sku,
-                title=listing.get("title", ""),
-                bullet_points=listing.get("bullet_points", []),
-                description=listing.get("description", ""),
-                search_terms=listing.get("search_terms", ""),
-                brand=brand,
+                **self._listing_content(product),
             )
 
+            error = self._rejection(result)
+            if error:
+                self.logger.error(f"Amazon rejected listing for {sku}: {error}")
+                return {
+                    "sku": sku,
+                    "asin": product.get("asin"),
+                    "status": "failed",
+                    "error": error,
+                    "result": result,
+                    "latency_ms": (time.perf_counter() - started) * 1000,
+                }
+
+            self.fingerprints.set(sku, self.listing_fingerprint(product))
             self.logger.info(f"Successfully updated listing for {sku}")
             return {
                 "sku": sku,
                 "asin": product["asin"],
                 "status": "success",
                 "result": result,
+                "latency_ms": (time.perf_counter() - started) * 1000,
             }
 
         except Exception as e:
@@ -81,6 +172,81 @@ class ListingManager(LoggerMixin):
                 "asin": product.get("asin"),
                 "status": "failed",
                 "error": str(e),
+                "latency_ms": (time.perf_counter() - started) * 1000,
+            }
+
+    def patch_listing(self, sku: str) -> Dict[str, Any]:
+        """
+        Update a listing by patching only attributes that differ from the
+        live listing. Listings that do not exist yet get a full update.
+
+        Args:
+            sku: Product SKU to update
+
+        Returns:
+            Update result as from update_listing; status is "unchanged"
+            when the live listing already matches
+        """
+        product = self.config.get_product_by_sku(sku)
+
+        if not product:
+            raise ValueError(f"Product with SKU {sku} not found in config")
+
+        started = time.perf_counter()
+
+        try:
+            try:
+                live = self.sp_api.get_listing(sku)
+            except SellingApiNotFoundException:
+                self.logger.info(f"No live listing for {sku}; sending full update")
+                return self.update_listing(sku)
+
+            desired = self.sp_api.build_listing_attributes(**self._listing_content(product))
+            patches = self.sp_api.build_listing_patches(live.get("attributes") or {}, desired)
+
+            if not patches:
+                self.fingerprints.set(sku, self.listing_fingerprint(product))
+                self.logger.info(f"Live listing for {sku} already matches config")
+                return {
+                    "sku": sku,
+                    "asin": product.get("asin"),
+                    "status": "unchanged",
+                    "latency_ms": (time.perf_counter() - started) * 1000,
+                }
+
+            result = self.sp_api.patch_listing(sku, patches)
+
+            error = self._rejection(result)
+            if error:
+                self.logger.error(f"Amazon rejected listing patch for {sku}: {error}")
+                return {
+                    "sku": sku,
+                    "asin": product.get("asin"),
+                    "status": "failed",
+                    "error": error,
+                    "result": result,
+                    "latency_ms": (time.perf_counter() - started) * 1000,
+                }
+
+            self.fingerprints.set(sku, self.listing_fingerprint(product))
+            self.logger.info(f"Successfully patched listing for {sku}")
+            return {
+                "sku": sku,
+                "asin": product.get("asin"),
+                "status": "success",
+                "result": result,
+                "patched": [patch["path"].rsplit("/", 1)[-1] for patch in patches],
+                "latency_ms": (time.perf_counter() - started) * 1000,
+            }
+
+        except Exception as e:
+            self.logger.error(f"Failed to patch listing for {sku}: {e}")
+            return {
+                "sku": sku,
+                "asin": product.get("asin"),
+                "status": "failed",
+                "error": str(e),
+                "latency_ms": (time.perf_counter() - started) * 1000,
             }
 
     def update_listing_by_asin(self, asin: str) -> Dict[str, Any]:
@@ -100,12 +266,108 @@ class ListingManager(LoggerMixin):
 
         return self.update_listing(product["sku"])
 
-    def update_all_listings(self) -> Dict[str, Any]:
+    def listing_workers(self) -> int:
+        """Get the parallel pool size: the Listings Items API burst limit."""
+        return max(1, int(self.sp_api.RATE_LIMITS["listings"][1]))
+
+    def bulk_update_listings(self, skus: List[str]) -> List[Dict[str, Any]]:
+        """
+        Update listings through one JSON_LISTINGS_FEED instead of one
+        Listings Items call per SKU.
+
+        Args:
+            skus: Product SKUs to update
+
+        Returns:
+            Per-SKU results in the update_listing format; "latency_ms" is
+            the feed's submit-to-report turnaround
+
+        With a local feeds endpoint (SP_API_LOCAL_FEEDS) nothing reaches
+        Amazon, so accepted SKUs are not fingerprinted and a later real
+        sync still pushes them.
+        """
+        products = {}
+        for sku in skus:
+            product = self.config.get_product_by_sku(sku)
+            if not product:
+                raise ValueError(f"Product with SKU {sku} not found in config")
+            products[sku] = product
+
+        self.logger.info(f"Updating {len(products)} listings with one listings feed")
+        record = not self.sp_api.uses_local_feeds
+        if not record:
+            self.logger.info("Local feeds endpoint in use; fingerprints will not be recorded")
+        started = time.perf_counter()
+
+        try:
+            feed_results = self.sp_api.bulk_update_listings({
+                sku: self.sp_api.build_listing_attributes(**self._listing_content(product))
+                for sku, product in products.items()
+            })
+        except Exception as e:
+            self.logger.error(f"Listings feed failed: {e}")
+            latency_ms = (time.perf_counter() - started) * 1000
+            return [
+                {
+                    "sku": sku,
+                    "asin": product.get("asin"),
+                    "status": "failed",
+                    "error": str(e),
+                    "latency_ms": latency_ms,
+                }
+                for sku, product in products.items()
+            ]
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        outcomes = []
+        for sku, product in products.items():
+            feed_result = feed_results.get(sku, {"status": "failed", "issues": []})
+            if feed_result["status"] == "success":
+                if record:
+                    self.fingerprints.set(sku, self.listing_fingerprint(product))
+                outcomes.append({
+                    "sku": sku,
+                    "asin": product.get("asin"),
+                    "status": "success",
+                    "result": feed_result,
+                    "latency_ms": latency_ms,
+                })
+            else:
+                messages = [issue.get("message", "") for issue in feed_result["issues"]]
+                error = "; ".join(messages) or "No result reported for SKU"
+                self.logger.error(f"Failed to update listing for {sku}: {error}")
+                outcomes.append({
+                    "sku": sku,
+                    "asin": product.get("asin"),
+                    "status": "failed",
+                    "error": error,
+                    "latency_ms": latency_ms,
+                })
+        return outcomes
+
+    def update_all_listings(
+        self,
+        only_changed: bool = False,
+        parallel: bool = False,
+        bulk: bool = False,
+        patch: bool = False,
+    ) -> Dict[str, Any]:
         """
         Update all product listings from config.
 
+        Args:
+            only_changed: Skip SKUs whose rendered listing content matches
+                the last successful push
+            parallel: Submit updates from a thread pool sized to the
+                Listings Items API burst; requests stay paced by its rate
+            bulk: Send all updates in one JSON_LISTINGS_FEED (takes
+                precedence over parallel)
+            patch: Read each live listing (concurrently) and patch only the
+                attributes that differ; SKUs already matching are skipped
+
         Returns:
-            Summary of all update operations
+            Summary of all update operations; "skipped" lists unchanged SKUs
+            and "latency_ms" holds per-SKU latency percentiles
         """
         products_config = self.config.load_products()
         products = products_config.get("products", [])
@@ -114,38 +376,88 @@ class ListingManager(LoggerMixin):
             "total": len(products),
             "successful": [],
             "failed": [],
+            "skipped": [],
         }
 
+        pending = []
         for product in products:
             sku = product.get("sku")
             if not sku:
                 continue
 
-            result = self.update_listing(sku)
+            if only_changed and self.fingerprints.get(sku) == self.listing_fingerprint(product):
+                results["skipped"].append({"sku": sku, "asin": product.get("asin"), "reason": "unchanged"})
+                continue
 
-            if result["status"] == "success":
+            pending.append(sku)
+
+        if bulk and pending:
+            outcomes = self.bulk_update_listings(pending)
+        elif patch and pending:
+            with ThreadPoolExecutor(max_workers=self.listing_workers()) as executor:
+                outcomes = list(executor.map(self.patch_listing, pending))
+        elif parallel and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.listing_workers()) as executor:
+                outcomes = list(executor.map(self.update_listing, pending))
+        else:
+            outcomes = [self.update_listing(sku) for sku in pending]
+
+        for result in outcomes:
+            if result["status"] == "unchanged":
+                results["skipped"].append(
+                    {"sku": result["sku"], "asin": result["asin"], "reason": "matches_live"}
+                )
+            elif result["status"] == "success":
                 results["successful"].append(result)
             else:
                 results["failed"].append(result)
 
+        self.fingerprints.save()
+
+        results["latency_ms"] = latency_percentiles(
+            [r["latency_ms"] for r in outcomes if r["status"] != "unchanged"]
+        )
         self.logger.info(
             f"Listing update complete: {len(results['successful'])} successful, "
-            f"{len(results['failed'])} failed"
+            f"{len(results['failed'])} failed, {len(results['skipped'])} unchanged"
         )
+        if results["latency_ms"]:
+            self.logger.info(
+                "Listing update latency: "
+                + ", ".join(f"{k} {v:.0f}ms" for k, v in results["latency_ms"].items())
+            )
 
         return results
 
-    def sync_listings(self) -> Dict[str, Any]:
+    def sync_listings(
+        self,
+        force: bool = False,
+        parallel: bool = False,
+        bulk: bool = False,
+        patch: bool = False,
+    ) -> Dict[str, Any]:
         """
         Sync all listings to ensure content matches config.
-        Same as update_all_listings but intended for scheduled runs.
+        Only SKUs whose content changed since their last successful push
+        are sent, unless force is set.
+
+        Args:
+            force: Push every listing regardless of fingerprints
+            parallel: Submit updates concurrently (see update_all_listings)
+            bulk: Send updates as one listings feed (see update_all_listings)
+            patch: Patch only attributes that differ from the live listing
 
         Returns:
             Sync results
         """
-        self.logger.info("Starting scheduled listing sync")
-        self.config.reload_all()  # Reload config to get latest changes
-        return self.update_all_listings()
+        self.logger.info(
+            f"Starting scheduled listing sync "
+            f"(force: {force}, parallel: {parallel}, bulk: {bulk}, patch: {patch})"
+        )
+        # ConfigLoader re-reads products.json whenever it changes on disk
+        return self.update_all_listings(
+            only_changed=not force, parallel=parallel, bulk=bulk, patch=patch
+        )
 
     def validate_listing_content(self, sku: str) -> Dict[str, Any]:
         """
@@ -251,6 +563,56 @@ class ListingManager(LoggerMixin):
             return {"sku": sku, "status": "error", "error": str(e)}
 
 
+class ListingFingerprints:
+    """
+    Remembers the content fingerprint of each SKU's last successful push.
+
+    Stores {sku: fingerprint} in a JSON file.
+    """
+
+    def __init__(self, fingerprint_file: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            fingerprint_file: Path to the JSON file. Defaults to
+                LISTING_FINGERPRINT_FILE or .cache/listing_fingerprints.json
+                in the project directory.
+        """
+        self.fingerprint_file = Path(
+            fingerprint_file
+            or os.getenv("LISTING_FINGERPRINT_FILE")
+            or Path(__file__).parent.parent.parent / ".cache" / "listing_fingerprints.json"
+        )
+
+        try:
+            with open(self.fingerprint_file, "r") as f:
+                self._fingerprints: Dict[str, str] = json.load(f)
+        except (OSError, ValueError):
+            self._fingerprints = {}
+
+    def get(self, sku: str) -> Optional[str]:
+        """Get the fingerprint of a SKU's last successful push."""
+        return self._fingerprints.get(sku)
+
+    def set(self, sku: str, fingerprint: str):
+        """Record the fingerprint of a successful push."""
+        self._fingerprints[sku] = fingerprint
+
+    def save(self):
+        """Write fingerprints to the file."""
+        self.fingerprint_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.fingerprint_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._fingerprints, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.fingerprint_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
 def run_listing_sync():
     """Entry point for scheduled listing sync."""
     import sys
@@ -266,11 +628,19 @@ def run_listing_sync():
         sys.exit(1)
 
     # Perform sync
-    results = manager.sync_listings()
+    force = os.getenv("FORCE_LISTING_SYNC", "false").lower() == "true"
+    parallel = os.getenv("LISTING_SYNC_PARALLEL", "false").lower() == "true"
+    bulk = os.getenv("LISTING_SYNC_BULK", "false").lower() == "true"
+    patch = os.getenv("LISTING_SYNC_PATCH", "false").lower() == "true"
+    results = manager.sync_listings(force=force, parallel=parallel, bulk=bulk, patch=patch)
 
     print(f"\nListing Sync Complete")
+    print(f"  Pushed: {len(results['successful']) + len(results['failed'])}")
+    print(f"  Skipped (unchanged): {len(results['skipped'])}")
     print(f"  Successful: {len(results['successful'])}")
     print(f"  Failed: {len(results['failed'])}")
+    if results["latency_ms"]:
+        print("  Latency: " + ", ".join(f"{k} {v:.0f}ms" for k, v in results["latency_ms"].items()))
 
     if results["failed"]:
         print("\nFailed updates:")
@@ -6,10 +6,16 @@ Targets orders delivered 5-25 days ago.
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import json
+import os
+import sqlite3
+import tempfile
+import threading
 import time
 
-from ..api.sp_api_client import SPAPIClient
+from ..api.sp_api_client import SPAPIClient, send_review_requests
 from ..utils.config_loader import ConfigLoader
 from ..utils.logger import LoggerMixin
 
@@ -26,6 +32,7 @@ class ReviewRequester(LoggerMixin):
         self,
         sp_api_client: Optional[SPAPIClient] = None,
         config_loader: Optional[ConfigLoader] = None,
+        eligibility_cache: Optional["EligibilityCache"] = None,
     ):
         """
         Initialize the Review Requester.
@@ -33,6 +40,7 @@ class ReviewRequester(LoggerMixin):
         Args:
             sp_api_client: SP-API client instance
             config_loader: Configuration loader instance
+            eligibility_cache: Cache of per-order eligibility lookups
         """
         self.sp_api = sp_api_client or SPAPIClient()
         self.config = config_loader or ConfigLoader()
@@ -45,6 +53,16 @@ class ReviewRequester(LoggerMixin):
         self.max_days = review_settings.get("max_days_after_delivery", 25)
         self.batch_size = review_settings.get("batch_size", 50)
         self.delay_ms = review_settings.get("delay_between_requests_ms", 1000)
+        self.max_workers = review_settings.get("max_workers", 1)
+
+        # Check eligibility before sending so ineligible orders cost no
+        # solicitation attempt
+        if review_settings.get("precheck_eligibility", True):
+            self.eligibility_cache = eligibility_cache or EligibilityCache(
+                ttl_hours=review_settings.get("eligibility_cache_hours", 12),
+            )
+        else:
+            self.eligibility_cache = None
 
     def get_eligible_orders(self) -> List[Dict[str, Any]]:
         """
@@ -86,6 +104,7 @@ class ReviewRequester(LoggerMixin):
         self,
         max_requests: Optional[int] = None,
         dry_run: bool = False,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Run the review request process.
@@ -93,6 +112,9 @@ class ReviewRequester(LoggerMixin):
         Args:
             max_requests: Maximum number of requests to send (None = no limit)
             dry_run: If True, find orders but don't send requests
+            max_workers: Requests in flight at once (defaults to the
+                max_workers setting); above 1 requests are paced by the
+                Solicitations rate limit instead of a fixed delay
 
         Returns:
             Summary of results
@@ -120,32 +142,40 @@ class ReviewRequester(LoggerMixin):
                 self.logger.info("No eligible orders found")
                 return results
 
-            # Apply batch size limit
-            if self.batch_size:
-                eligible_orders = eligible_orders[: self.batch_size]
-
-            # Apply max requests limit
-            if max_requests:
-                eligible_orders = eligible_orders[:max_requests]
-
-            self.logger.info(f"Processing {len(eligible_orders)} orders")
-
-            # Process each order
-            for order in eligible_orders:
-                order_id = order.get("AmazonOrderId")
-
-                if not order_id:
-                    continue
-
-                if dry_run:
-                    results["skipped"].append({
-                        "order_id": order_id,
-                        "reason": "dry_run",
-                    })
-                    continue
-
-                # Send review request
-                result = self.request_review(order_id)
+            order_ids = [
+                order["AmazonOrderId"]
+                for order in eligible_orders
+                if order.get("AmazonOrderId")
+            ]
+
+            # Apply batch size and max requests limits
+            limits = [limit for limit in (self.batch_size, max_requests) if limit]
+            limit = min(limits) if limits else None
+            workers = max_workers or self.max_workers
+
+            if self.eligibility_cache is not None:
+                order_ids, ineligible = self._select_eligible(order_ids, limit, workers)
+                results["skipped"] = [
+                    {"order_id": order_id, "reason": "not_eligible"}
+                    for order_id in ineligible
+                ]
+            elif limit:
+                order_ids = order_ids[:limit]
+
+            self.logger.info(f"Processing {len(order_ids)} orders")
+
+            if dry_run:
+                results["skipped"].extend(
+                    {"order_id": order_id, "reason": "dry_run"}
+                    for order_id in order_ids
+                )
+                order_ids = []
+
+            # Send review requests
+            sent = send_review_requests(
+                self.request_review, order_ids, self.delay_ms, workers
+            )
+            for order_id, result in sent:
                 results["requests_sent"] += 1
 
                 if result.get("status") == "success":
@@ -156,8 +186,12 @@ class ReviewRequester(LoggerMixin):
                         "error": result.get("error"),
                     })
 
-                # Rate limiting
-                time.sleep(self.delay_ms / 1000)
+            if self.eligibility_cache is not None:
+                # A solicitation can only be sent once per order
+                self.eligibility_cache.update(
+                    {order_id: False for order_id in results["successful"]}
+                )
+                self.eligibility_cache.save()
 
         except Exception as e:
             self.logger.error(f"Review request process error: {e}")
@@ -168,6 +202,64 @@ class ReviewRequester(LoggerMixin):
 
         return results
 
+    def _select_eligible(
+        self,
+        order_ids: List[str],
+        limit: Optional[int],
+        max_workers: int,
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Pick up to limit orders that can be sent a review request.
+
+        Orders are checked in batches just large enough to fill the
+        remaining slots, so lookups stop once the limit is reached.
+        Orders whose lookup failed are kept and attempted as before.
+
+        Args:
+            order_ids: Candidate order IDs in priority order
+            limit: Maximum orders to select (None = no limit)
+            max_workers: Eligibility lookups in flight at once
+
+        Returns:
+            (selected order IDs, order IDs found ineligible)
+        """
+        selected: List[str] = []
+        ineligible: List[str] = []
+        position = 0
+
+        while position < len(order_ids) and (limit is None or len(selected) < limit):
+            size = len(order_ids) if limit is None else limit - len(selected)
+            batch = order_ids[position: position + size]
+            position += len(batch)
+
+            for order_id, eligible in self._check_eligibility(batch, max_workers).items():
+                (ineligible if eligible is False else selected).append(order_id)
+
+        if ineligible:
+            self.logger.info(f"Skipping {len(ineligible)} orders not eligible for review requests")
+        return selected, ineligible
+
+    def _check_eligibility(
+        self,
+        order_ids: List[str],
+        max_workers: int,
+    ) -> Dict[str, Optional[bool]]:
+        """Look up eligibility, using cached results that have not expired."""
+        cache = self.eligibility_cache
+        known = {order_id: cache.get(order_id) for order_id in order_ids}
+        missing = [order_id for order_id, eligible in known.items() if eligible is None]
+
+        if missing:
+            checked = self.sp_api.check_review_eligibility(missing, max_workers=max_workers)
+            cache.update({
+                order_id: eligible
+                for order_id, eligible in checked.items()
+                if eligible is not None
+            })
+            known.update(checked)
+
+        return known
+
     def _log_summary(self, results: Dict[str, Any]):
         """Log a summary of the review request process."""
         self.logger.info("=" * 50)
@@ -206,48 +298,176 @@ class ReviewRequester(LoggerMixin):
         }
 
 
+class EligibilityCache:
+    """
+    Caches per-order review eligibility with an expiry.
+
+    Stores {order_id: {"eligible", "checked_at"}} in a JSON file so reruns
+    within the expiry skip the getSolicitationActionsForOrder lookup.
+    """
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        ttl_hours: float = 12,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_file: Path to cache file. Defaults to ELIGIBILITY_CACHE_FILE
+                or .cache/review_eligibility.json in the project directory.
+            ttl_hours: Hours a lookup result stays valid
+            clock: Wall clock function
+        """
+        self.cache_file = Path(
+            cache_file
+            or os.getenv("ELIGIBILITY_CACHE_FILE")
+            or Path(__file__).parent.parent.parent / ".cache" / "review_eligibility.json"
+        )
+        self.ttl = ttl_hours * 3600
+        self._clock = clock
+
+        try:
+            with open(self.cache_file, "r") as f:
+                self._entries: Dict[str, Dict[str, Any]] = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+        return self._clock() - entry.get("checked_at", 0) >= self.ttl
+
+    def get(self, order_id: str) -> Optional[bool]:
+        """Get a cached eligibility result, or None if unknown or expired."""
+        entry = self._entries.get(order_id)
+        if entry is None or self._is_expired(entry):
+            return None
+        return entry["eligible"]
+
+    def update(self, results: Dict[str, bool]):
+        """Record eligibility results checked now."""
+        now = self._clock()
+        for order_id, eligible in results.items():
+            self._entries[order_id] = {"eligible": bool(eligible), "checked_at": now}
+
+    def save(self):
+        """Write unexpired entries to the cache file."""
+        self._entries = {
+            order_id: entry
+            for order_id, entry in self._entries.items()
+            if not self._is_expired(entry)
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.cache_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
 class ReviewRequestTracker:
     """
     Tracks review request history to avoid duplicate requests.
 
-    Stores request history in a JSON file.
+    Stores request history in a SQLite database (WAL mode) keyed by order
+    ID with an index on the request timestamp. Writes are committed in
+    batches; call flush() or close() (or use the tracker as a context
+    manager) to commit the remainder.
     """
 
-    def __init__(self, history_file: str = "review_request_history.json"):
+    def __init__(
+        self,
+        db_file: str = "review_requests.db",
+        history_file: Optional[str] = "review_request_history.json",
+        commit_every: int = 100,
+    ):
         """
         Initialize the tracker.
 
         Args:
-            history_file: Path to history file
+            db_file: Path to the SQLite database
+            history_file: Legacy JSON history imported once into a new
+                database (None to skip)
+            commit_every: Recorded requests per commit
         """
-        import json
-        from pathlib import Path
+        self.db_file = Path(db_file)
+        self.commit_every = commit_every
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS review_requests (
+                order_id TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_review_requests_timestamp "
+            "ON review_requests (timestamp)"
+        )
+        self._conn.commit()
 
-        self.history_file = Path(history_file)
-        self._history: Dict[str, Any] = {}
+        # user_version marks that the legacy JSON history was imported
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0:
+            if history_file and Path(history_file).exists():
+                self.import_json(history_file)
+            self._conn.execute("PRAGMA user_version = 1")
+            self._conn.commit()
 
-        self._load_history()
+    def __enter__(self) -> "ReviewRequestTracker":
+        return self
 
-    def _load_history(self):
-        """Load history from file."""
-        import json
+    def __exit__(self, *exc_info):
+        self.close()
 
-        if self.history_file.exists():
-            with open(self.history_file, "r") as f:
-                self._history = json.load(f)
-        else:
-            self._history = {"requests": {}}
+    def import_json(self, history_file: str) -> int:
+        """
+        Import requests from a JSON history file.
 
-    def _save_history(self):
-        """Save history to file."""
-        import json
+        Existing rows for the same orders are kept.
 
-        with open(self.history_file, "w") as f:
-            json.dump(self._history, f, indent=2)
+        Args:
+            history_file: Path to a {"requests": {order_id: {...}}} file
+
+        Returns:
+            Number of requests imported
+        """
+        with open(history_file, "r") as f:
+            requests = json.load(f).get("requests", {})
+
+        rows = [
+            (order_id, data.get("timestamp", ""), data.get("status", ""), data.get("error"))
+            for order_id, data in requests.items()
+        ]
+        with self._lock:
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO review_requests "
+                "(order_id, timestamp, status, error) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return cursor.rowcount
 
     def has_been_requested(self, order_id: str) -> bool:
         """Check if an order has already been requested."""
-        return order_id in self._history.get("requests", {})
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM review_requests WHERE order_id = ?", (order_id,)
+            ).fetchone()
+        return row is not None
 
     def record_request(
         self,
@@ -256,52 +476,54 @@ class ReviewRequestTracker:
         error: Optional[str] = None,
     ):
         """Record a review request."""
-        if "requests" not in self._history:
-            self._history["requests"] = {}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO review_requests "
+                "(order_id, timestamp, status, error) VALUES (?, ?, ?, ?)",
+                (order_id, datetime.utcnow().isoformat(), status, error),
+            )
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self._commit()
 
-        self._history["requests"][order_id] = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "status": status,
-            "error": error,
-        }
+    def flush(self):
+        """Commit recorded requests."""
+        with self._lock:
+            self._commit()
 
-        self._save_history()
+    def _commit(self):
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self):
+        """Commit and close the database."""
+        with self._lock:
+            self._commit()
+            self._conn.close()
 
     def get_recent_requests(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get requests from the last N days."""
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        recent = []
-
-        for order_id, data in self._history.get("requests", {}).items():
-            try:
-                request_time = datetime.fromisoformat(data["timestamp"])
-                if request_time >= cutoff:
-                    recent.append({
-                        "order_id": order_id,
-                        **data,
-                    })
-            except (ValueError, KeyError):
-                continue
-
-        return recent
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT order_id, timestamp, status, error FROM review_requests "
+                "WHERE timestamp >= ? ORDER BY timestamp",
+                (cutoff,),
+            ).fetchall()
+
+        return [
+            {"order_id": order_id, "timestamp": timestamp, "status": status, "error": error}
+            for order_id, timestamp, status, error in rows
+        ]
 
     def cleanup_old_requests(self, days: int = 90):
         """Remove requests older than N days."""
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        cleaned = 0
-
-        requests = self._history.get("requests", {}).copy()
-        for order_id, data in requests.items():
-            try:
-                request_time = datetime.fromisoformat(data["timestamp"])
-                if request_time < cutoff:
-                    del self._history["requests"][order_id]
-                    cleaned += 1
-            except (ValueError, KeyError):
-                continue
-
-        if cleaned:
-            self._save_history()
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        with self._lock:
+            cleaned = self._conn.execute(
+                "DELETE FROM review_requests WHERE timestamp < ?", (cutoff,)
+            ).rowcount
+            self._commit()
 
         return cleaned
 
@@ -316,6 +538,7 @@ def run_daily_review_requests():
     # Check for dry run mode
     dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
     max_requests = int(os.getenv("MAX_REQUESTS", "0")) or None
+    max_workers = int(os.getenv("REVIEW_WORKERS", "0")) or None
 
     print("Running review request automation...")
     print(f"  Min days after delivery: {requester.min_days}")
@@ -329,6 +552,7 @@ def run_daily_review_requests():
     results = requester.run_review_requests(
         max_requests=max_requests,
         dry_run=dry_run,
+        max_workers=max_workers,
     )
 
     # Print summary
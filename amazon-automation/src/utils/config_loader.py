@@ -7,11 +7,17 @@ Handles loading and validation of JSON configuration files.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class ConfigLoader:
-    """Loads and manages configuration files for the automation system."""
+    """
+    Loads and manages configuration files for the automation system.
+
+    Loaded configs are cached until their file's mtime or size changes, so
+    edits are picked up without an explicit reload. Product lookups by
+    ASIN, SKU and type use indexes built once per products load.
+    """
 
     def __init__(self, config_dir: Optional[str] = None):
         """
@@ -27,11 +33,18 @@ class ConfigLoader:
             self.config_dir = Path(__file__).parent.parent.parent / "config"
 
         self._cache: Dict[str, Any] = {}
+        # (mtime_ns, size) of each cached file when it was read
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        # (products config the index was built from, index)
+        self._product_index: Optional[Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]] = None
 
     def load(self, config_name: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Load a configuration file.
 
+        A cached config is reused only while the file's mtime and size are
+        unchanged; otherwise it is read again.
+
         Args:
             config_name: Name of the config file (without .json extension)
             use_cache: Whether to use cached config if available
@@ -43,19 +56,23 @@ class ConfigLoader:
             FileNotFoundError: If config file doesn't exist
             json.JSONDecodeError: If config file is invalid JSON
         """
-        if use_cache and config_name in self._cache:
-            return self._cache[config_name]
-
         config_path = self.config_dir / f"{config_name}.json"
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        if use_cache and config_name in self._cache and self._stamps.get(config_name) == stamp:
+            return self._cache[config_name]
 
         with open(config_path, "r", encoding="utf-8") as f:
             config = json.load(f)
 
         if use_cache:
             self._cache[config_name] = config
+            self._stamps[config_name] = stamp
 
         return config
 
@@ -71,6 +88,31 @@ class ConfigLoader:
         """Load the settings configuration."""
         return self.load("settings")
 
+    def _products_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the product indexes for the current products config.
+
+        Returns:
+            Dict with "asin" and "sku" (key -> first matching product) and
+            "type" (type -> products) maps
+        """
+        products_config = self.load_products()
+        cached = self._product_index
+        if cached is not None and cached[0] is products_config:
+            return cached[1]
+
+        index: Dict[str, Dict[str, Any]] = {"asin": {}, "sku": {}, "type": {}}
+        for product in products_config.get("products", []):
+            # First product wins when an ASIN or SKU repeats
+            if product.get("asin") is not None:
+                index["asin"].setdefault(product["asin"], product)
+            if product.get("sku") is not None:
+                index["sku"].setdefault(product["sku"], product)
+            index["type"].setdefault(product.get("type"), []).append(product)
+
+        self._product_index = (products_config, index)
+        return index
+
     def get_product_by_asin(self, asin: str) -> Optional[Dict[str, Any]]:
         """
         Get product configuration by ASIN.
@@ -81,11 +123,7 @@ class ConfigLoader:
         Returns:
             Product configuration dictionary or None if not found
         """
-        products_config = self.load_products()
-        for product in products_config.get("products", []):
-            if product.get("asin") == asin:
-                return product
-        return None
+        return self._products_index()["asin"].get(asin)
 
     def get_product_by_sku(self, sku: str) -> Optional[Dict[str, Any]]:
         """
@@ -97,27 +135,27 @@ class ConfigLoader:
         Returns:
             Product configuration dictionary or None if not found
         """
-        products_config = self.load_products()
-        for product in products_config.get("products", []):
-            if product.get("sku") == sku:
-                return product
-        return None
+        return self._products_index()["sku"].get(sku)
+
+    def get_products_by_type(self, product_type: str) -> List[Dict[str, Any]]:
+        """
+        Get all products of a type.
+
+        Args:
+            product_type: Product type, e.g. "personalized" or "blank"
+
+        Returns:
+            Matching products in config order
+        """
+        return list(self._products_index()["type"].get(product_type, []))
 
     def get_personalized_products(self) -> list:
         """Get all personalized (non-blank) products."""
-        products_config = self.load_products()
-        return [
-            p for p in products_config.get("products", [])
-            if p.get("type") == "personalized"
-        ]
+        return self.get_products_by_type("personalized")
 
     def get_blank_products(self) -> list:
         """Get all blank/sublimation products."""
-        products_config = self.load_products()
-        return [
-            p for p in products_config.get("products", [])
-            if p.get("type") == "blank"
-        ]
+        return self.get_products_by_type("blank")
 
     def get_campaign_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -148,9 +186,16 @@ class ConfigLoader:
     def clear_cache(self):
         """Clear the configuration cache."""
         self._cache.clear()
+        self._stamps.clear()
+        self._product_index = None
 
     def reload_all(self):
-        """Reload all configurations from disk."""
+        """
+        Reload all configurations from disk.
+
+        Not needed to pick up edits (changed files are re-read on load);
+        use it to re-read files that changed without a new mtime or size.
+        """
         self.clear_cache()
         self.load_products()
         self.load_campaigns()
@@ -0,0 +1,18 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+from src.api import token_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_token_cache(tmp_path, monkeypatch):
+    """Give every test its own local caches and no token refresh timers."""
+    monkeypatch.setenv("TOKEN_CACHE_DIR", str(tmp_path / "tokens"))
+    monkeypatch.setenv("ORDER_STORE_DIR", str(tmp_path / "orders"))
+    monkeypatch.setenv("ELIGIBILITY_CACHE_FILE", str(tmp_path / "review_eligibility.json"))
+    monkeypatch.setenv("LISTING_FINGERPRINT_FILE", str(tmp_path / "listing_fingerprints.json"))
+    monkeypatch.setenv("TOKEN_BACKGROUND_REFRESH", "false")
+    monkeypatch.setattr(token_cache, "_shared_cache", None)
@@ -0,0 +1,354 @@
+"""
+Tests for Advertising API Client
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from unittest.mock import Mock
+
+from src.api.advertising_client import AdvertisingClient
+from src.api.async_advertising_client import AsyncAdvertisingClient
+from src.api.http_transport import PooledTransport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"ok": True}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Run a local keep-alive HTTP server for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledTransport:
+    """Test suite for the pooled HTTP transport."""
+
+    def test_connections_are_reused(self, local_server):
+        """Sequential requests to one host share a single connection."""
+        with PooledTransport() as transport:
+            for _ in range(5):
+                assert transport.get(f"{local_server}/ping").json() == {"ok": True}
+
+            stats = transport.stats()
+
+        assert stats["requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+
+    def test_keep_alive_disabled_opens_new_connections(self, local_server):
+        """Disabling keep-alive forces a connection per request."""
+        with PooledTransport(keep_alive=False) as transport:
+            for _ in range(3):
+                transport.get(f"{local_server}/ping")
+
+            stats = transport.stats()
+
+        assert stats["connections_opened"] == 3
+        assert stats["connections_reused"] == 0
+
+    def test_default_headers(self):
+        """Compression and keep-alive headers are set on the session."""
+        transport = PooledTransport()
+        assert transport.session.headers["Accept-Encoding"] == "gzip, deflate"
+        assert transport.session.headers["Connection"] == "keep-alive"
+
+        transport = PooledTransport(compression=False)
+        assert transport.session.headers["Accept-Encoding"] == "identity"
+
+
+class TestAdvertisingClientTransport:
+    """Test that every client call goes through the shared transport."""
+
+    @pytest.fixture
+    def transport(self):
+        transport = Mock(spec=PooledTransport)
+        token_response = Mock(status_code=200)
+        token_response.json.return_value = {"access_token": "tok", "expires_in": 3600}
+        transport.post.return_value = token_response
+        return transport
+
+    @pytest.fixture
+    def client(self, transport):
+        return AdvertisingClient(
+            client_id="cid",
+            client_secret="secret",
+            refresh_token="refresh",
+            profile_id="123",
+            transport=transport,
+        )
+
+    def test_token_refresh_uses_transport(self, client, transport):
+        """Token refresh is sent through the pooled transport."""
+        assert client._get_access_token() == "tok"
+        assert transport.post.call_args[0][0] == AdvertisingClient.TOKEN_URL
+
+    def test_make_request_uses_transport(self, client, transport):
+        """API requests are sent through the pooled transport."""
+        response = Mock(status_code=200, text='{"campaigns": []}')
+        response.json.return_value = {"campaigns": []}
+        transport.request.return_value = response
+
+        assert client.get_campaigns() == []
+        transport.request.assert_called_once()
+        assert transport.request.call_args[1]["method"] == "POST"
+
+
+class TestAsyncAdvertisingClient:
+    """Test suite for the asyncio client wrapper."""
+
+    @pytest.fixture
+    def client(self):
+        return AdvertisingClient(
+            client_id="cid",
+            client_secret="secret",
+            refresh_token="refresh",
+            profile_id="123",
+            transport=Mock(spec=PooledTransport),
+            max_concurrency=3,
+        )
+
+    def test_concurrency_is_bounded(self, client):
+        """No more than max_concurrency calls run at the same time."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_update(keyword_id, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return {"keywordId": keyword_id}
+
+        client.update_keyword = fake_update
+        calls = [("update_keyword", {"keyword_id": str(i)}) for i in range(12)]
+
+        results = client.run_concurrently(calls)
+
+        assert [r["keywordId"] for r in results] == [str(i) for i in range(12)]
+        assert state["peak"] == 3
+
+    def test_coroutines_share_sync_client(self, client):
+        """Async methods delegate to the wrapped sync client."""
+        client.get_campaigns = Mock(return_value=[{"campaignId": "1"}])
+        async_client = AsyncAdvertisingClient(client=client, max_concurrency=2)
+
+        result = asyncio.run(async_client.get_campaigns(name_filter="Shelzys"))
+
+        assert result == [{"campaignId": "1"}]
+        client.get_campaigns.assert_called_once_with(name_filter="Shelzys")
+        assert client.async_client.client is client
+
+    def test_return_exceptions(self, client):
+        """Failures can be collected instead of raised."""
+        def fake_status(report_id):
+            if report_id == "b":
+                raise ValueError("boom")
+            return {"status": "SUCCESS"}
+
+        client.get_report_status = fake_status
+        calls = [("get_report_status", {"report_id": "a"}), ("get_report_status", {"report_id": "b"})]
+
+        results = client.run_concurrently(calls, return_exceptions=True)
+
+        assert results[0] == {"status": "SUCCESS"}
+        assert isinstance(results[1], ValueError)
+
+    def test_nested_fan_out_does_not_deadlock(self):
+        """A fanning-out sync method run from the async client completes."""
+        client = AdvertisingClient(
+            client_id="cid",
+            profile_id="123",
+            transport=Mock(spec=PooledTransport),
+            max_concurrency=1,
+        )
+        client._put_keywords = lambda updates: {}
+        updates = [{"keywordId": str(i), "bid": 1.0} for i in range(3)]
+
+        async def run():
+            return await asyncio.wait_for(
+                client.async_client.batch_update_keywords(updates), timeout=5
+            )
+
+        result = asyncio.run(run())
+
+        assert result["successful"] == ["0", "1", "2"]
+        client.async_client.close()
+
+
+class TestBatchUpdateKeywords:
+    """Test suite for chunked keyword batch updates."""
+
+    @pytest.fixture
+    def client(self):
+        return AdvertisingClient(
+            client_id="cid",
+            profile_id="123",
+            transport=Mock(spec=PooledTransport),
+        )
+
+    def test_splits_into_api_sized_chunks(self, client):
+        """Updates are sent in chunks no larger than the API limit."""
+        sizes = []
+
+        def fake_put(updates):
+            sizes.append(len(updates))
+            return {"keywords": {"success": [{"index": i} for i in range(len(updates))]}}
+
+        client._put_keywords = fake_put
+        updates = [{"keywordId": str(i), "bid": 1.0} for i in range(2500)]
+
+        result = client.batch_update_keywords(updates)
+
+        assert sorted(sizes) == [500, 1000, 1000]
+        assert result["requests"] == 3
+        assert len(result["successful"]) == 2500
+        assert result["failed"] == []
+
+    def test_retries_only_failed_items(self, client):
+        """Items reported as errors are retried; successes are not resent."""
+        sent = []
+
+        def fake_put(updates):
+            sent.append([u["keywordId"] for u in updates])
+            if len(sent) == 1:
+                return {"keywords": {
+                    "success": [{"index": 0, "keywordId": "a"}],
+                    "error": [{"index": 1, "errors": [{"errorType": "THROTTLED"}]}],
+                }}
+            return {"keywords": {"success": [{"index": 0, "keywordId": "b"}]}}
+
+        client._put_keywords = fake_put
+
+        result = client.batch_update_keywords(
+            [{"keywordId": "a", "bid": 1.0}, {"keywordId": "b", "bid": 2.0}]
+        )
+
+        assert sent == [["a", "b"], ["b"]]
+        assert result["results"] == {
+            "a": {"status": "success"},
+            "b": {"status": "success"},
+        }
+
+    def test_reports_persistent_failures(self, client):
+        """Items still failing after retries are reported per keyword."""
+        client._put_keywords = Mock(side_effect=RuntimeError("HTTP 500"))
+
+        result = client.batch_update_keywords(
+            [{"keywordId": "a", "bid": 1.0}], max_retries=1
+        )
+
+        assert client._put_keywords.call_count == 2
+        assert result["failed"] == [{"keyword_id": "a", "error": "HTTP 500"}]
+
+    def test_validation_errors_not_retried(self, client):
+        """Permanent item errors fail at once; only transient ones are resent."""
+        sent = []
+
+        def fake_put(updates):
+            sent.append([u["keywordId"] for u in updates])
+            if len(sent) == 1:
+                return {"keywords": {"error": [
+                    {"index": 0, "errors": [{"errorType": "BID_OUT_OF_RANGE", "message": "Bid too high"}]},
+                    {"index": 1, "errors": [{"errorType": "INTERNAL_ERROR"}]},
+                ]}}
+            return {"keywords": {"success": [{"index": 0, "keywordId": "b"}]}}
+
+        client._put_keywords = fake_put
+
+        result = client.batch_update_keywords(
+            [{"keywordId": "a", "bid": 999.0}, {"keywordId": "b", "bid": 1.0}]
+        )
+
+        assert sent == [["a", "b"], ["b"]]
+        assert [f["keyword_id"] for f in result["failed"]] == ["a"]
+        assert "BID_OUT_OF_RANGE" in result["failed"][0]["error"]
+
+    def test_client_error_requests_not_retried(self, client):
+        """A whole request rejected with a 4xx is not repeated."""
+        error = RuntimeError("HTTP 400")
+        error.response = Mock(status_code=400)
+        client._put_keywords = Mock(side_effect=error)
+
+        result = client.batch_update_keywords([{"keywordId": "a", "bid": 1.0}])
+
+        assert client._put_keywords.call_count == 1
+        assert result["failed"] == [{"keyword_id": "a", "error": "HTTP 400"}]
+
+
+class TestListEntities:
+    """Test suite for paginated entity listing."""
+
+    def test_follows_next_token(self):
+        """All pages are fetched and concatenated."""
+        client = AdvertisingClient(
+            client_id="cid",
+            profile_id="123",
+            transport=Mock(spec=PooledTransport),
+        )
+        pages = [
+            {"adGroups": [{"adGroupId": "1"}], "nextToken": "t1"},
+            {"adGroups": [{"adGroupId": "2"}], "nextToken": "t2"},
+            {"adGroups": [{"adGroupId": "3"}]},
+        ]
+        client._make_request = Mock(side_effect=pages)
+
+        entities = client.list_entities("adGroups", filters={"stateFilter": {"include": ["ENABLED"]}})
+
+        assert [e["adGroupId"] for e in entities] == ["1", "2", "3"]
+        bodies = [c.kwargs["data"] for c in client._make_request.call_args_list]
+        assert client._make_request.call_args_list[0].args == ("POST", "/sp/adGroups/list")
+        assert [b.get("nextToken") for b in bodies] == [None, "t1", "t2"]
+        assert all(b["stateFilter"] == {"include": ["ENABLED"]} for b in bodies)
+
+
+class TestWriteInChunks:
+    """Test chunked entity writes."""
+
+    def test_failed_chunk_keeps_other_results(self):
+        """A chunk that raises becomes per-item errors; other chunks still count."""
+        client = AdvertisingClient(
+            client_id="cid",
+            profile_id="123",
+            transport=Mock(spec=PooledTransport),
+        )
+        client.MAX_ENTITIES_PER_REQUEST = 2
+        client._make_request = Mock(side_effect=[
+            {"keywords": {"success": [{"index": 0, "keywordId": "1"}, {"index": 1, "keywordId": "2"}]}},
+            RuntimeError("HTTP 400"),
+            {"keywords": {"success": [{"index": 0, "keywordId": "5"}]}},
+        ])
+
+        result = client.create_entities("keywords", [{"keywordText": str(i)} for i in range(5)])
+
+        merged = result["keywords"]
+        assert [(e["index"], e["keywordId"]) for e in merged["success"]] == [(0, "1"), (1, "2"), (4, "5")]
+        assert merged["error"] == [
+            {"index": 2, "errors": "HTTP 400"},
+            {"index": 3, "errors": "HTTP 400"},
+        ]
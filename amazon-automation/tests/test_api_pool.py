@@ -0,0 +1,89 @@
+"""
+Tests for API Instance Pool Module
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.api.api_pool import APIInstancePool
+from src.api.rate_limiter import AdaptiveRateLimiter
+from src.api.sp_api_client import SPAPIClient
+
+
+class Orders:
+    pass
+
+
+class TestAPIInstancePool:
+    """Test suite for APIInstancePool."""
+
+    def test_sequential_checkouts_reuse_one_instance(self):
+        """Instances are built lazily and reused once returned."""
+        factory = Mock(side_effect=lambda cls: cls())
+        pool = APIInstancePool(factory)
+
+        seen = set()
+        for _ in range(5):
+            with pool.checkout(Orders) as api:
+                seen.add(id(api))
+
+        assert len(seen) == 1
+        assert pool.stats() == {"Orders": {"created": 1, "reused": 4}}
+
+    def test_factory_error_is_not_counted(self):
+        """A checkout that never got an instance is not counted as reused."""
+        factory = Mock(side_effect=[RuntimeError("bad credentials"), Orders()])
+        pool = APIInstancePool(factory)
+
+        with pytest.raises(RuntimeError):
+            with pool.checkout(Orders):
+                pass
+        with pool.checkout(Orders):
+            pass
+
+        assert pool.stats() == {"Orders": {"created": 1, "reused": 0}}
+
+    def test_concurrent_checkouts_get_distinct_instances(self):
+        """A busy instance is never handed to a second thread."""
+        pool = APIInstancePool(lambda cls: cls())
+        in_use, overlaps = set(), []
+        lock = threading.Lock()
+
+        def work():
+            with pool.checkout(Orders) as api:
+                with lock:
+                    overlaps.append(id(api) in in_use)
+                    in_use.add(id(api))
+                time.sleep(0.02)
+                with lock:
+                    in_use.discard(id(api))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not any(overlaps)
+        assert pool.stats()["Orders"]["created"] <= 4
+
+
+class TestSPAPIClientPool:
+    """Test SPAPIClient reusing API instances."""
+
+    def test_batch_reviews_build_one_solicitations_client(self):
+        """Requesting many reviews constructs the API object once."""
+        client = SPAPIClient(
+            refresh_token="r", lwa_app_id="app", lwa_client_secret="s",
+            rate_limiter=AdaptiveRateLimiter(sleep=lambda seconds: None),
+        )
+        with patch("src.api.sp_api_client.Solicitations") as solicitations:
+            solicitations.__name__ = "Solicitations"
+            results = client.batch_request_reviews([f"order-{i}" for i in range(50)], delay_ms=0)
+
+        assert len(results["successful"]) == 50
+        assert solicitations.call_count == 1
+        assert client.api_stats()["Solicitations"] == {"created": 1, "reused": 49}
@@ -2,6 +2,8 @@
 Tests for Bid Optimizer Module
 """
 
+import random
+
 import pytest
 from unittest.mock import Mock, patch
 from src.automation.bid_optimizer import BidOptimizer
@@ -216,3 +218,159 @@ class TestBidOptimizerRules:
         assert optimizer.negative_clicks_min == 15
         assert optimizer.negative_spend_min == 10
         assert optimizer.negative_conversions_max == 0
+
+
+class TestRunOptimizationBatching:
+    """Test that run_optimization batches its write calls."""
+
+    @pytest.fixture
+    def optimizer(self):
+        with patch('src.automation.bid_optimizer.AdvertisingClient'):
+            with patch('src.automation.bid_optimizer.ConfigLoader') as mock_config:
+                mock_config.return_value.get_bid_rules.return_value = {}
+                optimizer = BidOptimizer()
+
+        client = optimizer.ads_client
+        client.batch_update_keywords.return_value = {"failed": []}
+        client.create_negative_keywords.return_value = {}
+        client.run_concurrently.side_effect = lambda calls, return_exceptions=False: [
+            getattr(client, name)(**kwargs) for name, kwargs in calls
+        ]
+        return optimizer
+
+    @staticmethod
+    def _set_reports(optimizer, keywords=None, search_terms=None):
+        """Make the client yield the given report rows (search terms first)."""
+        optimizer.ads_client.iter_optimization_reports.return_value = iter([
+            ("search_terms", search_terms or []),
+            ("keywords", keywords or []),
+        ])
+
+    def test_pauses_share_keyword_batch(self, optimizer):
+        """Bid changes and pauses go out in a single batch update."""
+        self._set_reports(optimizer, keywords=[
+            {"keywordId": "up", "clicks": 50, "cost": 15.0, "sales1d": 100.0,
+             "purchases1d": 5, "bid": 1.00},
+            {"keywordId": "pause", "clicks": 30, "cost": 20.0, "sales1d": 25.0,
+             "purchases1d": 0, "bid": 0.75},
+        ])
+
+        optimizer.run_optimization()
+
+        optimizer.ads_client.update_keyword.assert_not_called()
+        optimizer.ads_client.batch_update_keywords.assert_called_once_with([
+            {"keywordId": "up", "bid": 1.15},
+            {"keywordId": "pause", "state": "paused"},
+        ])
+
+    def test_negatives_grouped_by_ad_group(self, optimizer):
+        """Negatives are created with one call per campaign/ad group/level."""
+        bad_term = {"clicks": 20, "cost": 15.0, "purchases1d": 0}
+        self._set_reports(optimizer, search_terms=[
+            {**bad_term, "query": "free bottle", "campaignId": "c1", "adGroupId": "a1"},
+            {**bad_term, "query": "cheap cup", "campaignId": "c1", "adGroupId": "a1"},
+            {**bad_term, "query": "free bottle", "campaignId": "c1", "adGroupId": "a1"},
+            {**bad_term, "query": "used cup", "campaignId": "c2", "adGroupId": None},
+        ])
+
+        results = optimizer.run_optimization()
+
+        calls = optimizer.ads_client.create_negative_keywords.call_args_list
+        assert len(calls) == 2
+        assert calls[0].kwargs["level"] == "adGroup"
+        assert [k["text"] for k in calls[0].kwargs["keywords"]] == ["free bottle", "cheap cup"]
+        assert calls[1].kwargs["level"] == "campaign"
+        assert results["errors"] == []
+
+    def test_dry_run_makes_no_writes(self, optimizer):
+        """Dry runs analyze but never write."""
+        self._set_reports(
+            optimizer,
+            keywords=[
+                {"keywordId": "pause", "clicks": 30, "cost": 20.0, "sales1d": 25.0,
+                 "purchases1d": 0, "bid": 0.75},
+            ],
+            search_terms=[
+                {"query": "free", "clicks": 20, "cost": 15.0, "purchases1d": 0,
+                 "campaignId": "c1", "adGroupId": "a1"},
+            ],
+        )
+
+        results = optimizer.run_optimization(dry_run=True)
+
+        assert len(results["paused_keywords"]) == 1
+        assert len(results["new_negatives"]) == 1
+        optimizer.ads_client.batch_update_keywords.assert_not_called()
+        optimizer.ads_client.create_negative_keywords.assert_not_called()
+
+
+class TestAnalyzeKeywordsBatch:
+    """Test the vectorized batch analysis against the scalar path."""
+
+    @pytest.fixture
+    def optimizer(self):
+        with patch('src.automation.bid_optimizer.AdvertisingClient'):
+            with patch('src.automation.bid_optimizer.ConfigLoader') as mock_config:
+                mock_config.return_value.get_bid_rules.return_value = {}
+                return BidOptimizer()
+
+    @staticmethod
+    def _rows(count=5000, seed=7):
+        rng = random.Random(seed)
+        rows = []
+        for i in range(count):
+            row = {
+                "keywordId": str(i),
+                "keywordText": f"kw {i}",
+                "clicks": rng.randint(0, 60),
+                "cost": round(rng.uniform(0, 40), 2),
+                "bid": rng.choice([0.2, 0.5, 1.0, 2.9, 3.0, 3.5]),
+            }
+            # Mix both metric naming schemes and missing values
+            if rng.random() < 0.5:
+                row["sales1d"] = rng.choice([0, 0, round(rng.uniform(0, 200), 2)])
+                row["purchases1d"] = rng.randint(0, 6)
+            else:
+                row["sales"] = rng.choice([0, round(rng.uniform(0, 200), 2)])
+                row["conversions"] = rng.randint(0, 6)
+            rows.append(row)
+        return rows
+
+    def _scalar(self, optimizer, rows):
+        analyses = [optimizer.analyze_keyword_performance(row) for row in rows]
+        return [a for a in analyses if a["action"] != "none"]
+
+    def test_matches_scalar_path(self, optimizer):
+        """Vectorized results equal the scalar analysis of every row."""
+        pytest.importorskip("numpy")
+        rows = self._rows()
+        batch = optimizer.analyze_keywords_batch(rows)
+
+        assert batch == self._scalar(optimizer, rows)
+        assert {a["action"] for a in batch} == {"pause", "increase_bid", "decrease_bid"}
+
+    def test_fallback_without_numpy(self, optimizer):
+        """Without NumPy the scalar path produces the same results."""
+        rows = self._rows(count=500)
+        with patch('src.automation.bid_optimizer.np', None):
+            batch = optimizer.analyze_keywords_batch(rows)
+        assert batch == self._scalar(optimizer, rows)
+
+    def test_empty(self, optimizer):
+        """An empty batch yields no actions."""
+        assert optimizer.analyze_keywords_batch([]) == []
+
+    def test_process_keywords_spans_batches(self, optimizer):
+        """Rows are analyzed in BATCH_SIZE chunks without losing any."""
+        optimizer.BATCH_SIZE = 64
+        rows = self._rows(count=300)
+        results = {"bid_increases": [], "bid_decreases": [], "paused_keywords": [], "errors": []}
+
+        count = optimizer._process_keywords(iter(rows), results, dry_run=True)
+
+        expected = self._scalar(optimizer, rows)
+        assert count == 300
+        assert (
+            len(results["bid_increases"]) + len(results["bid_decreases"])
+            + len(results["paused_keywords"])
+        ) == len(expected)
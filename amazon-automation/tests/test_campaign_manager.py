@@ -0,0 +1,404 @@
+"""
+Tests for Campaign Manager Module
+"""
+
+import copy
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.api.advertising_client import AdvertisingClient
+from src.automation.campaign_manager import CampaignManager
+
+
+CAMPAIGNS = [
+    {
+        "name": f"Campaign-{i}",
+        "targeting_type": "manual",
+        "daily_budget": 10.0,
+        "products": ["B000000001"],
+        "ad_groups": [
+            {
+                "name": f"AdGroup-{i}",
+                "default_bid": 0.75,
+                "keywords": [{"text": f"keyword {i}", "match_type": "exact", "bid": 1.0}],
+            }
+        ],
+    }
+    for i in range(4)
+]
+
+
+@pytest.fixture
+def config():
+    config = Mock()
+    config.load_campaigns.return_value = {"campaigns": CAMPAIGNS}
+    config.get_product_by_asin.return_value = {"sku": "SKU-1", "asin": "B000000001"}
+    config.get_negative_keywords.return_value = []
+    return config
+
+
+class RecordingClient:
+    """Advertising client stub that records call order and overlap."""
+
+    def __init__(self, delay=0.05, fail_names=()):
+        self.delay = delay
+        self.fail_names = set(fail_names)
+        self.log = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _call(self, entry):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.log.append(entry)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+    def create_campaign(self, name, **kwargs):
+        self._call(("campaign", name))
+        if name in self.fail_names:
+            raise Exception("boom")
+        return {"campaigns": [{"campaignId": f"id-{name}"}]}
+
+    def create_ad_group(self, campaign_id, name, **kwargs):
+        self._call(("ad_group", campaign_id))
+        return {"adGroups": [{"adGroupId": f"id-{name}"}]}
+
+    def create_product_ad(self, campaign_id, ad_group_id, **kwargs):
+        self._call(("product_ad", ad_group_id))
+        return {}
+
+    def create_keywords(self, campaign_id, ad_group_id, **kwargs):
+        self._call(("keywords", ad_group_id))
+        return {}
+
+
+class TestDeployAllCampaigns:
+    """Test sequential and concurrent campaign deployment."""
+
+    def test_concurrent_deploy_overlaps_campaigns(self, config):
+        """Independent campaigns are built at the same time."""
+        client = RecordingClient()
+        manager = CampaignManager(advertising_client=client, config_loader=config)
+
+        results = manager.deploy_all_campaigns(max_workers=4)
+
+        assert client.max_in_flight > 1
+        assert [r["name"] for r in results["successful"]] == [c["name"] for c in CAMPAIGNS]
+
+    def test_children_follow_their_parent(self, config):
+        """Within a campaign, parents are created before children."""
+        client = RecordingClient(delay=0.01)
+        manager = CampaignManager(advertising_client=client, config_loader=config)
+
+        manager.deploy_all_campaigns(max_workers=4)
+
+        for i in range(len(CAMPAIGNS)):
+            steps = [
+                client.log.index(("campaign", f"Campaign-{i}")),
+                client.log.index(("ad_group", f"id-Campaign-{i}")),
+                client.log.index(("product_ad", f"id-AdGroup-{i}")),
+                client.log.index(("keywords", f"id-AdGroup-{i}")),
+            ]
+            assert steps == sorted(steps)
+
+    def test_sequential_by_default(self, config):
+        """Without workers, only one call is ever in flight."""
+        client = RecordingClient(delay=0.001)
+        manager = CampaignManager(advertising_client=client, config_loader=config)
+
+        manager.deploy_all_campaigns()
+
+        assert client.max_in_flight == 1
+
+    def test_failures_reported_per_campaign(self, config):
+        """One failing campaign does not stop the others."""
+        client = RecordingClient(delay=0.001, fail_names={"Campaign-2"})
+        manager = CampaignManager(advertising_client=client, config_loader=config)
+
+        results = manager.deploy_all_campaigns(max_workers=3)
+
+        assert len(results["successful"]) == 3
+        assert results["failed"] == [{"name": "Campaign-2", "error": "boom"}]
+
+
+class BulkClient:
+    """Client stub for bulk creation that assigns IDs and can reject items."""
+
+    MAX_ENTITIES_PER_REQUEST = 2
+
+    campaign_item = staticmethod(AdvertisingClient.campaign_item)
+    ad_group_item = staticmethod(AdvertisingClient.ad_group_item)
+    product_ad_item = staticmethod(AdvertisingClient.product_ad_item)
+    keyword_item = staticmethod(AdvertisingClient.keyword_item)
+    auto_target_item = staticmethod(AdvertisingClient.auto_target_item)
+    negative_keyword_item = staticmethod(AdvertisingClient.negative_keyword_item)
+
+    ID_FIELDS = {"campaigns": "campaignId", "adGroups": "adGroupId"}
+
+    def __init__(self, reject=()):
+        self.reject = set(reject)
+        self.created = {}
+
+    def run_concurrently(self, calls, return_exceptions=False):
+        return [getattr(self, name)(**kwargs) for name, kwargs in calls]
+
+    def create_entities(self, entity_type, items):
+        self.created.setdefault(entity_type, []).extend(items)
+        success, error = [], []
+        for index, item in enumerate(items):
+            if item.get("name") in self.reject or item.get("keywordText") in self.reject:
+                error.append({"index": index, "errors": ["rejected"]})
+            else:
+                entry = {"index": index}
+                if entity_type in self.ID_FIELDS:
+                    entry[self.ID_FIELDS[entity_type]] = f"id-{item['name']}"
+                success.append(entry)
+        return {entity_type: {"success": success, "error": error}}
+
+
+class TestBulkDeploy:
+    """Test level-by-level bulk campaign creation."""
+
+    @pytest.fixture
+    def config(self, config):
+        auto = {
+            "name": "Campaign-auto",
+            "targeting_type": "auto",
+            "products": ["B000000001"],
+            "ad_groups": [{
+                "name": "AdGroup-auto",
+                "auto_targeting_groups": [{"type": "close-match", "bid": 0.8}],
+            }],
+        }
+        config.load_campaigns.return_value = {"campaigns": CAMPAIGNS + [auto]}
+        config.get_negative_keywords.return_value = [
+            {"text": "free", "match_type": "negative_exact"}
+        ]
+        return config
+
+    def test_ids_mapped_by_index(self, config):
+        """Children reference the IDs returned for their parents."""
+        client = BulkClient()
+        manager = CampaignManager(advertising_client=client, config_loader=config)
+
+        results = manager.deploy_all_campaigns(bulk=True)
+
+        assert [r["campaign_id"] for r in results["successful"]] == [
+            f"id-Campaign-{i}" for i in range(4)
+        ] + ["id-Campaign-auto"]
+        assert {ag["campaignId"] for ag in client.created["adGroups"]} == {
+            r["campaign_id"] for r in results["successful"]
+        }
+        keywords = {k["keywordText"]: k["adGroupId"] for k in client.created["keywords"]}
+        assert keywords["keyword 3"] == "id-AdGroup-3"
+        assert client.created["targetingClauses"][0]["adGroupId"] == "id-AdGroup-auto"
+        assert len(client.created["productAds"]) == 5
+        assert len(client.created["campaignNegativeKeywords"]) == 5
+        assert manager._ad_group_ids["AdGroup-2"] == "id-AdGroup-2"
+
+    def test_requests_scale_with_levels_and_chunks(self, config):
+        """Requests are counted per entity type and chunk, not per entity."""
+        results = CampaignManager(
+            advertising_client=BulkClient(), config_loader=config
+        ).deploy_all_campaigns(bulk=True)
+
+        # 5 campaigns, 5 ad groups, 5 product ads, 4 keywords, 1 target,
+        # 5 negatives in chunks of 2
+        assert results["requests"] == 3 + 3 + 3 + 2 + 1 + 3
+
+    def test_per_entity_failures(self, config):
+        """Failed entities are reported and their children skipped."""
+        client = BulkClient(reject={"Campaign-1", "AdGroup-2", "keyword 0"})
+        manager = CampaignManager(advertising_client=client, config_loader=config)
+
+        results = manager.deploy_all_campaigns(bulk=True)
+
+        assert results["failed"] == [
+            {"name": "Campaign-1", "error": "Campaign Campaign-1: ['rejected']"}
+        ]
+        by_name = {r["name"]: r for r in results["successful"]}
+        assert by_name["Campaign-0"]["status"] == "partial"
+        assert by_name["Campaign-0"]["errors"] == ["Keyword 'keyword 0': ['rejected']"]
+        assert by_name["Campaign-2"]["ad_groups"] == []
+        assert "keyword 2" not in [k["keywordText"] for k in client.created["keywords"]]
+        assert by_name["Campaign-3"]["status"] == "success"
+
+
+class FakeAccount(BulkClient):
+    """Client stub backed by an in-memory account for reconcile tests."""
+
+    ID_FIELDS = {
+        "campaigns": "campaignId",
+        "adGroups": "adGroupId",
+        "productAds": "adId",
+        "keywords": "keywordId",
+        "targetingClauses": "targetId",
+        "campaignNegativeKeywords": "keywordId",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.entities = {entity_type: {} for entity_type in self.ID_FIELDS}
+        self.writes = []
+        self._next_id = 0
+
+    def list_entities(self, entity_type, filters=None):
+        return [
+            dict(entity) for entity in self.entities[entity_type].values()
+            if entity.get("state", "enabled").lower() != "archived"
+        ]
+
+    def create_entities(self, entity_type, items):
+        self.writes.append(("create", entity_type, len(items)))
+        success = []
+        for index, item in enumerate(items):
+            self._next_id += 1
+            entity_id = str(self._next_id)
+            self.entities[entity_type][entity_id] = {
+                **item, self.ID_FIELDS[entity_type]: entity_id
+            }
+            success.append({"index": index, self.ID_FIELDS[entity_type]: entity_id})
+        return {entity_type: {"success": success, "error": []}}
+
+    def update_entities(self, entity_type, items):
+        self.writes.append(("update", entity_type, len(items)))
+        id_field = self.ID_FIELDS[entity_type]
+        for item in items:
+            self.entities[entity_type][item[id_field]].update(item)
+        return {entity_type: {"success": [{"index": i} for i in range(len(items))], "error": []}}
+
+
+class TestReconcile:
+    """Test diff-and-reconcile deployment."""
+
+    @pytest.fixture
+    def campaigns(self):
+        return copy.deepcopy(CAMPAIGNS[:2]) + [{
+            "name": "Campaign-auto",
+            "targeting_type": "auto",
+            "daily_budget": 5.0,
+            "products": ["B000000001"],
+            "ad_groups": [{
+                "name": "AdGroup-auto",
+                "auto_targeting_groups": [
+                    {"type": "close-match", "bid": 0.8},
+                    {"type": "substitutes", "bid": 0.5},
+                ],
+            }],
+        }]
+
+    @pytest.fixture
+    def manager(self, config, campaigns):
+        config.load_campaigns.return_value = {"campaigns": campaigns}
+        config.get_negative_keywords.return_value = [
+            {"text": "free", "match_type": "negative_exact"}
+        ]
+        return CampaignManager(advertising_client=FakeAccount(), config_loader=config)
+
+    def test_unchanged_config_makes_no_writes(self, manager):
+        """A second reconcile against the deployed account writes nothing."""
+        first = manager.reconcile_campaigns()
+        assert first["created"] > 0
+        manager.ads_client.writes.clear()
+
+        second = manager.reconcile_campaigns()
+
+        assert manager.ads_client.writes == []
+        assert second["created"] == second["updated"] == second["requests"] == 0
+        assert [r["campaign_id"] for r in second["successful"]] == [
+            r["campaign_id"] for r in first["successful"]
+        ]
+
+    def test_only_changes_are_written(self, manager, campaigns):
+        """Budget changes update, new keywords create, removed ones archive."""
+        manager.reconcile_campaigns()
+        client = manager.ads_client
+        client.writes.clear()
+
+        campaigns[0]["daily_budget"] = 25.0
+        campaigns[1]["ad_groups"][0]["keywords"] = [
+            {"text": "brand new", "match_type": "exact", "bid": 1.0}
+        ]
+        campaigns[2]["ad_groups"][0]["auto_targeting_groups"].pop()
+
+        results = manager.reconcile_campaigns()
+
+        assert sorted(client.writes) == [
+            ("create", "keywords", 1),
+            ("update", "campaigns", 1),
+            ("update", "keywords", 1),
+            ("update", "targetingClauses", 1),
+        ]
+        assert results["created"] == 1
+        assert results["updated"] == 3
+        ad_group_id = manager._ad_group_ids["AdGroup-1"]
+        live = client.list_entities("keywords")
+        assert [k["keywordText"] for k in live if k["adGroupId"] == ad_group_id] == ["brand new"]
+
+    def test_optimizer_changes_are_kept(self, manager):
+        """Keyword bids and pauses made by the optimizer are not reverted."""
+        manager.reconcile_campaigns()
+        client = manager.ads_client
+        for keyword in client.entities["keywords"].values():
+            keyword.update({"bid": 2.5, "state": "PAUSED", "matchType": "EXACT"})
+        client.writes.clear()
+
+        manager.reconcile_campaigns()
+
+        assert client.writes == []
+
+    def test_optimizer_negatives_survive(self, manager):
+        """Campaign negatives harvested by the optimizer are not archived."""
+        manager.reconcile_campaigns()
+        client = manager.ads_client
+        campaign_id = manager._campaign_ids["Campaign-auto"]
+        client.entities["campaignNegativeKeywords"]["harvested"] = {
+            "keywordId": "harvested", "campaignId": campaign_id,
+            "keywordText": "cheap", "matchType": "NEGATIVE_EXACT", "state": "ENABLED",
+        }
+        client.writes.clear()
+
+        manager.reconcile_campaigns()
+
+        assert client.writes == []
+        assert client.entities["campaignNegativeKeywords"]["harvested"]["state"] == "ENABLED"
+
+    def test_archive_negatives_opt_in(self, manager):
+        """With archive_negatives, negatives not in config are archived."""
+        manager.reconcile_campaigns()
+        client = manager.ads_client
+        campaign_id = manager._campaign_ids["Campaign-auto"]
+        client.entities["campaignNegativeKeywords"]["harvested"] = {
+            "keywordId": "harvested", "campaignId": campaign_id,
+            "keywordText": "cheap", "matchType": "NEGATIVE_EXACT", "state": "ENABLED",
+        }
+        client.writes.clear()
+
+        manager.reconcile_campaigns(archive_negatives=True)
+
+        assert client.writes == [("update", "campaignNegativeKeywords", 1)]
+        assert client.entities["campaignNegativeKeywords"]["harvested"]["state"] == "archived"
+
+
+class TestCheckCampaignExists:
+    """Test campaign existence checks through the entity cache."""
+
+    def test_many_checks_share_one_listing(self, config):
+        """Checking every configured campaign sweeps the listing once."""
+        client = AdvertisingClient(client_id="cid", profile_id="123")
+        client._make_request = Mock(return_value={
+            "campaigns": [{"campaignId": "c1", "name": "Campaign-1"}],
+        })
+        manager = CampaignManager(advertising_client=client, config_loader=config)
+
+        found = [manager.check_campaign_exists(c["name"]) for c in CAMPAIGNS]
+
+        assert found == [None, "c1", None, None]
+        assert client._make_request.call_count == 1
@@ -2,6 +2,9 @@
 Tests for Configuration Loader
 """
 
+import json
+import os
+
 import pytest
 from pathlib import Path
 from src.utils.config_loader import ConfigLoader
@@ -230,3 +233,58 @@ class TestCampaignConfig:
                 for keyword in ad_group.get("keywords", []):
                     assert keyword["match_type"] in valid_types, \
                         f"Invalid match type: {keyword['match_type']}"
+
+
+class TestProductIndexes:
+    """Test indexed lookups and change detection on a temporary config."""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path):
+        self.write(tmp_path, [
+            {"sku": "A-1", "asin": "B01", "type": "blank"},
+            {"sku": "A-2", "asin": "B02", "type": "personalized"},
+            {"sku": "A-3", "asin": "B03", "type": "blank"},
+        ])
+        return tmp_path
+
+    @staticmethod
+    def write(config_dir, products):
+        path = config_dir / "products.json"
+        path.write_text(json.dumps({"products": products}), encoding="utf-8")
+        # Make the edit visible even within the filesystem's mtime granularity
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_lookups(self, config_dir):
+        """ASIN, SKU and type lookups use the index."""
+        loader = ConfigLoader(config_dir=str(config_dir))
+
+        assert loader.get_product_by_asin("B02")["sku"] == "A-2"
+        assert loader.get_product_by_sku("A-3")["asin"] == "B03"
+        assert loader.get_product_by_sku("missing") is None
+        assert [p["sku"] for p in loader.get_products_by_type("blank")] == ["A-1", "A-3"]
+        assert loader.get_products_by_type("other") == []
+        assert loader.get_blank_products() == loader.get_products_by_type("blank")
+
+    def test_index_built_once_per_load(self, config_dir):
+        """Repeated lookups reuse one index."""
+        loader = ConfigLoader(config_dir=str(config_dir))
+        loader.get_product_by_sku("A-1")
+        index = loader._product_index
+
+        loader.get_product_by_asin("B03")
+        loader.get_products_by_type("blank")
+
+        assert loader._product_index is index
+
+    def test_file_change_invalidates(self, config_dir):
+        """Editing products.json is picked up without reload_all."""
+        loader = ConfigLoader(config_dir=str(config_dir))
+        first = loader.load_products()
+        assert loader.get_product_by_sku("A-4") is None
+
+        self.write(config_dir, [{"sku": "A-4", "asin": "B04", "type": "blank"}])
+
+        assert loader.get_product_by_sku("A-4")["asin"] == "B04"
+        assert loader.get_product_by_sku("A-1") is None
+        assert loader.load_products() is not first
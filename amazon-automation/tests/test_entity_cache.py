@@ -0,0 +1,98 @@
+"""
+Tests for Entity Cache Module
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.api.advertising_client import AdvertisingClient
+from src.api.entity_cache import EntityCache
+from src.api.http_transport import PooledTransport
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def client():
+    client = AdvertisingClient(
+        client_id="cid",
+        profile_id="123",
+        transport=Mock(spec=PooledTransport),
+    )
+    client._make_request = Mock(side_effect=[
+        {"campaigns": [{"campaignId": i, "name": f"Campaign-{i}"} for i in range(500)], "nextToken": "t1"},
+        {"campaigns": [{"campaignId": i, "name": f"Campaign-{i}"} for i in range(500, 750)]},
+    ])
+    return client
+
+
+class TestEntityCache:
+    """Test suite for EntityCache."""
+
+    def test_indexes_by_id_and_name(self):
+        """Entities are found by string ID and exact name."""
+        index = EntityCache().put("campaigns", [{"campaignId": 7, "name": "A"}])
+        assert index.get("7")["name"] == "A"
+        assert index.find("A")["campaignId"] == 7
+        assert index.find("B") is None
+
+    def test_expires_after_ttl(self):
+        """Listings are dropped once the TTL has passed."""
+        clock = FakeClock()
+        cache = EntityCache(ttl=10, clock=clock)
+        cache.put("adGroups", [])
+        clock.now = 9.9
+        assert cache.get("adGroups") is not None
+        clock.now = 10
+        assert cache.get("adGroups") is None
+
+    def test_invalidate(self):
+        """Invalidating one type leaves the others cached."""
+        cache = EntityCache()
+        cache.put("campaigns", [])
+        cache.put("adGroups", [])
+        cache.invalidate("campaigns")
+        assert cache.get("campaigns") is None
+        assert cache.get("adGroups") is not None
+        cache.invalidate()
+        assert cache.get("adGroups") is None
+
+
+class TestClientEntityIndex:
+    """Test AdvertisingClient lookups through the entity cache."""
+
+    def test_iter_entities_fetches_pages_lazily(self, client):
+        """The next page is only requested once the first is consumed."""
+        entities = client.iter_entities("campaigns")
+        for _ in range(500):
+            next(entities)
+        assert client._make_request.call_count == 1
+        assert len(list(entities)) == 250
+        assert client._make_request.call_count == 2
+
+    def test_lookups_share_one_sweep(self, client):
+        """Many lookups cost a single paged sweep."""
+        for i in range(0, 750, 7):
+            assert client.find_campaign(f"Campaign-{i}")["campaignId"] == i
+        assert client.find_campaign("missing") is None
+        assert client._make_request.call_count == 2
+
+    def test_write_invalidates_cached_listing(self, client):
+        """Writing to an entity endpoint forces a fresh sweep."""
+        client.get_entity_index("campaigns")
+        client.entity_cache.put("adGroups", [])
+
+        del client._make_request
+        client._get_headers = Mock(return_value={})
+        client._send = Mock(return_value=Mock(status_code=207, text=""))
+        client._make_request("PUT", "/sp/campaigns", data={"campaigns": []})
+
+        assert client.entity_cache.get("campaigns") is None
+        assert client.entity_cache.get("adGroups") is not None
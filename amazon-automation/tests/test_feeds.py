@@ -0,0 +1,100 @@
+"""
+Tests for the JSON_LISTINGS_FEED bulk path
+"""
+
+import pytest
+
+from src.api.local_feeds import LocalFeedsEndpoint
+from src.api.rate_limiter import AdaptiveRateLimiter
+from src.api.sp_api_client import SPAPIClient
+
+
+@pytest.fixture
+def feeds():
+    return LocalFeedsEndpoint()
+
+
+@pytest.fixture
+def client(feeds):
+    return SPAPIClient(
+        refresh_token="r", lwa_app_id="app", lwa_client_secret="s",
+        rate_limiter=AdaptiveRateLimiter(
+            limits=SPAPIClient.RATE_LIMITS, sleep=lambda seconds: None,
+        ),
+        feeds_api=feeds,
+    )
+
+
+def attributes(client, title):
+    return client.build_listing_attributes(
+        title=title, bullet_points=["One"], description="Desc", search_terms="cup",
+    )
+
+
+class TestBulkUpdateListings:
+    """Test submitting listing updates as one feed."""
+
+    def test_one_document_for_all_skus(self, client, feeds):
+        """Every SKU goes into a single uploaded feed document."""
+        results = client.bulk_update_listings({
+            "SKU-1": attributes(client, "One"),
+            "SKU-2": attributes(client, "Two"),
+        })
+
+        assert results == {
+            "SKU-1": {"status": "success", "issues": []},
+            "SKU-2": {"status": "success", "issues": []},
+        }
+        assert len(feeds.feeds) == 1
+        feed = next(iter(feeds.feeds.values()))
+        assert feed["feedType"] == "JSON_LISTINGS_FEED"
+        assert feed["marketplaceIds"] == [client.marketplace.marketplace_id]
+
+        document = feeds.documents[feed["inputFeedDocumentId"]]
+        assert document["header"]["version"] == "2.0"
+        assert [m["sku"] for m in document["messages"]] == ["SKU-1", "SKU-2"]
+        assert [m["messageId"] for m in document["messages"]] == [1, 2]
+        assert all(m["operationType"] == "UPDATE" for m in document["messages"])
+        assert document["messages"][1]["attributes"]["item_name"][0]["value"] == "Two"
+
+    def test_issues_map_to_skus(self, client, feeds):
+        """ERROR issues in the processing report fail only their SKU."""
+        feeds.reject_skus = {"SKU-2"}
+
+        results = client.bulk_update_listings({
+            "SKU-1": attributes(client, "One"),
+            "SKU-2": attributes(client, "Two"),
+        })
+
+        assert results["SKU-1"]["status"] == "success"
+        assert results["SKU-2"]["status"] == "failed"
+        assert results["SKU-2"]["issues"][0]["severity"] == "ERROR"
+
+    def test_waits_for_processing(self, client, feeds):
+        """The feed is polled until it is DONE."""
+        feeds.polls_until_done = 3
+
+        results = client.bulk_update_listings({"SKU-1": attributes(client, "One")}, poll_interval=0)
+
+        assert results["SKU-1"]["status"] == "success"
+        assert next(iter(feeds.feeds.values()))["polls"] == 3
+
+    def test_timeout(self, client, feeds):
+        """A feed that never finishes raises TimeoutError."""
+        feeds.polls_until_done = 1000
+
+        with pytest.raises(TimeoutError):
+            client.bulk_update_listings(
+                {"SKU-1": attributes(client, "One")}, poll_interval=0.01, timeout=0.05,
+            )
+
+    def test_empty(self, client, feeds):
+        """Nothing is submitted without listings."""
+        assert client.bulk_update_listings({}) == {}
+        assert feeds.feeds == {}
+
+    def test_local_feeds_from_env(self, monkeypatch):
+        """SP_API_LOCAL_FEEDS selects the local endpoint."""
+        monkeypatch.setenv("SP_API_LOCAL_FEEDS", "true")
+        client = SPAPIClient(refresh_token="r", lwa_app_id="app", lwa_client_secret="s")
+        assert isinstance(client.feeds_api, LocalFeedsEndpoint)
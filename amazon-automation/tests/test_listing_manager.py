@@ -0,0 +1,302 @@
+"""
+Tests for Listing Manager Module
+"""
+
+import copy
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.api.local_feeds import LocalFeedsEndpoint
+from src.api.rate_limiter import AdaptiveRateLimiter
+from src.api.sp_api_client import SPAPIClient
+from src.automation.listing_manager import (
+    ListingFingerprints,
+    ListingManager,
+    latency_percentiles,
+)
+
+
+PRODUCTS = {
+    "brand": "Shelzy's Designs",
+    "products": [
+        {
+            "sku": f"SKU-{i}",
+            "asin": f"B00000000{i}",
+            "name": f"Product {i}",
+            "listing": {
+                "title": f"Title {i}",
+                "bullet_points": ["One", "Two"],
+                "description": "Description",
+                "search_terms": "cup bottle",
+            },
+        }
+        for i in range(3)
+    ],
+}
+
+
+@pytest.fixture
+def products():
+    return copy.deepcopy(PRODUCTS)
+
+
+@pytest.fixture
+def manager(products, tmp_path):
+    config = Mock()
+    config.load_products.return_value = products
+    config.get_product_by_sku.side_effect = lambda sku: next(
+        p for p in products["products"] if p["sku"] == sku
+    )
+
+    sp_api = SPAPIClient(refresh_token="r", lwa_app_id="app", lwa_client_secret="s")
+    sp_api.update_listing = Mock(return_value={"status": "ACCEPTED"})
+
+    return ListingManager(
+        sp_api_client=sp_api,
+        config_loader=config,
+        fingerprints=ListingFingerprints(str(tmp_path / "fingerprints.json")),
+    )
+
+
+def pushed(manager):
+    return [c.kwargs["sku"] for c in manager.sp_api.update_listing.call_args_list]
+
+
+class TestChangeDetection:
+    """Test content-hash change detection in sync_listings."""
+
+    def test_unchanged_listings_are_skipped(self, manager, products):
+        """Only SKUs whose rendered content changed are pushed again."""
+        first = manager.sync_listings()
+        assert len(first["successful"]) == 3
+
+        manager.sp_api.update_listing.reset_mock()
+        products["products"][1]["listing"]["bullet_points"].append("Three")
+
+        results = manager.sync_listings()
+
+        assert pushed(manager) == ["SKU-1"]
+        assert [s["sku"] for s in results["skipped"]] == ["SKU-0", "SKU-2"]
+
+    def test_force_pushes_everything(self, manager):
+        """--force ignores fingerprints."""
+        manager.sync_listings()
+        manager.sp_api.update_listing.reset_mock()
+
+        results = manager.sync_listings(force=True)
+
+        assert pushed(manager) == ["SKU-0", "SKU-1", "SKU-2"]
+        assert results["skipped"] == []
+
+    def test_failed_push_is_retried(self, manager, tmp_path):
+        """A SKU whose push failed is not fingerprinted, so it is retried."""
+        manager.sp_api.update_listing.side_effect = [
+            {"status": "ACCEPTED"}, Exception("boom"), {"status": "ACCEPTED"},
+        ]
+        manager.sync_listings()
+
+        manager.sp_api.update_listing.side_effect = None
+        manager.sp_api.update_listing.reset_mock()
+        manager.fingerprints = ListingFingerprints(str(tmp_path / "fingerprints.json"))
+        manager.sync_listings()
+
+        assert pushed(manager) == ["SKU-1"]
+
+    def test_rejected_listing_is_retried(self, manager):
+        """An INVALID response fails the SKU and leaves it unfingerprinted."""
+        manager.sp_api.update_listing.side_effect = [
+            {"status": "ACCEPTED"},
+            {"status": "INVALID", "issues": [{"severity": "ERROR", "message": "Bad title"}]},
+            {"status": "ACCEPTED"},
+        ]
+        results = manager.sync_listings()
+
+        assert [r["sku"] for r in results["failed"]] == ["SKU-1"]
+        assert "INVALID" in results["failed"][0]["error"]
+        assert "Bad title" in results["failed"][0]["error"]
+
+        manager.sp_api.update_listing.side_effect = None
+        manager.sp_api.update_listing.reset_mock()
+        manager.sync_listings()
+
+        assert pushed(manager) == ["SKU-1"]
+
+    def test_brand_change_changes_fingerprint(self, manager, products):
+        """Brand is part of the rendered payload."""
+        product = products["products"][0]
+        before = manager.listing_fingerprint(product)
+        products["brand"] = "Other"
+        assert manager.listing_fingerprint(product) != before
+
+
+class TestParallelSync:
+    """Test the parallel listing update mode."""
+
+    def test_parallel_updates_overlap(self, manager):
+        """Updates run concurrently and keep the result structure."""
+        state = {"in_flight": 0, "max": 0}
+        lock = threading.Lock()
+
+        def update_listing(**kwargs):
+            with lock:
+                state["in_flight"] += 1
+                state["max"] = max(state["max"], state["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                state["in_flight"] -= 1
+            if kwargs["sku"] == "SKU-2":
+                raise Exception("boom")
+            return {"status": "ACCEPTED"}
+
+        manager.sp_api.update_listing.side_effect = update_listing
+
+        results = manager.sync_listings(parallel=True)
+
+        assert state["max"] > 1
+        assert [r["sku"] for r in results["successful"]] == ["SKU-0", "SKU-1"]
+        assert [r["sku"] for r in results["failed"]] == ["SKU-2"]
+        assert set(results["latency_ms"]) == {"p50", "p90", "p95", "p99", "max"}
+        assert results["latency_ms"]["p50"] >= 20
+
+    def test_pool_sized_to_listings_burst(self, manager):
+        """The pool matches the Listings Items API burst limit."""
+        assert manager.listing_workers() == int(SPAPIClient.RATE_LIMITS["listings"][1])
+
+    def test_latency_percentiles(self):
+        """Nearest-rank percentiles over the samples."""
+        summary = latency_percentiles([float(i) for i in range(1, 101)])
+        assert summary == {"p50": 50.0, "p90": 90.0, "p95": 95.0, "p99": 99.0, "max": 100.0}
+        assert latency_percentiles([]) == {}
+
+
+class TestBulkSync:
+    """Test the JSON_LISTINGS_FEED listing update mode."""
+
+    @pytest.fixture
+    def feeds(self, manager):
+        feeds = LocalFeedsEndpoint()
+        manager.sp_api.feeds_api = feeds
+        manager.sp_api.rate_limiter = AdaptiveRateLimiter(
+            limits=SPAPIClient.RATE_LIMITS, sleep=lambda seconds: None,
+        )
+        return feeds
+
+    def test_bulk_sends_one_feed(self, manager, feeds):
+        """Changed listings go out in one feed, not per-SKU calls."""
+        feeds.reject_skus = {"SKU-2"}
+
+        results = manager.sync_listings(bulk=True)
+
+        assert pushed(manager) == []
+        assert len(feeds.feeds) == 1
+        assert [r["sku"] for r in results["successful"]] == ["SKU-0", "SKU-1"]
+        assert [r["sku"] for r in results["failed"]] == ["SKU-2"]
+        assert "rejected" in results["failed"][0]["error"]
+        assert set(results["latency_ms"]) == {"p50", "p90", "p95", "p99", "max"}
+
+    def test_bulk_respects_fingerprints(self, manager, feeds, products):
+        """Only changed or previously failed SKUs go into the next feed."""
+        feeds.local = False  # stand in for Amazon's Feeds API
+        feeds.reject_skus = {"SKU-2"}
+        manager.sync_listings(bulk=True)
+
+        feeds.reject_skus = set()
+        products["products"][0]["listing"]["title"] = "New title"
+        results = manager.sync_listings(bulk=True)
+
+        document = feeds.documents["local-doc-2"]
+        assert [m["sku"] for m in document["messages"]] == ["SKU-0", "SKU-2"]
+        assert [s["sku"] for s in results["skipped"]] == ["SKU-1"]
+
+    def test_local_feeds_record_nothing(self, manager, feeds, tmp_path):
+        """Offline feed results are not saved as pushed."""
+        manager.sync_listings(bulk=True)
+
+        reloaded = ListingFingerprints(str(tmp_path / "fingerprints.json"))
+        assert [reloaded.get(f"SKU-{i}") for i in range(3)] == [None] * 3
+
+        manager.sync_listings()
+        assert pushed(manager) == ["SKU-0", "SKU-1", "SKU-2"]
+
+    def test_bulk_feed_error_fails_all(self, manager, feeds):
+        """A feed that cannot be submitted fails every pending SKU."""
+        manager.sp_api.submit_listings_feed = Mock(side_effect=Exception("upload failed"))
+
+        results = manager.sync_listings(bulk=True)
+
+        assert [r["error"] for r in results["failed"]] == ["upload failed"] * 3
+
+
+class TestPatchSync:
+    """Test the read-compare-patch listing update mode."""
+
+    @pytest.fixture
+    def live(self, manager, products):
+        """Live listings that match config, keyed by SKU."""
+        listings = {
+            p["sku"]: {
+                "sku": p["sku"],
+                "attributes": manager.sp_api.build_listing_attributes(**manager._listing_content(p)),
+            }
+            for p in products["products"]
+        }
+        manager.sp_api.get_listing = Mock(side_effect=lambda sku: copy.deepcopy(listings[sku]))
+        manager.sp_api.patch_listing = Mock(return_value={"status": "ACCEPTED"})
+        return listings
+
+    def test_only_diffs_are_patched(self, manager, live, products):
+        """Matching SKUs are skipped; changed ones get only changed attributes."""
+        products["products"][1]["listing"]["title"] = "New title"
+
+        results = manager.sync_listings(force=True, patch=True)
+
+        assert pushed(manager) == []
+        assert manager.sp_api.get_listing.call_count == 3
+        manager.sp_api.patch_listing.assert_called_once()
+        sku, patches = manager.sp_api.patch_listing.call_args.args
+        assert sku == "SKU-1"
+        assert [p["path"] for p in patches] == ["/attributes/item_name"]
+        assert results["successful"][0]["patched"] == ["item_name"]
+        assert [(s["sku"], s["reason"]) for s in results["skipped"]] == [
+            ("SKU-0", "matches_live"), ("SKU-2", "matches_live"),
+        ]
+
+    def test_missing_listing_gets_full_update(self, manager, live):
+        """A SKU with no live listing falls back to a full PUT."""
+        from sp_api.base.exceptions import SellingApiNotFoundException
+
+        def get_listing(sku):
+            if sku == "SKU-0":
+                raise SellingApiNotFoundException([{"message": "not found"}])
+            return copy.deepcopy(live[sku])
+
+        manager.sp_api.get_listing.side_effect = get_listing
+
+        results = manager.sync_listings(patch=True)
+
+        assert pushed(manager) == ["SKU-0"]
+        assert [r["sku"] for r in results["successful"]] == ["SKU-0"]
+
+    def test_rejected_patch_fails_sku(self, manager, live, products):
+        """An INVALID patch response is a failure and is not fingerprinted."""
+        products["products"][0]["listing"]["title"] = "New title"
+        manager.sp_api.patch_listing.return_value = {
+            "status": "INVALID", "issues": [{"severity": "ERROR", "message": "Bad title"}],
+        }
+
+        results = manager.sync_listings(patch=True)
+
+        assert [r["sku"] for r in results["failed"]] == ["SKU-0"]
+        assert manager.fingerprints.get("SKU-0") is None
+
+    def test_read_error_fails_sku(self, manager, live):
+        """Other read errors fail the SKU without writing."""
+        manager.sp_api.get_listing.side_effect = Exception("boom")
+
+        results = manager.sync_listings(patch=True)
+
+        assert [r["error"] for r in results["failed"]] == ["boom"] * 3
+        manager.sp_api.patch_listing.assert_not_called()
@@ -0,0 +1,180 @@
+"""
+Tests for Order Store Module
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sp_api.base.exceptions import SellingApiRequestThrottledException
+
+from src.api.order_store import OrderStore, parse_amazon_datetime
+from src.api.rate_limiter import AdaptiveRateLimiter
+from src.api.sp_api_client import SPAPIClient
+
+
+def iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def order(order_id, days_ago, delivered_days_ago=None, status="Shipped"):
+    now = datetime.utcnow()
+    return {
+        "AmazonOrderId": order_id,
+        "OrderStatus": status,
+        "PurchaseDate": iso(now - timedelta(days=days_ago)),
+        "LatestDeliveryDate": iso(now - timedelta(days=delivered_days_ago if delivered_days_ago is not None else days_ago - 3)),
+    }
+
+
+class FakeOrdersAPI:
+    """Orders API stand-in serving pages and recording request params."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    def get_orders(self, **params):
+        self.calls.append(params)
+        page = self.pages.pop(0)
+        if isinstance(page, Exception):
+            raise page
+        return Mock(payload=page)
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def client(tmp_path):
+    return SPAPIClient(
+        refresh_token="r", lwa_app_id="app", lwa_client_secret="s",
+        order_store=OrderStore(store_dir=str(tmp_path)),
+    )
+
+
+def serve(client, api):
+    """Make the client's pool hand out the fake Orders API."""
+    client._api_pool._factory = lambda api_class: api
+
+
+class TestOrderStore:
+    """Test suite for OrderStore."""
+
+    def test_parse_amazon_datetime_is_naive_utc(self):
+        """Zulu and offset timestamps compare against utcnow()."""
+        assert parse_amazon_datetime("2024-01-05T08:00:00Z") == datetime(2024, 1, 5, 8)
+        assert parse_amazon_datetime("2024-01-05T10:00:00+02:00") == datetime(2024, 1, 5, 8)
+        assert parse_amazon_datetime("garbage") is None
+
+    def test_round_trip_and_prune(self, tmp_path):
+        """Orders and the watermark survive a reload; old orders are pruned."""
+        store = OrderStore(store_dir=str(tmp_path), marketplace_id="US")
+        store.upsert([order("new", 2), order("old", 40)])
+        assert store.prune(datetime.utcnow() - timedelta(days=30)) == 1
+        store.save(watermark=datetime(2024, 1, 1))
+
+        reloaded = OrderStore(store_dir=str(tmp_path), marketplace_id="US")
+        assert [o["AmazonOrderId"] for o in reloaded.orders()] == ["new"]
+        assert reloaded.watermark == datetime(2024, 1, 1)
+
+
+class TestOrderSync:
+    """Test paginated and incremental order retrieval."""
+
+    def test_get_orders_follows_next_token(self, client):
+        """Every page is returned, not just the first."""
+        api = FakeOrdersAPI([
+            {"Orders": [order("a", 1)], "NextToken": "t1"},
+            {"Orders": [order("b", 1)]},
+        ])
+        serve(client, api)
+
+        orders = client.get_orders(created_after=datetime(2024, 1, 1))
+
+        assert [o["AmazonOrderId"] for o in orders] == ["a", "b"]
+        assert api.calls[1]["NextToken"] == "t1"
+        assert "CreatedAfter" not in api.calls[1]
+
+    def test_pagination_beyond_burst_is_paced(self, tmp_path, monkeypatch):
+        """Pages past the Orders burst wait for tokens and survive a 429."""
+        monkeypatch.setattr("src.api.sp_api_client.time.sleep", lambda s: None)
+        clock = FakeClock()
+        client = SPAPIClient(
+            refresh_token="r", lwa_app_id="app", lwa_client_secret="s",
+            order_store=OrderStore(store_dir=str(tmp_path)),
+            rate_limiter=AdaptiveRateLimiter(
+                limits=SPAPIClient.RATE_LIMITS, clock=clock, sleep=clock.sleep,
+            ),
+        )
+        pages = [
+            {"Orders": [order(f"o{i}", 1)], "NextToken": f"t{i}"} for i in range(24)
+        ]
+        pages[-1].pop("NextToken")
+        pages.insert(22, SellingApiRequestThrottledException([{"message": "throttled"}]))
+        api = FakeOrdersAPI(pages)
+        serve(client, api)
+
+        orders = client.get_orders(created_after=datetime(2024, 1, 1))
+
+        assert len(orders) == 24
+        assert api.calls[23] == api.calls[22]
+        assert clock.sleeps and clock.now >= 3 / 0.0167
+
+    def test_second_run_fetches_only_changes(self, client):
+        """After a full sync, later runs use LastUpdatedAfter and keep old orders."""
+        api = FakeOrdersAPI([
+            {"Orders": [order("a", 12), order("b", 20)]},
+            {"Orders": [order("c", 10, delivered_days_ago=6)]},
+        ])
+        serve(client, api)
+
+        first = client.get_delivered_orders(min_days_ago=5, max_days_ago=25)
+        second = client.get_delivered_orders(min_days_ago=5, max_days_ago=25)
+
+        assert "CreatedAfter" in api.calls[0]
+        assert "LastUpdatedAfter" in api.calls[1] and "CreatedAfter" not in api.calls[1]
+        assert sorted(o["AmazonOrderId"] for o in first) == ["a", "b"]
+        assert sorted(o["AmazonOrderId"] for o in second) == ["a", "b", "c"]
+
+    def test_status_changes_replace_stored_orders(self, client):
+        """An order that is no longer Shipped drops out of the eligible set."""
+        api = FakeOrdersAPI([
+            {"Orders": [order("a", 12)]},
+            {"Orders": [order("a", 12, status="Canceled")]},
+        ])
+        serve(client, api)
+
+        assert len(client.get_delivered_orders()) == 1
+        assert client.get_delivered_orders() == []
+
+    def test_longer_lookback_after_prune_refetches(self, client):
+        """A shorter lookback prunes, so a later longer one does a full sync."""
+        api = FakeOrdersAPI([
+            {"Orders": [order("a", 8), order("b", 20)]},
+            {"Orders": []},
+            {"Orders": [order("a", 8), order("b", 20)]},
+        ])
+        serve(client, api)
+
+        client.sync_orders(lookback_days=30)
+        client.sync_orders(lookback_days=10)
+        assert [o["AmazonOrderId"] for o in client.order_store.orders()] == ["a"]
+
+        client.sync_orders(lookback_days=25)
+
+        assert "LastUpdatedAfter" in api.calls[1]
+        assert "CreatedAfter" in api.calls[2]
+        assert sorted(o["AmazonOrderId"] for o in client.order_store.orders()) == ["a", "b"]
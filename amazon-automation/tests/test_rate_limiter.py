@@ -0,0 +1,173 @@
+"""
+Tests for Rate Limiter Module
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.api.advertising_client import AdvertisingClient
+from src.api.http_transport import PooledTransport
+from src.api.rate_limiter import AdaptiveRateLimiter, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_burst_then_paced(self):
+        """Burst tokens are free, later tokens are spaced at the rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(0.5)
+        assert waits[4] == pytest.approx(0.5)
+
+    def test_pause_blocks_until_elapsed(self):
+        """pause_for delays the next token by the pause duration."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=10, clock=clock, sleep=clock.sleep)
+
+        bucket.pause_for(3)
+        wait = bucket.acquire()
+
+        assert wait == pytest.approx(3.1)
+
+    def test_invalid_rate(self):
+        """Rate and burst must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, burst=1)
+
+
+class TestAdaptiveRateLimiter:
+    """Test suite for AdaptiveRateLimiter."""
+
+    @pytest.fixture
+    def limiter(self):
+        clock = FakeClock()
+        return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep)
+
+    def test_endpoint_families(self, limiter):
+        """Endpoints map to the expected families."""
+        assert limiter.endpoint_family("/v2/profiles") == "profiles"
+        assert limiter.endpoint_family("/v2/sp/spTargeting/report") == "reports"
+        assert limiter.endpoint_family("/v2/reports/abc") == "reports"
+        assert limiter.endpoint_family("/sp/keywords") == "keywords"
+        assert limiter.endpoint_family("/sp/campaignNegativeKeywords") == "keywords"
+        assert limiter.endpoint_family("/sp/targets") == "keywords"
+        assert limiter.endpoint_family("/sp/campaigns/list") == "campaigns"
+        assert limiter.endpoint_family("/sp/adGroups") == "campaigns"
+
+    def test_throttle_decreases_and_success_recovers(self, limiter):
+        """Rate halves on throttle and climbs back to the ceiling."""
+        assert limiter.current_rate("keywords") == 10.0
+
+        limiter.on_throttle("keywords")
+        assert limiter.current_rate("keywords") == 5.0
+
+        for _ in range(10):
+            limiter.on_success("keywords")
+        assert limiter.current_rate("keywords") == 10.0
+
+    def test_backoff_honours_retry_after(self, limiter):
+        """Retry-After is used as-is, otherwise exponential with jitter."""
+        assert limiter.backoff_delay(0, retry_after=7) == 7
+        for attempt in range(4):
+            delay = limiter.backoff_delay(attempt)
+            full = min(limiter.backoff_cap, limiter.backoff_base * 2 ** attempt)
+            assert full / 2 <= delay <= full
+
+
+def test_parse_retry_after():
+    """Retry-After accepts seconds and ignores junk."""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestMakeRequestRetries:
+    """Test throttling behaviour in AdvertisingClient._make_request."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr("src.api.advertising_client.time.sleep", lambda s: None)
+        clock = FakeClock()
+        client = AdvertisingClient(
+            client_id="cid",
+            profile_id="123",
+            transport=Mock(spec=PooledTransport),
+            rate_limiter=AdaptiveRateLimiter(clock=clock, sleep=clock.sleep),
+            max_retries=2,
+        )
+        client._get_access_token = Mock(return_value="tok")
+        return client
+
+    @staticmethod
+    def _response(status, body="", headers=None):
+        response = Mock(status_code=status, text=body, headers=headers or {})
+        response.json.return_value = {"ok": True}
+        if status >= 400:
+            response.raise_for_status.side_effect = Exception(f"HTTP {status}")
+        return response
+
+    def test_retries_429_then_succeeds(self, client):
+        """A throttled request is retried and lowers the family rate."""
+        client._transport.request.side_effect = [
+            self._response(429, headers={"Retry-After": "2"}),
+            self._response(200, body='{"ok": true}'),
+        ]
+
+        assert client._make_request("PUT", "/sp/keywords", data={}) == {"ok": True}
+        assert client._transport.request.call_count == 2
+        assert client.rate_limiter.current_rate("keywords") < 10.0
+
+    def test_gives_up_after_max_retries(self, client):
+        """Persistent 5xx responses raise after max_retries."""
+        client._transport.request.return_value = self._response(503)
+
+        with pytest.raises(Exception, match="HTTP 503"):
+            client._make_request("POST", "/sp/campaigns/list", data={})
+        assert client._transport.request.call_count == 3
+
+    def test_client_errors_not_retried(self, client):
+        """4xx other than 429 fail immediately."""
+        client._transport.request.return_value = self._response(400)
+
+        with pytest.raises(Exception, match="HTTP 400"):
+            client._make_request("POST", "/sp/campaigns", data={})
+        assert client._transport.request.call_count == 1
+
+    def test_create_posts_not_retried_on_5xx(self, client):
+        """A 5xx on a create may have committed, so it is not repeated."""
+        client._transport.request.return_value = self._response(502)
+
+        with pytest.raises(Exception, match="HTTP 502"):
+            client._make_request("POST", "/sp/keywords", data={})
+        assert client._transport.request.call_count == 1
+
+    def test_create_posts_retried_on_429(self, client):
+        """A throttled create was rejected outright, so it is retried."""
+        client._transport.request.side_effect = [
+            self._response(429),
+            self._response(207, body='{"ok": true}'),
+        ]
+
+        assert client._make_request("POST", "/sp/keywords", data={}) == {"ok": True}
+        assert client._transport.request.call_count == 2
@@ -0,0 +1,128 @@
+"""
+Tests for Report Cache Module
+"""
+
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.api.advertising_client import AdvertisingClient
+from src.api.report_cache import ReportCache
+
+ROWS = [{"keywordId": str(i), "clicks": i, "cost": i * 0.5} for i in range(50)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReportCache(cache_dir=str(tmp_path / "reports"))
+
+
+def _age(cache, key, seconds):
+    """Backdate an entry's write and read times."""
+    path = cache._path(key)
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+class TestReportCache:
+    """Test suite for ReportCache."""
+
+    def test_key_ignores_metric_order(self):
+        """The same metric set in any order maps to one key."""
+        a = ReportCache.make_key("1", "spTargeting", "2024-01-01", "2024-01-07", ["clicks", "cost"])
+        b = ReportCache.make_key("1", "spTargeting", "2024-01-01", "2024-01-07", ["cost", "clicks"])
+        assert a == b
+
+    def test_key_differs_by_profile_and_window(self):
+        """Profile and date range are part of the key."""
+        base = ReportCache.make_key("1", "spTargeting", "2024-01-01", "2024-01-07", ["clicks"])
+        assert base != ReportCache.make_key("2", "spTargeting", "2024-01-01", "2024-01-07", ["clicks"])
+        assert base != ReportCache.make_key("1", "spTargeting", "2024-01-02", "2024-01-08", ["clicks"])
+
+    def test_round_trip(self, cache):
+        """Stored rows come back unchanged."""
+        cache.put("k", ROWS)
+        assert list(cache.get("k")) == ROWS
+
+    def test_miss(self, cache):
+        """Unknown keys return None."""
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self, cache):
+        """Entries older than the TTL are misses and removed."""
+        cache.ttl_seconds = 60
+        cache.put("k", ROWS)
+        _age(cache, "k", 120)
+
+        assert cache.get("k") is None
+        assert not cache._path("k").exists()
+
+    def test_partial_consumption_is_not_cached(self, cache):
+        """Abandoning the write-through iterator leaves no entry."""
+        rows = cache.write_through("k", iter(ROWS))
+        next(rows)
+        rows.close()
+
+        assert cache.get("k") is None
+        assert list(cache.cache_dir.iterdir()) == []
+
+    def test_evicts_least_recently_read(self, cache):
+        """Over the size budget, the entry read longest ago goes first."""
+        cache.put("old", ROWS)
+        cache.put("new", ROWS)
+        _age(cache, "old", 100)
+        _age(cache, "new", 50)
+        list(cache.get("old"))
+
+        cache.max_bytes = cache._path("old").stat().st_size
+        cache.evict()
+
+        assert cache._path("old").exists()
+        assert not cache._path("new").exists()
+
+
+class TestClientReportCache:
+    """Test AdvertisingClient reports served from the cache."""
+
+    SPECS = {
+        "keywords": {
+            "report_type": "spTargeting",
+            "metrics": ["clicks"],
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-07",
+        }
+    }
+
+    def _client(self, cache):
+        client = AdvertisingClient(profile_id="123", report_cache=cache)
+        client.run_concurrently = Mock(
+            side_effect=lambda calls: [
+                "report-1" if name == "request_report"
+                else {"status": "SUCCESS", "location": "url"}
+                for name, _ in calls
+            ]
+        )
+        client.iter_report_rows = Mock(side_effect=lambda url: iter(ROWS))
+        client.download_report = Mock(side_effect=lambda url: list(ROWS))
+        return client
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_second_run_skips_report_generation(self, cache, stream):
+        """A repeated request is answered from disk without API calls."""
+        first = self._client(cache)
+        assert [(n, list(r)) for n, r in first.iter_reports(self.SPECS, stream=stream)] == [
+            ("keywords", ROWS)
+        ]
+
+        second = self._client(cache)
+        assert [(n, list(r)) for n, r in second.iter_reports(self.SPECS, stream=stream)] == [
+            ("keywords", ROWS)
+        ]
+        second.run_concurrently.assert_not_called()
+
+    def test_cache_disabled(self):
+        """use_report_cache=False always goes to the API."""
+        client = AdvertisingClient(profile_id="123", use_report_cache=False)
+        assert client.report_cache is None
@@ -0,0 +1,104 @@
+"""
+Tests for Report Scheduler Module
+"""
+
+import pytest
+
+from src.api.report_scheduler import ReportScheduler
+
+
+class FakeClock:
+    """Deterministic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeReportClient:
+    """Client stub whose reports finish after a set number of polls."""
+
+    def __init__(self, polls_until_ready):
+        self.polls_until_ready = polls_until_ready
+        self.polls = {name: 0 for name in polls_until_ready}
+        self.requested = []
+        self.log = []
+
+    def run_concurrently(self, calls, return_exceptions=False):
+        return [getattr(self, name)(**kwargs) for name, kwargs in calls]
+
+    def request_report(self, report_type, **kwargs):
+        self.requested.append(report_type)
+        self.log.append(("request", report_type))
+        return report_type
+
+    def get_report_status(self, report_id):
+        self.polls[report_id] += 1
+        self.log.append(("poll", report_id))
+        if self.polls_until_ready[report_id] is None:
+            return {"status": "FAILURE"}
+        if self.polls[report_id] >= self.polls_until_ready[report_id]:
+            return {"status": "SUCCESS", "location": report_id}
+        return {"status": "IN_PROGRESS"}
+
+    def download_report(self, location):
+        return [{"report": location}]
+
+
+class TestReportScheduler:
+    """Test suite for ReportScheduler."""
+
+    def _scheduler(self, client, clock, **kwargs):
+        return ReportScheduler(client, clock=clock, sleep=clock.sleep, **kwargs)
+
+    def test_requests_all_reports_before_polling(self):
+        """Every report is requested before the first status check."""
+        clock = FakeClock()
+        client = FakeReportClient({"spTargeting": 3, "spSearchTerm": 1})
+        scheduler = self._scheduler(client, clock)
+        scheduler.add("keywords", "spTargeting").add("search_terms", "spSearchTerm")
+
+        results = list(scheduler.iter_ready())
+
+        assert client.log[:2] == [("request", "spTargeting"), ("request", "spSearchTerm")]
+        assert [name for name, _ in results] == ["search_terms", "keywords"]
+        assert dict(results)["keywords"] == [{"report": "spTargeting"}]
+
+    def test_backoff_grows_and_is_capped(self):
+        """Polls back off exponentially up to max_delay."""
+        clock = FakeClock()
+        client = FakeReportClient({"spTargeting": 5})
+        scheduler = self._scheduler(
+            client, clock, initial_delay=1, backoff_factor=2, max_delay=3
+        )
+        scheduler.add("keywords", "spTargeting")
+
+        scheduler.run()
+
+        # Polls at t=1, 3, 6, 9, 12
+        assert clock.now == pytest.approx(12)
+
+    def test_failure_raises(self):
+        """A failed report raises."""
+        clock = FakeClock()
+        client = FakeReportClient({"spTargeting": None})
+        scheduler = self._scheduler(client, clock)
+        scheduler.add("keywords", "spTargeting")
+
+        with pytest.raises(Exception, match="Report failed"):
+            scheduler.run()
+
+    def test_timeout_raises(self):
+        """Reports still pending at the deadline raise."""
+        clock = FakeClock()
+        client = FakeReportClient({"spTargeting": 10_000})
+        scheduler = self._scheduler(client, clock, timeout=60)
+        scheduler.add("keywords", "spTargeting")
+
+        with pytest.raises(Exception, match="Report timed out: keywords"):
+            scheduler.run()
@@ -0,0 +1,178 @@
+"""
+Tests for Report Store Module
+"""
+
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.api.advertising_client import AdvertisingClient
+from src.api.report_store import DailyReportStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DailyReportStore(store_dir=str(tmp_path), profile_id="123")
+
+
+class TestDailyReportStore:
+    """Test suite for DailyReportStore."""
+
+    def test_window_days_end_yesterday(self):
+        """The window covers lookback_days days ending yesterday."""
+        days = DailyReportStore.window_days(3, today=date(2024, 3, 1))
+        assert days == ["2024-02-27", "2024-02-28", "2024-02-29"]
+
+    def test_round_trip_with_sparse_columns(self, store):
+        """Columns first seen mid-day are back-filled and read back."""
+        rows = [{"targetId": "1", "clicks": 2}, {"targetId": "2", "clicks": 3, "bid": 0.5}]
+        assert store.write_day("spTargeting", "2024-01-01", rows) == 2
+        assert list(store.read_day("spTargeting", "2024-01-01")) == rows
+
+    def test_missing_days(self, store):
+        """Only days without a partition are reported missing."""
+        store.write_day("spTargeting", "2024-01-02", [])
+        assert store.missing_days("spTargeting", ["2024-01-01", "2024-01-02"]) == ["2024-01-01"]
+        assert store.missing_days("spSearchTerm", ["2024-01-02"]) == ["2024-01-02"]
+
+    def test_recent_days_are_refetched(self, store):
+        """Stored days inside the restatement window are fetched again."""
+        days = ["2024-02-25", "2024-02-26", "2024-02-27", "2024-02-28", "2024-02-29"]
+        for day in days[1:]:
+            store.write_day("spTargeting", day, [])
+
+        fetch = store.days_to_fetch("spTargeting", days, today=date(2024, 3, 1))
+
+        assert fetch == ["2024-02-25", "2024-02-27", "2024-02-28", "2024-02-29"]
+
+    def test_metric_sets_are_partitioned_separately(self, store):
+        """A changed metric list never reads partitions of the old one."""
+        store.write_day("spTargeting", "2024-01-01", [{"clicks": 1}], metrics=["clicks"])
+
+        assert store.has_day("spTargeting", "2024-01-01", metrics=["clicks"])
+        assert not store.has_day("spTargeting", "2024-01-01", metrics=["clicks", "cost"])
+        assert store.missing_days("spTargeting", ["2024-01-01"], metrics=["cost", "clicks"]) == ["2024-01-01"]
+        assert store.aggregate("spTargeting", ["2024-01-01"], metrics=["clicks", "cost"]) == []
+
+    def test_aggregate_sums_metrics_and_keeps_latest_attributes(self, store):
+        """Metrics add up across days; attributes come from the newest day."""
+        store.write_day("spTargeting", "2024-01-01", [
+            {"campaignId": "c", "adGroupId": "a", "targetId": "1", "clicks": 5, "cost": 2.5, "bid": 1.0},
+            {"campaignId": "c", "adGroupId": "a", "targetId": "2", "clicks": 1, "cost": 0.5, "bid": 0.4},
+        ])
+        store.write_day("spTargeting", "2024-01-02", [
+            {"campaignId": "c", "adGroupId": "a", "targetId": "1", "clicks": 3, "cost": 1.5, "bid": 1.2},
+        ])
+
+        rows = store.aggregate("spTargeting", ["2024-01-02", "2024-01-01", "2024-01-03"])
+        by_id = {row["targetId"]: row for row in rows}
+
+        assert by_id["1"]["clicks"] == 8
+        assert by_id["1"]["cost"] == pytest.approx(4.0)
+        assert by_id["1"]["bid"] == 1.2
+        assert by_id["2"]["clicks"] == 1
+
+    def test_prune(self, store):
+        """Days outside the kept set are deleted."""
+        store.write_day("spTargeting", "2024-01-01", [])
+        store.write_day("spTargeting", "2024-01-02", [])
+        assert store.prune("spTargeting", ["2024-01-02"]) == 1
+        assert store.missing_days("spTargeting", ["2024-01-01", "2024-01-02"]) == ["2024-01-01"]
+
+    def test_prune_drops_other_metric_sets(self, store):
+        """Partitions of a replaced metric list are removed."""
+        store.write_day("spTargeting", "2024-01-02", [], metrics=["clicks"])
+        store.write_day("spTargeting", "2024-01-02", [], metrics=["clicks", "cost"])
+
+        assert store.prune("spTargeting", ["2024-01-02"], metrics=["clicks", "cost"]) == 1
+        assert store.has_day("spTargeting", "2024-01-02", metrics=["clicks", "cost"])
+        assert not store.has_day("spTargeting", "2024-01-02", metrics=["clicks"])
+
+
+class TestClientReportStore:
+    """Test AdvertisingClient filling and reading the daily store."""
+
+    def _client(self, store):
+        client = AdvertisingClient(profile_id="123", report_store=store, use_report_cache=False)
+        requested = []
+
+        def run_concurrently(calls):
+            results = []
+            for name, kwargs in calls:
+                if name == "request_report":
+                    requested.append(kwargs["start_date"])
+                    results.append(kwargs["start_date"])
+                else:
+                    results.append({"status": "SUCCESS", "location": kwargs["report_id"]})
+            return results
+
+        client.run_concurrently = Mock(side_effect=run_concurrently)
+        client.iter_report_rows = Mock(
+            side_effect=lambda day: iter([
+                {"campaignId": "c", "adGroupId": "a", "targetId": "1", "clicks": 1, "cost": 1.0}
+            ])
+        )
+        return client, requested
+
+    def test_only_missing_days_are_downloaded(self, store):
+        """A second run with a longer window fetches just the new days."""
+        days = ["2024-02-27", "2024-02-28", "2024-02-29"]
+        with patch.object(DailyReportStore, "window_days", side_effect=lambda n: days[-n:]):
+            client, requested = self._client(store)
+            rows = client.get_keyword_performance(lookback_days=2)
+            assert sorted(requested) == days[1:]
+            assert rows[0]["clicks"] == 2
+
+            client, requested = self._client(store)
+            rows = client.get_keyword_performance(lookback_days=3)
+            assert requested == days[:1]
+            assert rows[0]["clicks"] == 3
+
+            client, requested = self._client(store)
+            client.get_keyword_performance(lookback_days=3)
+            client.run_concurrently.assert_not_called()
+
+    def test_old_days_are_pruned(self, tmp_path):
+        """Days older than the window and retention are deleted after a run."""
+        store = DailyReportStore(store_dir=str(tmp_path), profile_id="123", retention_days=2)
+        metrics = AdvertisingClient.KEYWORD_REPORT_METRICS
+        store.write_day("spTargeting", "2020-01-01", [], metrics=metrics)
+
+        client, _ = self._client(store)
+        client.get_keyword_performance(lookback_days=2)
+
+        assert not store.has_day("spTargeting", "2020-01-01", metrics=metrics)
+        assert store.missing_days("spTargeting", DailyReportStore.window_days(2), metrics=metrics) == []
+
+    def test_store_is_opt_in(self):
+        """By default optimization reports stream straight from the API."""
+        assert AdvertisingClient(profile_id="123").report_store is None
+        assert AdvertisingClient(profile_id="123", use_report_store=True).report_store is not None
+
+    def test_store_honors_stream(self, store):
+        """Stored reports are yielded as iterators when streaming."""
+        with patch.object(DailyReportStore, "window_days", side_effect=lambda n: ["2024-02-29"]):
+            client, _ = self._client(store)
+            reports = dict(client.iter_optimization_reports(lookback_days=1, stream=True))
+
+        assert not isinstance(reports["keywords"], list)
+        assert list(reports["keywords"])[0]["clicks"] == 1
+
+    def test_restated_days_replace_stored_ones(self, tmp_path):
+        """Yesterday is downloaded again and its new figures replace the old."""
+        store = DailyReportStore(store_dir=str(tmp_path), profile_id="123", restate_days=1)
+        days = DailyReportStore.window_days(3)
+
+        client, requested = self._client(store)
+        client.get_keyword_performance(lookback_days=3)
+        assert sorted(requested) == days
+
+        client, requested = self._client(store)
+        client.iter_report_rows.side_effect = lambda day: iter([
+            {"campaignId": "c", "adGroupId": "a", "targetId": "1", "clicks": 5, "cost": 1.0}
+        ])
+        rows = client.get_keyword_performance(lookback_days=3)
+
+        assert requested == days[-1:]
+        assert rows[0]["clicks"] == 7
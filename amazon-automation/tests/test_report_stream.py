@@ -0,0 +1,81 @@
+"""
+Tests for Report Stream Module
+"""
+
+import gzip
+import json
+
+import pytest
+from unittest.mock import Mock
+
+from src.api.advertising_client import AdvertisingClient
+from src.api.http_transport import PooledTransport
+from src.api.report_stream import iter_json_array, iter_report_rows
+
+
+ROWS = [
+    {"targetId": str(i), "clicks": i, "cost": i * 0.5, "query": "café bottle"}
+    for i in range(200)
+]
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterReportRows:
+    """Test suite for streaming report parsing."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 100000])
+    def test_gzip_rows_any_chunking(self, chunk_size):
+        """Rows parse identically regardless of chunk boundaries."""
+        body = gzip.compress(json.dumps(ROWS).encode("utf-8"))
+        assert list(iter_report_rows(_chunks(body, chunk_size))) == ROWS
+
+    def test_plain_json_passthrough(self):
+        """Bodies already decoded by Content-Encoding are parsed directly."""
+        body = json.dumps(ROWS).encode("utf-8")
+        assert list(iter_report_rows(_chunks(body, 50))) == ROWS
+
+    def test_rows_yielded_before_stream_ends(self):
+        """The first row is available before later chunks are read."""
+        body = json.dumps(ROWS).encode("utf-8")
+        consumed = []
+
+        def source():
+            for chunk in _chunks(body, 100):
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(iter_report_rows(source()))
+
+        assert first == ROWS[0]
+        assert len(consumed) < len(_chunks(body, 100))
+
+    def test_scalars_split_across_chunks(self):
+        """Numbers cut at a chunk boundary are not parsed early."""
+        assert list(iter_json_array(["[1", "2, 3", "]"])) == [12, 3]
+
+    def test_truncated_body_raises(self):
+        """A body without the closing bracket raises."""
+        with pytest.raises(ValueError):
+            list(iter_json_array(['[{"a": 1}, {"b"']))
+
+    def test_non_array_raises(self):
+        """A non-array body raises."""
+        with pytest.raises(ValueError):
+            list(iter_json_array(['{"error": "x"}']))
+
+
+def test_download_report_streams_from_transport():
+    """download_report reads the body as a stream and closes it."""
+    body = gzip.compress(json.dumps(ROWS).encode("utf-8"))
+    response = Mock(status_code=200)
+    response.iter_content.return_value = iter(_chunks(body, 1024))
+    transport = Mock(spec=PooledTransport)
+    transport.get.return_value = response
+    client = AdvertisingClient(client_id="cid", profile_id="123", transport=transport)
+
+    assert client.download_report("https://reports.example/r.json.gz") == ROWS
+    assert transport.get.call_args[1]["stream"] is True
+    response.close.assert_called_once()
@@ -0,0 +1,179 @@
+"""
+Tests for Review Requester Module
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.automation.review_requester import (
+    EligibilityCache,
+    ReviewRequester,
+    ReviewRequestTracker,
+)
+
+
+class FakeSPAPI:
+    """SP-API client stub with a fixed set of eligible orders."""
+
+    def __init__(self, order_ids, eligible):
+        self.order_ids = order_ids
+        self.eligible = set(eligible)
+        self.checked = []
+        self.requested = []
+
+    def get_delivered_orders(self, **kwargs):
+        return [{"AmazonOrderId": order_id} for order_id in self.order_ids]
+
+    def check_review_eligibility(self, order_ids, max_workers=1):
+        self.checked.extend(order_ids)
+        return {order_id: order_id in self.eligible for order_id in order_ids}
+
+    def request_review(self, order_id):
+        self.requested.append(order_id)
+        return {"status": "success", "order_id": order_id}
+
+
+@pytest.fixture
+def config():
+    config = Mock()
+    config.load_settings.return_value = {
+        "automation": {
+            "review_requests": {"batch_size": 3, "delay_between_requests_ms": 0},
+        },
+    }
+    return config
+
+
+class TestEligibilityPrecheck:
+    """Test the eligibility pre-check phase."""
+
+    def test_only_eligible_orders_are_solicited(self, config):
+        """Ineligible orders are skipped and the batch is filled with eligible ones."""
+        sp_api = FakeSPAPI([f"o{i}" for i in range(8)], eligible=["o1", "o4", "o5", "o7"])
+        requester = ReviewRequester(sp_api_client=sp_api, config_loader=config)
+
+        results = requester.run_review_requests()
+
+        assert sp_api.requested == ["o1", "o4", "o5"]
+        assert sp_api.checked == ["o0", "o1", "o2", "o3", "o4", "o5"]
+        assert [s["order_id"] for s in results["skipped"]] == ["o0", "o2", "o3"]
+        assert results["requests_sent"] == 3
+
+    def test_cached_results_skip_lookups(self, config, tmp_path):
+        """A rerun within the expiry reuses lookups and never re-solicits."""
+        sp_api = FakeSPAPI(["a", "b", "c"], eligible=["a", "b"])
+        cache_file = str(tmp_path / "eligibility.json")
+
+        ReviewRequester(
+            sp_api_client=sp_api, config_loader=config,
+            eligibility_cache=EligibilityCache(cache_file=cache_file),
+        ).run_review_requests()
+        sp_api.checked.clear()
+        sp_api.requested.clear()
+
+        results = ReviewRequester(
+            sp_api_client=sp_api, config_loader=config,
+            eligibility_cache=EligibilityCache(cache_file=cache_file),
+        ).run_review_requests()
+
+        assert sp_api.checked == []
+        assert sp_api.requested == []
+        assert len(results["skipped"]) == 3
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_unexpected_error_keeps_sent_results(self, config, tmp_path, workers):
+        """An unexpected error for one order does not lose the others."""
+        sp_api = FakeSPAPI(["a", "b", "c"], eligible=["a", "b", "c"])
+        send = sp_api.request_review
+
+        def request_review(order_id):
+            if order_id == "b":
+                raise ValueError("unexpected payload")
+            return send(order_id)
+
+        sp_api.request_review = request_review
+        cache = EligibilityCache(cache_file=str(tmp_path / "e.json"))
+
+        results = ReviewRequester(
+            sp_api_client=sp_api, config_loader=config, eligibility_cache=cache,
+        ).run_review_requests(max_workers=workers)
+
+        assert "error" not in results
+        assert results["requests_sent"] == 3
+        assert sorted(results["successful"]) == ["a", "c"]
+        assert results["failed"] == [{"order_id": "b", "error": "unexpected payload"}]
+        assert cache.get("a") is False
+
+    def test_cache_entries_expire(self, tmp_path):
+        """Results older than the TTL are looked up again."""
+        now = [1000.0]
+        cache = EligibilityCache(cache_file=str(tmp_path / "e.json"), ttl_hours=1, clock=lambda: now[0])
+        cache.update({"a": True})
+        assert cache.get("a") is True
+        now[0] += 3600
+        assert cache.get("a") is None
+
+
+class TestReviewRequestTracker:
+    """Test suite for the SQLite-backed tracker."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        tracker = ReviewRequestTracker(db_file=str(tmp_path / "requests.db"), history_file=None)
+        yield tracker
+        tracker.close()
+
+    def test_uses_wal_and_timestamp_index(self, tracker):
+        """The database runs in WAL mode with a timestamp index."""
+        assert tracker._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = tracker._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM review_requests WHERE timestamp >= '2024'"
+        ).fetchall()
+        assert "idx_review_requests_timestamp" in str(plan)
+
+    def test_batched_commits(self, tmp_path):
+        """Records are committed every commit_every writes and on close."""
+        db_file = str(tmp_path / "requests.db")
+        tracker = ReviewRequestTracker(db_file=db_file, history_file=None, commit_every=2)
+        reader = sqlite3.connect(db_file)
+        count = lambda: reader.execute("SELECT COUNT(*) FROM review_requests").fetchone()[0]
+
+        tracker.record_request("a", "success")
+        assert tracker.has_been_requested("a")
+        assert count() == 0
+        tracker.record_request("b", "failed", error="ineligible")
+        assert count() == 2
+        tracker.record_request("c", "success")
+        tracker.close()
+        assert count() == 3
+
+    def test_recent_and_cleanup_by_range(self, tracker):
+        """Range queries split requests on their timestamp."""
+        old = (datetime.utcnow() - timedelta(days=100)).isoformat()
+        tracker._conn.execute(
+            "INSERT INTO review_requests VALUES (?, ?, ?, ?)", ("old", old, "success", None)
+        )
+        tracker.record_request("new", "success")
+
+        assert [r["order_id"] for r in tracker.get_recent_requests(days=7)] == ["new"]
+        assert tracker.cleanup_old_requests(days=90) == 1
+        assert not tracker.has_been_requested("old")
+
+    def test_imports_json_history_once(self, tmp_path):
+        """The legacy JSON file is imported into a new database only."""
+        history = tmp_path / "history.json"
+        history.write_text(json.dumps({"requests": {
+            "a": {"timestamp": "2024-01-01T00:00:00", "status": "success", "error": None},
+        }}))
+        db_file = str(tmp_path / "requests.db")
+
+        with ReviewRequestTracker(db_file=db_file, history_file=str(history)) as tracker:
+            assert tracker.has_been_requested("a")
+            tracker.cleanup_old_requests(days=1)
+
+        with ReviewRequestTracker(db_file=db_file, history_file=str(history)) as tracker:
+            assert not tracker.has_been_requested("a")
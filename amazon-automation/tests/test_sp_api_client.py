@@ -0,0 +1,166 @@
+"""
+Tests for SP-API Client Module
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from sp_api.base.exceptions import SellingApiForbiddenException, SellingApiRequestThrottledException
+
+from src.api.rate_limiter import AdaptiveRateLimiter
+from src.api.sp_api_client import SPAPIClient, send_review_requests
+
+
+@pytest.fixture
+def client():
+    return SPAPIClient(
+        refresh_token="r", lwa_app_id="app", lwa_client_secret="s",
+        rate_limiter=AdaptiveRateLimiter(
+            limits=SPAPIClient.RATE_LIMITS, sleep=lambda seconds: None,
+        ),
+    )
+
+
+def serve(client, api):
+    """Make the client's pool hand out a fake API object."""
+    client._api_pool._factory = lambda api_class: api
+
+
+class TestReviewSolicitation:
+    """Test rate-limited review requests."""
+
+    def test_throttled_request_is_retried(self, client):
+        """A 429 lowers the rate and the request is retried."""
+        api = Mock()
+        api.create_product_review_and_seller_feedback_solicitation.side_effect = [
+            SellingApiRequestThrottledException([{"message": "slow down"}], headers={}),
+            Mock(payload={}),
+        ]
+        serve(client, api)
+
+        with patch("src.api.sp_api_client.time.sleep") as sleep:
+            result = client.request_review("order-1")
+
+        assert result == {"status": "success", "order_id": "order-1"}
+        sleep.assert_called_once()
+        assert client.rate_limiter.current_rate("solicitations") < 1.0
+
+    def test_other_errors_fail_without_retry(self, client):
+        """Non-throttling errors keep the failed result structure."""
+        api = Mock()
+        api.create_product_review_and_seller_feedback_solicitation.side_effect = (
+            SellingApiForbiddenException([{"message": "ineligible"}])
+        )
+        serve(client, api)
+
+        result = client.request_review("order-1")
+
+        assert result["status"] == "failed"
+        assert api.create_product_review_and_seller_feedback_solicitation.call_count == 1
+
+    def test_parallel_batch_keeps_result_structure(self, client):
+        """Worker mode overlaps requests and reports every order."""
+        state = {"in_flight": 0, "max": 0}
+        lock = threading.Lock()
+
+        def solicit(amazonOrderId, **kwargs):
+            with lock:
+                state["in_flight"] += 1
+                state["max"] = max(state["max"], state["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                state["in_flight"] -= 1
+            if amazonOrderId == "order-3":
+                raise SellingApiForbiddenException([{"message": "ineligible"}])
+            return Mock(payload={})
+
+        client._api_pool._factory = lambda api_class: Mock(
+            create_product_review_and_seller_feedback_solicitation=solicit
+        )
+        order_ids = [f"order-{i}" for i in range(5)]
+
+        results = client.batch_request_reviews(order_ids, max_workers=5)
+
+        assert state["max"] > 1
+        assert results["total"] == 5
+        assert sorted(results["successful"]) == ["order-0", "order-1", "order-2", "order-4"]
+        assert [f["order_id"] for f in results["failed"]] == ["order-3"]
+
+    def test_parallel_results_yield_as_they_complete(self):
+        """A slow early order does not hold back finished later ones."""
+        release = threading.Event()
+
+        def request(order_id):
+            if order_id == "slow":
+                release.wait(5)
+            return {"status": "success", "order_id": order_id}
+
+        sent = send_review_requests(request, ["slow", "fast"], max_workers=2)
+
+        assert next(sent)[0] == "fast"
+        release.set()
+        assert next(sent)[0] == "slow"
+
+    def test_check_review_eligibility(self, client):
+        """Eligibility comes from the order's available solicitation actions."""
+        actions = {
+            "a": {"_links": {"actions": [{"name": "productReviewAndSellerFeedback"}]}},
+            "b": {"_links": {"actions": []}},
+        }
+
+        def lookup(order_id, **kwargs):
+            if order_id == "c":
+                raise SellingApiForbiddenException([{"message": "no access"}])
+            return Mock(payload=actions[order_id])
+
+        serve(client, Mock(get_solicitation_actions_for_order=lookup))
+
+        assert client.check_review_eligibility(["a", "b", "c"], max_workers=3) == {
+            "a": True, "b": False, "c": None,
+        }
+
+
+class TestListingPatches:
+    """Test attribute-level diffs against live listings."""
+
+    def test_only_changed_attributes(self, client):
+        """Unchanged attributes and read-only fields produce no patches."""
+        desired = client.build_listing_attributes(
+            title="New", bullet_points=["One"], description="Desc", search_terms="cup",
+        )
+        live = {
+            name: [dict(entry, language_tag="en_US") for entry in values]
+            for name, values in desired.items()
+        }
+        live["item_name"] = [{"value": "Old", "marketplace_id": "ATVPDKIKX0DER", "language_tag": "en_US"}]
+        live["color"] = [{"value": "Red"}]
+
+        patches = client.build_listing_patches(live, desired)
+
+        assert patches == [{"op": "replace", "path": "/attributes/item_name", "value": desired["item_name"]}]
+
+    def test_added_and_removed_values(self, client):
+        """A different number of values is a change; missing attributes are added."""
+        desired = client.build_listing_attributes(
+            title="T", bullet_points=["One", "Two"], description="D", search_terms="s",
+        )
+        live = dict(desired, bullet_point=desired["bullet_point"][:1])
+        del live["generic_keyword"]
+
+        paths = [p["path"] for p in client.build_listing_patches(live, desired)]
+
+        assert paths == ["/attributes/bullet_point", "/attributes/generic_keyword"]
+        assert client.build_listing_patches(desired, desired) == []
+
+    def test_patch_listing_body(self, client):
+        """patch_listing sends only the patches with the product type."""
+        api = Mock()
+        api.patch_listings_item.return_value = Mock(payload={"status": "ACCEPTED"})
+        serve(client, api)
+        patches = [{"op": "replace", "path": "/attributes/item_name", "value": []}]
+
+        assert client.patch_listing("SKU-1", patches) == {"status": "ACCEPTED"}
+        body = api.patch_listings_item.call_args.kwargs["body"]
+        assert body == {"productType": SPAPIClient.LISTING_PRODUCT_TYPE, "patches": patches}
@@ -0,0 +1,125 @@
+"""
+Tests for Token Cache Module
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from sp_api.api import Orders
+
+from src.api.advertising_client import AdvertisingClient
+from src.api.http_transport import PooledTransport
+from src.api.sp_api_client import CachedAccessTokenClient, SPAPIClient
+from src.api.token_cache import TokenCache, get_token_cache
+
+PROJECT_DIR = Path(__file__).parent.parent
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fetch():
+    counter = iter(range(1, 100))
+    return Mock(side_effect=lambda: {"access_token": f"tok-{next(counter)}", "expires_in": 3600})
+
+
+def make_cache(tmp_path, clock, **kwargs):
+    return TokenCache(cache_dir=str(tmp_path), clock=clock, background_refresh=False, **kwargs)
+
+
+class TestTokenCache:
+    """Test suite for TokenCache."""
+
+    def test_reuses_token_until_margin(self, tmp_path, clock, fetch):
+        """Tokens are reused until refresh_margin seconds before expiry."""
+        cache = make_cache(tmp_path, clock)
+        assert cache.get_token("k", fetch)["access_token"] == "tok-1"
+        clock.now += 3600 - 301
+        assert cache.get_token("k", fetch)["access_token"] == "tok-1"
+        clock.now += 2
+        assert cache.get_token("k", fetch)["access_token"] == "tok-2"
+        assert fetch.call_count == 2
+
+    def test_second_process_reads_token_from_disk(self, tmp_path, clock, fetch):
+        """A new cache on the same directory skips the token round-trip."""
+        make_cache(tmp_path, clock).get_token("k", fetch)
+        assert make_cache(tmp_path, clock).get_token("k", fetch)["access_token"] == "tok-1"
+        assert fetch.call_count == 1
+
+    def test_concurrent_callers_fetch_once(self, tmp_path, fetch):
+        """Threads racing on a cold cache trigger a single fetch."""
+        cache = TokenCache(cache_dir=str(tmp_path), background_refresh=False)
+        threads = [threading.Thread(target=cache.get_token, args=("k", fetch)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert fetch.call_count == 1
+
+    def test_background_refresh_runs_before_expiry(self, tmp_path, clock, fetch):
+        """The timer refresh replaces the token while it is still usable."""
+        cache = make_cache(tmp_path, clock)
+        cache.get_token("k", fetch)
+
+        clock.now += 3600 - 500
+        cache._refresh_in_background("k", fetch)
+
+        assert cache.get_token("k", fetch)["access_token"] == "tok-2"
+        assert fetch.call_count == 2
+
+    def test_refresh_token_not_written_to_disk(self, tmp_path, clock, fetch):
+        """Only hashed keys and the access token are persisted."""
+        key = TokenCache.make_key("client", "secret-refresh-token")
+        make_cache(tmp_path, clock).get_token(key, fetch)
+        contents = "".join(p.read_text() for p in tmp_path.iterdir())
+        assert "secret-refresh-token" not in contents
+
+    def test_default_dir_is_project_relative(self, tmp_path, monkeypatch):
+        """The default cache does not depend on the working directory."""
+        monkeypatch.delenv("TOKEN_CACHE_DIR")
+        monkeypatch.chdir(tmp_path)
+
+        cache = TokenCache()
+
+        assert Path(cache.cache_dir) == PROJECT_DIR / ".cache" / "tokens"
+
+
+class TestSharedTokens:
+    """Test token sharing between API clients."""
+
+    def test_ads_clients_share_token(self):
+        """A second client with the same credentials reuses the token."""
+        transport = Mock(spec=PooledTransport)
+        transport.post.return_value = Mock(
+            json=Mock(return_value={"access_token": "tok", "expires_in": 3600})
+        )
+        kwargs = dict(client_id="cid", client_secret="s", refresh_token="r", transport=transport)
+
+        assert AdvertisingClient(**kwargs)._get_access_token() == "tok"
+        assert AdvertisingClient(**kwargs)._get_access_token() == "tok"
+        transport.post.assert_called_once()
+
+    def test_sp_api_uses_shared_cache(self):
+        """SP-API instances authenticate through the shared cache."""
+        client = SPAPIClient(refresh_token="r", lwa_app_id="app", lwa_client_secret="s")
+        api = client._get_api_instance(Orders)
+        assert isinstance(api._auth, CachedAccessTokenClient)
+
+        api._auth._request = Mock(return_value={"access_token": "sp-tok", "expires_in": 3600})
+        assert api.auth.access_token == "sp-tok"
+        assert client._get_api_instance(Orders).auth.access_token == "sp-tok"
+        api._auth._request.assert_called_once()
+        assert get_token_cache().fetches == 1